@@ -14,12 +14,24 @@ Date: December 2024
 
 import re
 import json
+import sqlite3
 import time
+import threading
+import operator
+import bisect
 import difflib
+import heapq
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional, NamedTuple, Callable, TYPE_CHECKING
-from dataclasses import dataclass
+from typing import List, Tuple, Dict, Optional, NamedTuple, Callable, Iterable, Iterator, Sequence, TYPE_CHECKING
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 if TYPE_CHECKING:
     from ast_builder import ASTBuilderResult
@@ -37,9 +49,46 @@ DEFAULT_TRANSLATION = "KJV"  # Default translation (can be changed)
 # LSB, BSB, MEV, CSB17, CEB, NABRE, GNTD, ERV, ASV, GNT, ISV, and many more
 
 API_RATE_LIMIT_DELAY = 0.5  # Bolls.life is more permissive than bible-api.com
-
-# Cache file for Bible verses
-CACHE_FILE = Path(__file__).parent / "bible_verse_cache.json"
+MAX_RANGES_PER_REQUEST = 20  # Entries per get-verses POST
+MAX_CONCURRENT_REQUESTS = 4  # get-verses POSTs kept in flight at once
+API_CONNECT_TIMEOUT = 3  # Seconds to open a connection (read timeouts are per call)
+# Transient failures are retried with backoff inside the connection pool.
+# get-verses is a read-only POST, so it is safe to retry like the GETs.
+# Connection failures get one immediate retry only (a stale keep-alive socket
+# recovers on it; an unreachable host won't recover on the next two).
+API_RETRY = Retry(total=3, connect=1, backoff_factor=0.3,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset({'GET', 'POST'}),
+                  raise_on_status=False)
+
+# Minimum seconds between process_text progress callbacks
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Characters per write when saving a processed transcript
+OUTPUT_WRITE_CHUNK = 1 << 20
+
+# Reference strings accepted by BibleAPIClient.get_verse:
+# "Book Chapter:Verse", "Book Chapter:Start-End" or "Book Chapter"
+_API_REFERENCE_RE = re.compile(r'^(.+?)\s+(\d+)(?::(\d+)(?:-(\d+))?)?$')
+
+# Cache file for Bible verses (SQLite: verse text never changes, so fetched
+# entries are only ever added, never rewritten)
+CACHE_FILE = Path(__file__).parent / "bible_verse_cache.sqlite3"
+_CACHE_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS verses (
+        reference TEXT NOT NULL,
+        translation TEXT NOT NULL,
+        result TEXT NOT NULL,
+        PRIMARY KEY (reference, translation))""",
+    """CREATE TABLE IF NOT EXISTS verse_ranges (
+        translation TEXT NOT NULL,
+        book_id INTEGER NOT NULL,
+        chapter INTEGER NOT NULL,
+        start_verse INTEGER NOT NULL,
+        end_verse INTEGER NOT NULL,
+        verses TEXT NOT NULL,
+        PRIMARY KEY (translation, book_id, chapter, start_verse, end_verse))""",
+)
 
 # Fuzzy matching thresholds
 QUOTE_MATCH_THRESHOLD = 0.60  # Minimum similarity ratio to consider a match
@@ -58,6 +107,20 @@ INTERJECTION_PATTERNS = [
     r'\b(?:his|her|your|my|its|their|a|an|the|to|of|with)\s+what\?',
     r'\bwhat\?(?!\s+(?:shall|is|are|was|were|did|do|does|hath|have|had|should|would|could|can|will|may|might))',  # "what?" alone but not "what shall..."
 ]
+# All interjection patterns as one alternation, scanned in a single pass
+_INTERJECTION_RE = re.compile('|'.join(f'(?:{p})' for p in INTERJECTION_PATTERNS), re.IGNORECASE)
+
+# Tokenizer yielding exactly the tokens get_words() produces ("Let's" stays one
+# token). Each match ends on the token's last word character, so match offsets
+# can be used directly as quote boundaries.
+_TOKEN_RE = re.compile(r'\S*\w')
+
+# Plain word tokenizer used by the phrase/verse matchers
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Common Bible verse connector words that speakers often skip
+# These words at the start of verses are frequently omitted when quoting
+SKIP_WORDS = frozenset({'but', 'and', 'for', 'then', 'now', 'so', 'yet', 'or', 'therefore', 'wherefore', 'behold'})
 
 # Book name to Bolls.life book ID mapping (standard Protestant Bible order)
 BOOK_ID_MAP = {
@@ -224,6 +287,61 @@ WORD_TO_NUMBER = {
 # Pattern for spoken numbers
 SPOKEN_NUMBERS_PATTERN = '|'.join(sorted(WORD_TO_NUMBER.keys(), key=len, reverse=True))
 
+# Book name with optional ordinal prefix; every reference pattern starts with it
+BOOK_PATTERN = rf'(?:(?:first|second|third|1|2|3)\s+)?(?:{BOOK_NAMES_PATTERN})'
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex matching exactly the given words, as nested alternations of shared prefixes."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # Word ends here
+    
+    def emit(node: dict) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return emit(trie)
+
+
+# Zero-width match at each position where BOOK_PATTERN can match. Laid out as
+# a prefix trie, most positions fail on their first character instead of
+# trying every book name in turn.
+_BOOK_START_RE = re.compile(
+    r'(?=(?:(?:first|second|third|1|2|3)\s+)?(?:'
+    + _trie_pattern(sorted({name.lower() for name in BIBLE_BOOKS}))
+    + '))',
+    re.IGNORECASE
+)
+
+
+def _book_starts(text: str) -> List[int]:
+    """Positions in text where a book name (with optional ordinal) starts."""
+    return [m.start() for m in _BOOK_START_RE.finditer(text)]
+
+
+def _finditer_at(pattern: 're.Pattern[str]', text: str, starts: List[int]) -> Iterator['re.Match[str]']:
+    """
+    Same matches as pattern.finditer(text), for a pattern that begins with
+    BOOK_PATTERN: it can only match at a book start, so only those positions
+    (from _book_starts) are tried.
+    """
+    resume = 0
+    for start in starts:
+        if start < resume:
+            continue
+        match = pattern.match(text, start)
+        if match:
+            yield match
+            resume = match.end()
+
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -292,6 +410,12 @@ class QuoteBoundary:
 # BIBLE API CLIENT
 # ============================================================================
 
+@lru_cache(maxsize=1024)
+def _verse_numbers(start_verse: int, end_verse: int) -> Tuple[int, ...]:
+    """Verse numbers of a get-verses payload entry (serialized as a JSON list), shared per range."""
+    return tuple(range(start_verse, end_verse + 1))
+
+
 class BibleAPIClient:
     """Client for interacting with Bolls.life API with caching and rate limiting.
     
@@ -308,33 +432,108 @@ class BibleAPIClient:
         self.cache_file = cache_file
         self.cache: Dict[str, dict] = self._load_cache()
         self.last_request_time = 0
+        self._rate_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        # Verse texts of bulk-fetched ranges, keyed by
+        # (translation, book_id, chapter, start_verse, end_verse)
+        self._verse_range_cache: Dict[Tuple[str, int, int, int, int], Dict[int, str]] = self._load_range_cache()
         self.translation = translation
+        # Pooled keep-alive connections, so each lookup doesn't pay a new
+        # TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                                                   max_retries=API_RETRY))
+    
+    def _connect_cache(self) -> sqlite3.Connection:
+        """Open the cache file, creating its tables if needed."""
+        conn = sqlite3.connect(self.cache_file)
+        for statement in _CACHE_SCHEMA:
+            conn.execute(statement)
+        return conn
     
     def _load_cache(self) -> Dict[str, dict]:
         """Load cached verses from file."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
+        if not self.cache_file.exists():
+            return self._import_json_cache()
+        try:
+            with closing(self._connect_cache()) as conn:
+                rows = conn.execute('SELECT reference, translation, result FROM verses').fetchall()
+        except sqlite3.Error:
+            return {}
+        return {f"{reference}|{translation}": json.loads(result) for reference, translation, result in rows}
     
-    def _save_cache(self):
-        """Save cache to file."""
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(self.cache, f, indent=2, ensure_ascii=False)
+    def _import_json_cache(self) -> Dict[str, dict]:
+        """
+        Carry over verses from the JSON cache file used before the SQLite
+        one (same path, .json suffix), if there is one.
+        """
+        json_file = self.cache_file.with_suffix('.json')
+        if not json_file.exists():
+            return {}
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            with closing(self._connect_cache()) as conn, conn:
+                conn.executemany(
+                    'INSERT OR IGNORE INTO verses VALUES (?, ?, ?)',
+                    ((*key.rsplit('|', 1), json.dumps(result, ensure_ascii=False))
+                     for key, result in cache.items())
+                )
+        except (json.JSONDecodeError, IOError, sqlite3.Error):
+            return {}
+        return cache
+    
+    def _load_range_cache(self) -> Dict[Tuple[str, int, int, int, int], Dict[int, str]]:
+        """Load cached verse ranges from file."""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with closing(self._connect_cache()) as conn:
+                rows = conn.execute(
+                    'SELECT translation, book_id, chapter, start_verse, end_verse, verses FROM verse_ranges'
+                ).fetchall()
+        except sqlite3.Error:
+            return {}
+        # JSON object keys are strings; verse numbers are ints. Empty ranges
+        # (saved by older versions after a bad reply) are skipped so they get refetched.
+        ranges = {}
+        for row in rows:
+            verses = json.loads(row[5])
+            if verses:
+                ranges[tuple(row[:5])] = {int(num): text for num, text in verses.items()}
+        return ranges
+    
+    def _save_cache(self, reference: str, translation: str, result: dict):
+        """Add one fetched verse to the cache file."""
+        try:
+            with closing(self._connect_cache()) as conn, conn:
+                conn.execute('INSERT OR IGNORE INTO verses VALUES (?, ?, ?)',
+                             (reference, translation, json.dumps(result, ensure_ascii=False)))
+        except sqlite3.Error as e:
+            print(f"  ⚠ Could not save verse cache: {e}")
+    
+    def _save_range_cache(self, key: Tuple[str, int, int, int, int], verses: Dict[int, str]):
+        """Add one fetched verse range to the cache file."""
+        try:
+            with closing(self._connect_cache()) as conn, conn:
+                # REPLACE: overwrites an empty range left by an older version
+                conn.execute('INSERT OR REPLACE INTO verse_ranges VALUES (?, ?, ?, ?, ?, ?)',
+                             (*key, json.dumps(verses, ensure_ascii=False)))
+        except sqlite3.Error as e:
+            print(f"  ⚠ Could not save verse cache: {e}")
     
     def clear_cache(self):
         """Clear the in-memory cache (but keep the file for next session)."""
         self.cache = {}
+        self._verse_range_cache = {}
 
     def _rate_limit(self):
-        """Ensure we don't exceed API rate limits."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < API_RATE_LIMIT_DELAY:
-            time.sleep(API_RATE_LIMIT_DELAY - elapsed)
-        self.last_request_time = time.time()
+        """Ensure we don't exceed API rate limits (safe to call from threads)."""
+        with self._rate_lock:
+            elapsed = time.time() - self.last_request_time
+            if elapsed < API_RATE_LIMIT_DELAY:
+                time.sleep(API_RATE_LIMIT_DELAY - elapsed)
+            self.last_request_time = time.time()
     
     def _get_book_id(self, book_name: str) -> Optional[int]:
         """Get the Bolls.life book ID for a book name."""
@@ -360,8 +559,36 @@ class BibleAPIClient:
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
     
-    def _fetch_single_verse(self, book: str, chapter: int, verse: int) -> Optional[dict]:
+    def _single_verse_result(self, data: dict, book: str, chapter: int, translation: str) -> dict:
+        """get_verse() result for one verse's API data."""
+        # Clean HTML and return in standardized format
+        return {
+            'text': self._clean_html(data['text']),
+            'verse': data.get('verse'),
+            'book': book,
+            'chapter': chapter,
+            'translation': translation
+        }
+    
+    def _verse_range_result(self, verses: List[dict], book: str, chapter: int,
+                            start_verse: int, end_verse: int, translation: str) -> dict:
+        """get_verse() result for the API data of a verse range."""
+        # Combine verses into single text
+        combined_text = ' '.join(self._clean_html(v.get('text', '')) for v in verses if v.get('text'))
+        return {
+            'text': combined_text,
+            'verses': verses,
+            'book': book,
+            'chapter': chapter,
+            'verse_start': start_verse,
+            'verse_end': end_verse,
+            'translation': translation
+        }
+    
+    def _fetch_single_verse(self, book: str, chapter: int, verse: int,
+                            translation: Optional[str] = None) -> Optional[dict]:
         """Fetch a single verse from Bolls.life API."""
+        translation = translation or self.translation
         book_id = self._get_book_id(book)
         if not book_id:
             print(f"  ⚠ Unknown book: {book}")
@@ -370,20 +597,13 @@ class BibleAPIClient:
         self._rate_limit()
         
         try:
-            url = f"{BIBLE_API_BASE}/get-verse/{self.translation}/{book_id}/{chapter}/{verse}/"
-            response = requests.get(url, timeout=10)
+            url = f"{BIBLE_API_BASE}/get-verse/{translation}/{book_id}/{chapter}/{verse}/"
+            response = self.session.get(url, timeout=(API_CONNECT_TIMEOUT, 10))
             
             if response.status_code == 200:
                 data = response.json()
                 if data and 'text' in data:
-                    # Clean HTML and return in standardized format
-                    return {
-                        'text': self._clean_html(data['text']),
-                        'verse': data.get('verse'),
-                        'book': book,
-                        'chapter': chapter,
-                        'translation': self.translation
-                    }
+                    return self._single_verse_result(data, book, chapter, translation)
             else:
                 print(f"  ⚠ HTTP {response.status_code} for {book} {chapter}:{verse}")
         except requests.RequestException as e:
@@ -391,8 +611,10 @@ class BibleAPIClient:
         
         return None
     
-    def _fetch_chapter(self, book: str, chapter: int) -> Optional[List[dict]]:
+    def _fetch_chapter(self, book: str, chapter: int,
+                       translation: Optional[str] = None) -> Optional[List[dict]]:
         """Fetch an entire chapter from Bolls.life API."""
+        translation = translation or self.translation
         book_id = self._get_book_id(book)
         if not book_id:
             print(f"  ⚠ Unknown book: {book}")
@@ -401,8 +623,8 @@ class BibleAPIClient:
         self._rate_limit()
         
         try:
-            url = f"{BIBLE_API_BASE}/get-text/{self.translation}/{book_id}/{chapter}/"
-            response = requests.get(url, timeout=10)
+            url = f"{BIBLE_API_BASE}/get-text/{translation}/{book_id}/{chapter}/"
+            response = self.session.get(url, timeout=(API_CONNECT_TIMEOUT, 10))
             
             if response.status_code == 200:
                 data = response.json()
@@ -419,8 +641,10 @@ class BibleAPIClient:
         
         return None
     
-    def _fetch_verse_range(self, book: str, chapter: int, start_verse: int, end_verse: int) -> Optional[dict]:
+    def _fetch_verse_range(self, book: str, chapter: int, start_verse: int, end_verse: int,
+                           translation: Optional[str] = None) -> Optional[dict]:
         """Fetch a range of verses using the bulk API endpoint."""
+        translation = translation or self.translation
         book_id = self._get_book_id(book)
         if not book_id:
             print(f"  ⚠ Unknown book: {book}")
@@ -432,29 +656,18 @@ class BibleAPIClient:
             # Use POST endpoint for fetching specific verses
             url = f"{BIBLE_API_BASE}/get-verses/"
             payload = [{
-                'translation': self.translation,
+                'translation': translation,
                 'book': book_id,
                 'chapter': chapter,
-                'verses': list(range(start_verse, end_verse + 1))
+                'verses': _verse_numbers(start_verse, end_verse)
             }]
             
-            response = requests.post(url, json=payload, timeout=15)
+            response = self.session.post(url, json=payload, timeout=(API_CONNECT_TIMEOUT, 15))
             
             if response.status_code == 200:
                 data = response.json()
                 if data and len(data) > 0 and len(data[0]) > 0:
-                    # Combine verses into single text
-                    verses = data[0]
-                    combined_text = ' '.join(self._clean_html(v.get('text', '')) for v in verses if v.get('text'))
-                    return {
-                        'text': combined_text,
-                        'verses': verses,
-                        'book': book,
-                        'chapter': chapter,
-                        'verse_start': start_verse,
-                        'verse_end': end_verse,
-                        'translation': self.translation
-                    }
+                    return self._verse_range_result(data[0], book, chapter, start_verse, end_verse, translation)
             else:
                 print(f"  ⚠ HTTP {response.status_code} for {book} {chapter}:{start_verse}-{end_verse}")
         except requests.RequestException as e:
@@ -462,17 +675,20 @@ class BibleAPIClient:
         
         return None
     
-    def get_verse(self, reference: str) -> Optional[dict]:
+    def get_verse(self, reference: str, translation: Optional[str] = None) -> Optional[dict]:
         """
         Fetch verse text from API or cache.
         
         Args:
             reference: Bible reference in format "Book Chapter:Verse" or "Book Chapter:Start-End"
+            translation: Translation to fetch (defaults to self.translation). Passing it
+                instead of switching self.translation keeps concurrent lookups independent.
         
         Returns:
             API response dict with 'text' field, or None if not found
         """
-        cache_key = f"{reference}|{self.translation}"
+        translation = translation or self.translation
+        cache_key = f"{reference}|{translation}"
         
         # Check cache first
         if cache_key in self.cache:
@@ -480,7 +696,7 @@ class BibleAPIClient:
         
         # Parse the reference
         # Format: "Book Chapter:Verse" or "Book Chapter:Start-End" or "Book Chapter"
-        match = re.match(r'^(.+?)\s+(\d+)(?::(\d+)(?:-(\d+))?)?$', reference)
+        match = _API_REFERENCE_RE.match(reference)
         if not match:
             print(f"  ⚠ Could not parse reference: {reference}")
             return None
@@ -494,28 +710,110 @@ class BibleAPIClient:
         
         if verse_start is None:
             # Fetch entire chapter
-            chapter_data = self._fetch_chapter(book, chapter)
+            chapter_data = self._fetch_chapter(book, chapter, translation)
             if chapter_data:
                 combined_text = ' '.join(self._clean_html(v.get('text', '')) for v in chapter_data if v.get('text'))
                 result = {
                     'text': combined_text,
+                    # Per-verse texts, for get_chapter_verses
+                    'verses': [{'verse': v.get('verse'), 'text': v['text']}
+                               for v in chapter_data if v.get('text')],
                     'book': book,
                     'chapter': chapter,
-                    'translation': self.translation
+                    'translation': translation
                 }
         elif verse_end is None:
             # Single verse
-            result = self._fetch_single_verse(book, chapter, verse_start)
+            result = self._fetch_single_verse(book, chapter, verse_start, translation)
         else:
             # Verse range
-            result = self._fetch_verse_range(book, chapter, verse_start, verse_end)
+            result = self._fetch_verse_range(book, chapter, verse_start, verse_end, translation)
         
         if result:
-            self.cache[cache_key] = result
-            self._save_cache()
+            # Serialized so concurrent lookups don't dump the cache mid-update
+            with self._cache_lock:
+                self.cache[cache_key] = result
+                self._save_cache(reference, translation, result)
         
         return result
     
+    def get_chapter_verses(self, book: str, chapter: int,
+                           translation: Optional[str] = None) -> Dict[int, str]:
+        """
+        Fetch every verse of a chapter with a single request.
+        
+        The chapter is fetched and cached through get_verse, so repeat lookups
+        (and later runs, via the cache file) cost no request at all.
+        
+        Returns:
+            Dict mapping verse number to verse text (empty if the chapter
+            could not be fetched, or was cached before per-verse texts were kept)
+        """
+        result = self.get_verse(f"{book} {chapter}", translation)
+        if not result or 'verses' not in result:
+            return {}
+        return {v['verse']: v['text'] for v in result['verses']}
+    
+    def get_verse_translations(self, reference: str, translations: Sequence[str]) -> Dict[str, Optional[dict]]:
+        """
+        get_verse(reference, translation) for each of several translations.
+        
+        Translations not yet cached are fetched together with one get-verses
+        request, instead of one request per translation. If that request
+        fails, they are fetched one at a time through get_verse.
+        
+        Returns:
+            Dict mapping each translation to its get_verse result (None if not found)
+        """
+        results: Dict[str, Optional[dict]] = {}
+        missing = []
+        for translation in translations:
+            cached = self.cache.get(f"{reference}|{translation}")
+            if cached is not None:
+                results[translation] = cached
+            else:
+                missing.append(translation)
+        
+        match = _API_REFERENCE_RE.match(reference)
+        book_id = self._get_book_id(match.group(1)) if match else None
+        if missing and book_id and match.group(3):
+            book = match.group(1)
+            chapter = int(match.group(2))
+            verse_start = int(match.group(3))
+            verse_end = int(match.group(4)) if match.group(4) else None
+            payload = [{
+                'translation': translation,
+                'book': book_id,
+                'chapter': chapter,
+                'verses': _verse_numbers(verse_start, verse_end or verse_start)
+            } for translation in missing]
+            try:
+                data = _post_verse_ranges(self, payload)
+            except requests.RequestException:
+                data = None
+            if isinstance(data, list):
+                # A short or malformed reply only answers the entries it has;
+                # the rest fall through to get_verse below
+                for translation, verses in zip(missing, data):
+                    if not isinstance(verses, list) or not all(isinstance(v, dict) for v in verses):
+                        continue
+                    result = None
+                    if verses and verse_end is None:
+                        if 'text' in verses[0]:
+                            result = self._single_verse_result(verses[0], book, chapter, translation)
+                    elif verses:
+                        result = self._verse_range_result(verses, book, chapter, verse_start, verse_end, translation)
+                    results[translation] = result
+                    if result:
+                        with self._cache_lock:
+                            self.cache[f"{reference}|{translation}"] = result
+                            self._save_cache(reference, translation, result)
+                missing = [t for t in missing if t not in results]
+        
+        for translation in missing:
+            results[translation] = self.get_verse(reference, translation=translation)
+        return results
+    
     def verify_reference(self, book: str, chapter: int, verse: Optional[int] = None) -> bool:
         """
         Verify that a Bible reference exists.
@@ -544,16 +842,21 @@ class BibleAPIClient:
 
 def clear_bible_verse_cache():
     """
-    Clear the Bible verse cache file.
-    Should be called at the start of each new transcription to prevent
-    unbounded cache growth.
+    Delete the Bible verse cache file (and any pre-SQLite JSON cache).
+    
+    The cache is meant to persist across transcriptions; this is for
+    forcing every verse to be fetched again.
     """
-    if CACHE_FILE.exists():
-        try:
-            CACHE_FILE.unlink()
-            print("  🗑️  Cleared Bible verse cache")
-        except IOError as e:
-            print(f"  ⚠ Could not clear cache: {e}")
+    cleared = False
+    for cache_file in (CACHE_FILE, CACHE_FILE.with_suffix('.json')):  # .json: pre-SQLite cache
+        if cache_file.exists():
+            try:
+                cache_file.unlink()
+                cleared = True
+            except IOError as e:
+                print(f"  ⚠ Could not clear cache: {e}")
+    if cleared:
+        print("  🗑️  Cleared Bible verse cache")
 
 
 # ============================================================================
@@ -678,7 +981,6 @@ def detect_translation_from_transcript(transcript: str, api_client: BibleAPIClie
     
     # Score each translation by comparing verse text to transcript
     translation_scores = {t: 0.0 for t in TRANSLATIONS_TO_DETECT}
-    original_translation = api_client.translation
     
     for ref in temp_refs:
         if not ref.verse_start:
@@ -690,13 +992,9 @@ def detect_translation_from_transcript(transcript: str, api_client: BibleAPIClie
         search_area = transcript_lower[search_start:search_end]
         search_words = set(normalize_for_comparison(search_area).split())
         
+        results = api_client.get_verse_translations(ref_str, TRANSLATIONS_TO_DETECT)
         for translation in TRANSLATIONS_TO_DETECT:
-            api_client.translation = translation
-            
-            # Build cache key to avoid redundant fetches
-            cache_key = f"{translation}:{ref_str}"
-            
-            result = api_client.get_verse(ref_str)
+            result = results[translation]
             
             if result and 'text' in result:
                 verse_text = result['text']
@@ -708,9 +1006,6 @@ def detect_translation_from_transcript(transcript: str, api_client: BibleAPIClie
                     match_ratio = matches / len(verse_words)
                     translation_scores[translation] += match_ratio
     
-    # Restore original translation
-    api_client.translation = original_translation
-    
     # Find best translation
     if all(s == 0 for s in translation_scores.values()):
         if verbose:
@@ -733,7 +1028,8 @@ TRANSLATION_PRIORITY = ['KJV', 'NKJV', 'ESV', 'NIV', 'NASB', 'NLT', 'RSV', 'ASV'
 
 def detect_translation_for_quote(ref: 'BibleReference', transcript: str, 
                                   api_client: BibleAPIClient,
-                                  verbose: bool = False) -> Tuple[str, str, float]:
+                                  verbose: bool = False,
+                                  index: Optional['TranscriptIndex'] = None) -> Tuple[str, str, float]:
     """
     Detect the best-matching Bible translation for a specific quote.
     
@@ -746,6 +1042,7 @@ def detect_translation_for_quote(ref: 'BibleReference', transcript: str,
         transcript: Full transcript text
         api_client: BibleAPIClient instance
         verbose: Whether to print detection progress
+        index: TranscriptIndex of transcript, if the caller built one
     
     Returns:
         Tuple of (best_translation, verse_text, confidence_score)
@@ -757,26 +1054,26 @@ def detect_translation_for_quote(ref: 'BibleReference', transcript: str,
     # Use a smaller search area (500 chars) for better translation detection accuracy
     # This prevents matching common words from later in the transcript
     search_end = min(ref.position + 500, len(transcript))
-    search_area = transcript.lower()[search_start:search_end]
+    if index is not None and index.lower is not None:
+        # Lowercased once per sermon, not once per reference
+        search_area = index.lower[search_start:search_end]
+    else:
+        search_area = transcript.lower()[search_start:search_end]
     search_words = set(normalize_for_comparison(search_area).split())
     
-    # Store original translation to restore later
-    original_translation = api_client.translation
-    
     best_translation = TRANSLATION_PRIORITY[0] if TRANSLATION_PRIORITY else 'KJV'
     best_verse_text = ''
     best_score = -1.0
     all_scores = {}
     
-    # Fetch verse in each translation and score by word overlap
+    # Fetch verse in each translation (one request for all of them) and score by word overlap
+    results = api_client.get_verse_translations(ref_str, TRANSLATION_PRIORITY)
     for translation in TRANSLATION_PRIORITY:
-        api_client.translation = translation
-        
-        result = api_client.get_verse(ref_str)
+        result = results[translation]
         
         if result and 'text' in result:
             verse_text = result['text']
-            verse_words = get_words(verse_text)
+            verse_words = _verse_words(verse_text)
             
             if len(verse_words) >= 3:
                 # Count matching words
@@ -793,9 +1090,6 @@ def detect_translation_for_quote(ref: 'BibleReference', transcript: str,
                 if match_ratio >= 1.0:
                     break
     
-    # Restore original translation
-    api_client.translation = original_translation
-    
     if verbose and len(all_scores) > 1:
         scores_str = ', '.join(f'{t}:{s:.2f}' for t, s in sorted(all_scores.items(), key=lambda x: -x[1])[:3])
         print(f"      Translation scores: {scores_str}")
@@ -887,23 +1181,24 @@ def split_runtogether_number(num_str: str, api_client: BibleAPIClient, book: str
         # Second check: If transcript provided, verify verse text appears
         if transcript and ref_position >= 0:
             verse_text = result['text']
-            verse_words = get_words(verse_text)
+            # Use first 5 words as fingerprint (a verse needs at least 3)
+            fingerprint_words = get_words_limited(verse_text, 5)
             
-            if len(verse_words) >= 3:
+            if len(fingerprint_words) >= 3:
                 # Search in transcript near the reference
                 search_start = ref_position
                 search_end = min(ref_position + 1500, len(transcript))
                 search_area = transcript[search_start:search_end].lower()
                 
                 # Look for distinctive words from the verse
-                # Use first 5 words as fingerprint
-                fingerprint_words = verse_words[:min(5, len(verse_words))]
+                # Only the first 100 words of the search area are fuzzy-compared
+                search_head = search_area.split(None, 100)[:100]
                 
                 # Count how many fingerprint words appear in search area
                 matches = sum(1 for word in fingerprint_words 
                              if word in search_area or any(
-                                 difflib.SequenceMatcher(None, word, search_word).ratio() > 0.85
-                                 for search_word in search_area.split()[:100]
+                                 _word_ratio(word, search_word) > 0.85
+                                 for search_word in search_head
                              ))
                 
                 match_ratio = matches / len(fingerprint_words)
@@ -925,6 +1220,72 @@ def split_runtogether_number(num_str: str, api_client: BibleAPIClient, book: str
     
     return (best[0], best[1])
 
+
+# Comprehensive patterns to capture various formats, tried in order by
+# detect_bible_references (compiled once, not per call)
+# NOTE: Verbose patterns are COMMENTED OUT to preserve natural speech
+# The goal is to ONLY fix malformed punctuation, not replace verbose references
+_REFERENCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    # REMOVED: Verbose format with full verse range - this was too aggressive and removed entire sentences
+    # rf'(?P<book0>{BOOK_PATTERN})\s+(?:chapter\s+)?(?P<ch0>\d+)\.?\s+(?:And\s+)?(?:we\s+(?:are\s+)?(?:going\s+to\s+)?read\s+)?verses?\s+(?P<v0a>\d+)\s+(?:through|to|-)\s+(?P<v0b>\d+)',
+
+    # REMOVED: Verbose format with chapter keyword - preserves natural speech
+    # rf'(?P<book1>{BOOK_PATTERN})\s+chapter\s+(?P<ch1>\d+)(?:\s+(?:and\s+)?verse?s?\s+(?P<v1>\d+)(?:\s+(?:through|to|-)\s+(?P<v2>\d+))?)?',
+
+    # Spoken enumeration: "Book X, Y, and Z" (chapter, verse, verse)
+    # Negative lookahead prevents matching "and 2" when followed by numbered book names like "2 Peter"
+    # Also prevents matching when the final number is followed by ", digit" (indicating a cross-reference)
+    # e.g., "Matthew 5, 44 and 45" → Matthew 5:44-45 (matches)
+    # e.g., "Matthew 16, 24 and 6, 21" → does NOT match (6 is followed by ", 21")
+    rf'(?P<book2>{BOOK_PATTERN})\s+(?P<ch2>\d+),\s*(?P<v3>\d+),?\s*and\s+(?P<v4>\d+)(?!\s*(?:peter|samuel|kings|chronicles|corinthians|thessalonians|timothy|john)|,\s*\d)',
+
+    # Comma enumeration: "Book X, Y, Z" (chapter, verse1, verse2) - no "and" keyword
+    # e.g., "Romans 12, 1, 2" → Romans 12:1-2
+    rf'(?P<book2b>{BOOK_PATTERN})\s+(?P<ch2b>\d+),\s*(?P<v3b>\d+),\s*(?P<v4b>\d+)(?!\s*[,\d])',
+
+    # Colon + comma enumeration: "Book X:Y, Z" → verse range
+    # e.g., "Romans 12:1, 2" → Romans 12:1-2
+    # MUST come before standard colon pattern to catch the comma enumeration first
+    rf'(?P<book3b>{BOOK_PATTERN})\s+(?P<ch3b>\d+):(?P<v5b>\d+),\s*(?P<v6b>\d+)(?!\s*[,\d])',
+
+    # Standard with colon: "Book X:Y" or "Book X:Y-Z"
+    rf'(?P<book3>{BOOK_PATTERN})\s+(?P<ch3>\d+):(?P<v5>\d+)(?:-(?P<v6>\d+))?',
+
+    # Verbose chapter-only: "Book chapter X" - captures just the reference, not surrounding text
+    # This enables the post-processing to attach verse ranges mentioned later
+    # e.g., "Matthew chapter 2" + "verses 1 through 12" → Matthew 2:1-12
+    rf'(?P<book9>{BOOK_PATTERN})\s+chapter\s+(?P<ch9>\d+)(?!\s+(?:and\s+)?verse)',
+
+    # Hyphen format: "Book X-Y" (but not verse ranges which have colon)
+    rf'(?P<book4>{BOOK_PATTERN})\s+(?P<ch4>\d+)-(?P<v7>\d+)(?![\d-])',
+
+    # Period format: "Book X.Y"
+    rf'(?P<book5>{BOOK_PATTERN})\s+(?P<ch5>\d+)\.(?P<v8>\d+)',
+
+    # Comma format: "Book X, Y" (chapter, verse - not enumeration)
+    # Negative lookahead prevents matching enumeration patterns like "1, 2, 3"
+    # Changed from (?!\s*,?\s*and) to allow "Job 33, 4 and Genesis" while blocking "1, 2, 3"
+    rf'(?P<book6>{BOOK_PATTERN})\s+(?P<ch6>\d+),\s*(?P<v9>\d+)(?!\s*,\s*\d)',
+
+    # Spoken verse numbers: "Book X word" (e.g., "Romans 12 one" → "Romans 12:1")
+    # MUST come before run-together pattern to catch spoken numbers first
+    rf'(?P<book10>{BOOK_PATTERN})\s+(?P<ch10>\d+)\s+(?P<v_word>(?:{SPOKEN_NUMBERS_PATTERN}))(?=\s|$|[,\.])',
+
+    # Run-together or chapter-only: "Book XYZ" or "Book X"
+    # Allow comma after (e.g., "Matthew 633,") but not other separators that indicate format
+    rf'(?P<book7>{BOOK_PATTERN})\s+(?P<num>\d+)(?!\s*[:\-.]|\s+(?:chapter|verse|and|through|to))',
+
+    # "Book X and verse Y"
+    rf'(?P<book8>{BOOK_PATTERN})\s+(?P<ch8>\d+)\s+and\s+verse\s+(?P<v10>\d+)',
+])
+
+_VERSE_RANGE_RE = re.compile(r'verses?\s+(\d+)\s+(?:through|to)\s+(\d+)', re.IGNORECASE)
+_CROSS_REF_RE = re.compile(
+    r'\s+and\s+(\d{1,3}),?\s*(\d{1,3})(?!\s*(?:peter|samuel|kings|chronicles|corinthians|thessalonians|timothy|john))',
+    re.IGNORECASE
+)
+
+
 def detect_bible_references(text: str, api_client: BibleAPIClient, transcript_for_validation: Optional[str] = None) -> List[BibleReference]:
     """
     Detect all Bible references in text and normalize them.
@@ -953,70 +1314,11 @@ def detect_bible_references(text: str, api_client: BibleAPIClient, transcript_fo
     # Use transcript for validation if not provided separately
     validation_text = transcript_for_validation if transcript_for_validation else text
     
-    # Pattern for book names (including numbered books)
-    book_pattern = rf'(?:(?:first|second|third|1|2|3)\s+)?(?:{BOOK_NAMES_PATTERN})'
-    
-    # Comprehensive pattern to capture various formats
-    # NOTE: Verbose patterns are COMMENTED OUT to preserve natural speech
-    # The goal is to ONLY fix malformed punctuation, not replace verbose references
-    patterns = [
-        # REMOVED: Verbose format with full verse range - this was too aggressive and removed entire sentences
-        # rf'(?P<book0>{book_pattern})\s+(?:chapter\s+)?(?P<ch0>\d+)\.?\s+(?:And\s+)?(?:we\s+(?:are\s+)?(?:going\s+to\s+)?read\s+)?verses?\s+(?P<v0a>\d+)\s+(?:through|to|-)\s+(?P<v0b>\d+)',
-        
-        # REMOVED: Verbose format with chapter keyword - preserves natural speech
-        # rf'(?P<book1>{book_pattern})\s+chapter\s+(?P<ch1>\d+)(?:\s+(?:and\s+)?verse?s?\s+(?P<v1>\d+)(?:\s+(?:through|to|-)\s+(?P<v2>\d+))?)?',
-        
-        # Spoken enumeration: "Book X, Y, and Z" (chapter, verse, verse)
-        # Negative lookahead prevents matching "and 2" when followed by numbered book names like "2 Peter"
-        # Also prevents matching when the final number is followed by ", digit" (indicating a cross-reference)
-        # e.g., "Matthew 5, 44 and 45" → Matthew 5:44-45 (matches)
-        # e.g., "Matthew 16, 24 and 6, 21" → does NOT match (6 is followed by ", 21")
-        rf'(?P<book2>{book_pattern})\s+(?P<ch2>\d+),\s*(?P<v3>\d+),?\s*and\s+(?P<v4>\d+)(?!\s*(?:peter|samuel|kings|chronicles|corinthians|thessalonians|timothy|john)|,\s*\d)',
-        
-        # Comma enumeration: "Book X, Y, Z" (chapter, verse1, verse2) - no "and" keyword
-        # e.g., "Romans 12, 1, 2" → Romans 12:1-2
-        rf'(?P<book2b>{book_pattern})\s+(?P<ch2b>\d+),\s*(?P<v3b>\d+),\s*(?P<v4b>\d+)(?!\s*[,\d])',
-        
-        # Colon + comma enumeration: "Book X:Y, Z" → verse range
-        # e.g., "Romans 12:1, 2" → Romans 12:1-2
-        # MUST come before standard colon pattern to catch the comma enumeration first
-        rf'(?P<book3b>{book_pattern})\s+(?P<ch3b>\d+):(?P<v5b>\d+),\s*(?P<v6b>\d+)(?!\s*[,\d])',
-        
-        # Standard with colon: "Book X:Y" or "Book X:Y-Z"
-        rf'(?P<book3>{book_pattern})\s+(?P<ch3>\d+):(?P<v5>\d+)(?:-(?P<v6>\d+))?',
-        
-        # Verbose chapter-only: "Book chapter X" - captures just the reference, not surrounding text
-        # This enables the post-processing to attach verse ranges mentioned later
-        # e.g., "Matthew chapter 2" + "verses 1 through 12" → Matthew 2:1-12
-        rf'(?P<book9>{book_pattern})\s+chapter\s+(?P<ch9>\d+)(?!\s+(?:and\s+)?verse)',
-        
-        # Hyphen format: "Book X-Y" (but not verse ranges which have colon)
-        rf'(?P<book4>{book_pattern})\s+(?P<ch4>\d+)-(?P<v7>\d+)(?![\d-])',
-        
-        # Period format: "Book X.Y"
-        rf'(?P<book5>{book_pattern})\s+(?P<ch5>\d+)\.(?P<v8>\d+)',
-        
-        # Comma format: "Book X, Y" (chapter, verse - not enumeration)
-        # Negative lookahead prevents matching enumeration patterns like "1, 2, 3"
-        # Changed from (?!\s*,?\s*and) to allow "Job 33, 4 and Genesis" while blocking "1, 2, 3"
-        rf'(?P<book6>{book_pattern})\s+(?P<ch6>\d+),\s*(?P<v9>\d+)(?!\s*,\s*\d)',
-        
-        # Spoken verse numbers: "Book X word" (e.g., "Romans 12 one" → "Romans 12:1")
-        # MUST come before run-together pattern to catch spoken numbers first
-        rf'(?P<book10>{book_pattern})\s+(?P<ch10>\d+)\s+(?P<v_word>(?:{SPOKEN_NUMBERS_PATTERN}))(?=\s|$|[,\.])',
-        
-        # Run-together or chapter-only: "Book XYZ" or "Book X"
-        # Allow comma after (e.g., "Matthew 633,") but not other separators that indicate format
-        rf'(?P<book7>{book_pattern})\s+(?P<num>\d+)(?!\s*[:\-.]|\s+(?:chapter|verse|and|through|to))',
-        
-        # "Book X and verse Y"
-        rf'(?P<book8>{book_pattern})\s+(?P<ch8>\d+)\s+and\s+verse\s+(?P<v10>\d+)',
-    ]
-    
+    book_starts = _book_starts(text)
     seen_positions = set()  # Avoid duplicate matches
     
-    for pattern in patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+    for pattern in _REFERENCE_PATTERNS:
+        for match in _finditer_at(pattern, text, book_starts):
             start_pos = match.start()
             
             # Skip if we already found a reference at this position
@@ -1137,8 +1439,7 @@ def detect_bible_references(text: str, api_client: BibleAPIClient, transcript_fo
                 seen_positions.add(start_pos)
     
     # Post-processing: Look for standalone "verses X through Y" after book references
-    verse_range_pattern = r'verses?\s+(\d+)\s+(?:through|to)\s+(\d+)'
-    for match in re.finditer(verse_range_pattern, text, re.IGNORECASE):
+    for match in _VERSE_RANGE_RE.finditer(text):
         # Find the nearest preceding reference without verses
         match_pos = match.start()
         for ref in references:
@@ -1153,9 +1454,7 @@ def detect_bible_references(text: str, api_client: BibleAPIClient, transcript_fo
     # Post-processing: Look for cross-references like "and X, Y" or "and X:Y" after a full reference
     # These inherit the book name from the preceding reference
     # e.g., "Matthew 16, 24 and 6, 21" → Matthew 16:24 + Matthew 6:21
-    cross_ref_pattern = r'\s+and\s+(\d{1,3}),?\s*(\d{1,3})(?!\s*(?:peter|samuel|kings|chronicles|corinthians|thessalonians|timothy|john))'
-    
-    for match in re.finditer(cross_ref_pattern, text, re.IGNORECASE):
+    for match in _CROSS_REF_RE.finditer(text):
         match_pos = match.start()
         
         # Check if this "and X, Y" is already part of an existing reference's original_text
@@ -1316,6 +1615,34 @@ def _is_verbose_reference(text_around: str) -> bool:
     return any(word in lower for word in ('chapter', 'verses', 'verse', 'through'))
 
 
+# Rule patterns for normalize_bible_references_in_segment (compiled once, not per call)
+_ENUM_AND_RE = re.compile(
+    rf'(?P<book>{BOOK_PATTERN})\s+(?P<ch>\d+),\s*(?P<v1>\d+),?\s*and\s+(?P<v2>\d+)'
+    rf'(?!\s*(?:peter|samuel|kings|chronicles|corinthians|thessalonians|timothy|john))',
+    re.IGNORECASE
+)
+_COMMA_SEPARATOR_RE = re.compile(
+    rf'(?P<book>{BOOK_PATTERN})\s+(?P<ch>\d+),\s*(?P<v>\d+)(?!\s*,\s*\d)',
+    re.IGNORECASE
+)
+_PERIOD_SEPARATOR_RE = re.compile(
+    rf'(?P<book>{BOOK_PATTERN})\s+(?P<ch>\d+)\.(?P<v>\d+)',
+    re.IGNORECASE
+)
+_HYPHEN_SEPARATOR_RE = re.compile(
+    rf'(?P<book>{BOOK_PATTERN})\s+(?P<ch>\d+)-(?P<v>\d+)(?![\d-])',
+    re.IGNORECASE
+)
+_SPOKEN_VERSE_RE = re.compile(
+    rf'(?P<book>{BOOK_PATTERN})\s+(?P<ch>\d+)\s+(?P<word>(?:{SPOKEN_NUMBERS_PATTERN}))(?=\s|$|[,\.])',
+    re.IGNORECASE
+)
+_RUNTOGETHER_RE = re.compile(
+    rf'(?P<book>{BOOK_PATTERN})\s+(?P<num>\d{{3,}})(?!\s*[:\-.]|\s+(?:chapter|verse|and\s+\d|through\s+\d|to\s+\d))',
+    re.IGNORECASE
+)
+
+
 def normalize_bible_references_in_segment(
     text: str,
     api_client: Optional[BibleAPIClient] = None,
@@ -1349,7 +1676,7 @@ def normalize_bible_references_in_segment(
     # Track consumed character spans to prevent overlapping matches
     consumed: List[Tuple[int, int]] = []
 
-    book_pattern = rf'(?:(?:first|second|third|1|2|3)\s+)?(?:{BOOK_NAMES_PATTERN})'
+    book_starts = _book_starts(text)
 
     def _is_consumed(start: int, end: int) -> bool:
         """Check if a span overlaps any already-consumed span."""
@@ -1376,12 +1703,7 @@ def normalize_bible_references_in_segment(
     # "Romans 1, 21 and 22" → "Romans 1:21-22"
     # Must come before comma rule to match longer patterns first.
     # ------------------------------------------------------------------
-    enum_and_pat = re.compile(
-        rf'(?P<book>{book_pattern})\s+(?P<ch>\d+),\s*(?P<v1>\d+),?\s*and\s+(?P<v2>\d+)'
-        rf'(?!\s*(?:peter|samuel|kings|chronicles|corinthians|thessalonians|timothy|john))',
-        re.IGNORECASE
-    )
-    for m in enum_and_pat.finditer(text):
+    for m in _finditer_at(_ENUM_AND_RE, text, book_starts):
         if _is_consumed(m.start(), m.end()):
             continue
         book_raw = m.group('book')
@@ -1411,11 +1733,7 @@ def normalize_bible_references_in_segment(
     # "Revelation 19, 16" → "Revelation 19:16"
     # Negative lookahead: not followed by another comma+digit (enumeration).
     # ------------------------------------------------------------------
-    comma_pat = re.compile(
-        rf'(?P<book>{book_pattern})\s+(?P<ch>\d+),\s*(?P<v>\d+)(?!\s*,\s*\d)',
-        re.IGNORECASE
-    )
-    for m in comma_pat.finditer(text):
+    for m in _finditer_at(_COMMA_SEPARATOR_RE, text, book_starts):
         if _is_consumed(m.start(), m.end()):
             continue
         book_raw = m.group('book')
@@ -1443,11 +1761,7 @@ def normalize_bible_references_in_segment(
     # "Romans 12.1" → "Romans 12:1"
     # Must NOT match sentence-ending periods.
     # ------------------------------------------------------------------
-    period_pat = re.compile(
-        rf'(?P<book>{book_pattern})\s+(?P<ch>\d+)\.(?P<v>\d+)',
-        re.IGNORECASE
-    )
-    for m in period_pat.finditer(text):
+    for m in _finditer_at(_PERIOD_SEPARATOR_RE, text, book_starts):
         if _is_consumed(m.start(), m.end()):
             continue
         book_raw = m.group('book')
@@ -1470,11 +1784,7 @@ def normalize_bible_references_in_segment(
     # "Galatians 1-6" → "Galatians 1:6"
     # Must NOT normalize actual chapter ranges like "Genesis 1-3".
     # ------------------------------------------------------------------
-    hyphen_pat = re.compile(
-        rf'(?P<book>{book_pattern})\s+(?P<ch>\d+)-(?P<v>\d+)(?![\d-])',
-        re.IGNORECASE
-    )
-    for m in hyphen_pat.finditer(text):
+    for m in _finditer_at(_HYPHEN_SEPARATOR_RE, text, book_starts):
         if _is_consumed(m.start(), m.end()):
             continue
         book_raw = m.group('book')
@@ -1510,11 +1820,7 @@ def normalize_bible_references_in_segment(
     # Rule 5: Spoken verse numbers
     # "Romans 12 one" → "Romans 12:1"
     # ------------------------------------------------------------------
-    spoken_pat = re.compile(
-        rf'(?P<book>{book_pattern})\s+(?P<ch>\d+)\s+(?P<word>(?:{SPOKEN_NUMBERS_PATTERN}))(?=\s|$|[,\.])',
-        re.IGNORECASE
-    )
-    for m in spoken_pat.finditer(text):
+    for m in _finditer_at(_SPOKEN_VERSE_RE, text, book_starts):
         if _is_consumed(m.start(), m.end()):
             continue
         book_raw = m.group('book')
@@ -1544,11 +1850,7 @@ def normalize_bible_references_in_segment(
     # Must not match chapter-only references (1-2 digits).
     # Must not match references already handled by a colon or other separator.
     # ------------------------------------------------------------------
-    runtogether_pat = re.compile(
-        rf'(?P<book>{book_pattern})\s+(?P<num>\d{{3,}})(?!\s*[:\-.]|\s+(?:chapter|verse|and\s+\d|through\s+\d|to\s+\d))',
-        re.IGNORECASE
-    )
-    for m in runtogether_pat.finditer(text):
+    for m in _finditer_at(_RUNTOGETHER_RE, text, book_starts):
         if _is_consumed(m.start(), m.end()):
             continue
         book_raw = m.group('book')
@@ -1639,28 +1941,211 @@ def clean_text_for_matching(text: str) -> str:
     text = text.replace('\n', ' ')
     return text.strip()
 
+# Punctuation stripper and spelling variants used by normalize_for_comparison()
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_SPELLING_VARIANTS = (
+    ('counsellor', 'counselor'),
+    ('colour', 'color'),
+    ('favour', 'favor'),
+    ('honour', 'honor'),
+    ('saviour', 'savior'),
+    ('behaviour', 'behavior'),
+)
+
+
+def _fold_text(text: str) -> str:
+    """
+    Lowercase, strip punctuation and normalize spelling in one pass over the
+    text. Whitespace is left as-is for the caller to split or collapse.
+    """
+    text = _NON_WORD_RE.sub('', text.lower())
+    if 'ou' in text:  # Every variant above contains "ou"
+        for variant, canonical in _SPELLING_VARIANTS:
+            text = text.replace(variant, canonical)
+    return text
+
 def normalize_for_comparison(text: str) -> str:
     """
     Aggressively normalize text for comparison by removing punctuation and normalizing spelling.
     """
-    text = text.lower()
-    # Remove all punctuation
-    text = re.sub(r'[^\w\s]', '', text)
-    # Normalize common spelling variations
-    text = text.replace('counsellor', 'counselor')
-    text = text.replace('colour', 'color')
-    text = text.replace('favour', 'favor')
-    text = text.replace('honour', 'honor')
-    text = text.replace('saviour', 'savior')
-    text = text.replace('behaviour', 'behavior')
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    # split()/join collapses and trims whitespace exactly like re.sub(r'\s+', ' ') + strip()
+    return ' '.join(_fold_text(text).split())
+
+@lru_cache(maxsize=100_000)
+def _normalize_word(word: str) -> str:
+    """
+    normalize_for_comparison() of a single transcript token, cached: sermon
+    vocabulary is small and the same words are normalized in every window.
+    """
+    return normalize_for_comparison(word)
 
 def get_words(text: str) -> List[str]:
     """Extract words from text, normalized for comparison."""
-    normalized = normalize_for_comparison(text)
-    return normalized.split()
+    return _fold_text(text).split()
+
+@lru_cache(maxsize=65536)
+def _word_ratio(word1: str, word2: str) -> float:
+    """
+    difflib similarity ratio of two words, cached: the fuzzy matchers compare
+    the same verse words against the same transcript vocabulary over and over.
+    """
+    return difflib.SequenceMatcher(None, word1, word2).ratio()
+
+def get_words_limited(text: str, n: int) -> List[str]:
+    """Same as get_words(text)[:n], but stops tokenizing after n words."""
+    return [_fold_text(m.group()) for m in islice(_TOKEN_RE.finditer(text), n)]
+
+@lru_cache(maxsize=4096)
+def _verse_words(verse_text: str) -> Tuple[str, ...]:
+    """
+    get_words() for Bible verse text, cached: the same verse is validated
+    once per reference and matched again in each pipeline phase.
+    Returned as a tuple so the cached value can't be mutated.
+    """
+    return tuple(get_words(verse_text))
+
+@lru_cache(maxsize=1024)
+def _verse_index(verse_text: str) -> Tuple[Tuple[str, ...], frozenset, Dict[str, Tuple[int, ...]]]:
+    """
+    (words, word set, word -> positions in words) for Bible verse text,
+    cached like _verse_words(). The positions dict is shared between callers
+    and must not be modified.
+    """
+    words = _verse_words(verse_text)
+    positions: Dict[str, List[int]] = {}
+    for j, w in enumerate(words):
+        positions.setdefault(w, []).append(j)
+    return words, frozenset(words), {w: tuple(js) for w, js in positions.items()}
+
+def _first_n_words(text: str, start: int, end: int, n: int) -> List[str]:
+    """
+    Same as get_words(text[start:end])[:n], but stops tokenizing after n words
+    and never copies the text[start:end] slice.
+    """
+    return [_fold_text(m.group()) for m in islice(_TOKEN_RE.finditer(text, start, end), n)]
+
+@lru_cache(maxsize=4096)
+def _verse_opening(verse_text: str, n: int = 5) -> str:
+    """
+    Lowercased raw verse text spanning its first n words. Transcript text that
+    repeats it verbatim (up to case) tokenizes to the same first n words.
+    """
+    tokens = list(islice(_TOKEN_RE.finditer(verse_text), n))
+    if not tokens:
+        return ''
+    return verse_text[tokens[0].start():tokens[-1].end()].lower()
+
+@dataclass
+class TranscriptIndex:
+    """
+    Word tokens of a transcript, built once per sermon and shared by the
+    find_* matchers so each verse lookup doesn't re-tokenize the transcript.
+    
+    Tokens follow the r'\b\w+\b' tokenization the matchers use. span()
+    reproduces exactly what tokenizing transcript[start:end] on its own
+    would give, including words cut by the slice edges.
+    
+    lower is text.lower() for case-insensitive prefix checks at transcript
+    offsets, or None when lowercasing would shift offsets (a few non-ASCII
+    characters lowercase to two code points).
+    """
+    text: str
+    words: List[str]
+    norm: List[str]  # normalize_for_comparison() of each word
+    starts: List[int]
+    ends: List[int]
+    lower: Optional[str] = None
+    
+    @classmethod
+    def build(cls, text: str) -> 'TranscriptIndex':
+        """Tokenize and normalize the whole transcript once."""
+        words, starts, ends = [], [], []
+        for m in _WORD_RE.finditer(text):
+            words.append(m.group())
+            starts.append(m.start())
+            ends.append(m.end())
+        lower = text.lower()
+        return cls(text, words, [_normalize_word(w) for w in words], starts, ends,
+                   lower if len(lower) == len(text) else None)
+    
+    def span(self, start: int, end: int) -> Tuple[List[int], List[int], List[str]]:
+        """
+        Get (starts, ends, normalized_words) for the tokens of text[start:end].
+        
+        Offsets are absolute positions in the transcript.
+        """
+        end = min(end, len(self.text))
+        if start >= end:
+            return [], [], []
+        lo = bisect.bisect_right(self.ends, start)  # First token ending after start
+        hi = bisect.bisect_left(self.starts, end)   # Tokens starting before end
+        starts = self.starts[lo:hi]
+        ends = self.ends[lo:hi]
+        norm = self.norm[lo:hi]
+        if starts and (starts[0] < start or ends[-1] > end):
+            starts, ends, norm = list(starts), list(ends), list(norm)
+            if ends[-1] > end:
+                ends[-1] = end
+                norm[-1] = _normalize_word(self.text[starts[-1]:end])
+            if starts[0] < start:
+                starts[0] = start
+                norm[0] = _normalize_word(self.text[start:ends[0]])
+        return starts, ends, norm
+
+# Rolling hash parameters for exact word-window search
+_HASH_BASE = 1_000_003
+_HASH_MOD = (1 << 61) - 1
+
+
+def _find_exact_window(ids: List[int], pattern_ids: List[int], start: int, stop: int) -> Optional[int]:
+    """
+    Find the first index i in [start, stop - len(pattern_ids)] where
+    ids[i:i + len(pattern_ids)] equals pattern_ids.
+    
+    Uses a polynomial rolling hash over word ids, so each shift costs O(1)
+    instead of len(pattern_ids) comparisons. Hash hits are verified.
+    """
+    k = len(pattern_ids)
+    if k == 0 or stop - start < k or -1 in pattern_ids:
+        return None  # -1 marks a pattern word that never occurs in the transcript
+    
+    pattern_hash = 0
+    window_hash = 0
+    for j in range(k):
+        pattern_hash = (pattern_hash * _HASH_BASE + pattern_ids[j]) % _HASH_MOD
+        window_hash = (window_hash * _HASH_BASE + ids[start + j]) % _HASH_MOD
+    top_power = pow(_HASH_BASE, k - 1, _HASH_MOD)
+    
+    i = start
+    while True:
+        if window_hash == pattern_hash and ids[i:i + k] == pattern_ids:
+            return i
+        if i + k >= stop:
+            return None
+        window_hash = ((window_hash - ids[i] * top_power) * _HASH_BASE + ids[i + k]) % _HASH_MOD
+        i += 1
+
+
+def _best_anchor(ids: List[int], pattern_ids: List[int], start: int, stop: int,
+                 min_ratio: float = 0.5) -> Tuple[Optional[int], float]:
+    """
+    Slide pattern_ids over ids[start:stop] and return (best_index, best_score)
+    where score is the fraction of positions whose word ids are equal.
+    
+    The first window with the highest score wins; windows scoring below
+    min_ratio are ignored. Returns (None, 0) when nothing qualifies. The
+    per-window count runs as map(operator.eq) over integer ids so the inner
+    loop stays in C.
+    """
+    k = len(pattern_ids)
+    best_idx, best_matches = None, 0
+    for i in range(start, stop - k + 1):
+        matches = sum(map(operator.eq, pattern_ids, ids[i:i + k]))
+        if matches > best_matches and matches / k >= min_ratio:
+            best_matches, best_idx = matches, i
+            if matches == k:
+                break  # Nothing can beat a full match that came first
+    return best_idx, (best_matches / k if best_idx is not None else 0)
 
 def find_quote_in_text(verse_text: str, transcript: str, search_start: int = 0) -> Optional[Tuple[int, int, float]]:
     """
@@ -1688,43 +2173,40 @@ def find_quote_in_text(verse_text: str, transcript: str, search_start: int = 0)
     anchor_size = min(6, len(verse_words))
     anchor_words = verse_words[:anchor_size]
     
-    # Search for anchor in transcript using word-level matching
-    best_start_idx = None
-    best_start_score = 0
+    # Normalize every transcript word once and map words to integer ids so
+    # that anchor windows can be compared by rolling hash / id equality
+    word_ids: Dict[str, int] = {}
+    transcript_ids = [word_ids.setdefault(_normalize_word(w), len(word_ids))
+                      for w in transcript_words]
+    anchor_ids = [word_ids.get(w, -1) for w in anchor_words]
     
-    for i in range(len(transcript_words) - anchor_size + 1):
-        window = transcript_words[i:i + anchor_size]
-        # Count matching words
-        matches = sum(1 for v, t in zip(anchor_words, [normalize_for_comparison(w) for w in window]) if v == t)
-        score = matches / anchor_size
-        
-        if score > best_start_score and score >= 0.5:  # At least 50% word match
-            best_start_score = score
-            best_start_idx = i
+    # Search for anchor in transcript using word-level matching. The first
+    # exact occurrence always wins (later windows need a strictly higher
+    # score), so it is taken directly; the per-window count is only needed
+    # when the anchor never appears verbatim.
+    best_start_idx = _find_exact_window(transcript_ids, anchor_ids, 0, len(transcript_words))
+    best_start_score = 1.0 if best_start_idx is not None else 0
+    
+    if best_start_idx is None:
+        # At least 50% word match
+        best_start_idx, best_start_score = _best_anchor(
+            transcript_ids, anchor_ids, 0, len(transcript_words), min_ratio=0.5)
     
     if best_start_idx is None:
         return None
     
     # Now find where the verse ends by matching end words
     end_anchor_size = min(6, len(verse_words))
-    end_anchor_words = verse_words[-end_anchor_size:]
+    end_anchor_ids = [word_ids.get(w, -1) for w in verse_words[-end_anchor_size:]]
     
     # Search from anchor position to end of reasonable range
     search_end = min(best_start_idx + len(verse_words) + 30, len(transcript_words))
     
-    best_end_idx = None
-    best_end_score = 0
-    
-    for i in range(best_start_idx + len(verse_words) - end_anchor_size - 10, search_end - end_anchor_size + 1):
-        if i < best_start_idx:
-            continue
-        window = transcript_words[i:i + end_anchor_size]
-        matches = sum(1 for v, t in zip(end_anchor_words, [normalize_for_comparison(w) for w in window]) if v == t)
-        score = matches / end_anchor_size
-        
-        if score > best_end_score and score >= 0.5:
-            best_end_score = score
-            best_end_idx = i + end_anchor_size
+    end_search_from = max(best_start_idx, best_start_idx + len(verse_words) - end_anchor_size - 10)
+    best_end_idx, best_end_score = _best_anchor(
+        transcript_ids, end_anchor_ids, end_search_from, search_end, min_ratio=0.5)
+    if best_end_idx is not None:
+        best_end_idx += end_anchor_size
     
     if best_end_idx is None:
         # Estimate end based on verse length
@@ -1753,103 +2235,300 @@ def find_quote_in_text(verse_text: str, transcript: str, search_start: int = 0)
     
     return (actual_start, actual_end, confidence)
 
-def find_distinctive_phrases(verse_text: str, min_length: int = 4) -> List[List[str]]:
+@lru_cache(maxsize=4096)
+def find_distinctive_phrases(verse_text: str, min_length: int = 4) -> Tuple[Tuple[str, ...], ...]:
     """
     Extract distinctive phrases from verse text that can be used for matching.
     
+    Results are cached per verse text (a verse is usually looked up several
+    times per sermon), so the returned tuple must be treated as read-only.
+    
     Args:
         verse_text: The Bible verse text
         min_length: Minimum number of words for a phrase
     
     Returns:
-        List of word lists representing distinctive phrases
+        Tuple of word tuples representing distinctive phrases
     """
     words = get_words(verse_text)
-    phrases = []
-    
-    # Common Bible verse connector words that speakers often skip
-    # These words at the start of verses are frequently omitted when quoting
-    SKIP_WORDS = {'but', 'and', 'for', 'then', 'now', 'so', 'yet', 'or', 'therefore', 'wherefore', 'behold'}
+    phrases: List[Tuple[str, ...]] = []
     
     # Take overlapping windows of words
     window_size = min(8, len(words))
     for i in range(0, len(words) - window_size + 1, 3):
-        phrases.append(words[i:i + window_size])
+        phrases.append(tuple(words[i:i + window_size]))
+    
+    # Phrases emitted so far, for O(1) membership checks
+    seen = set(phrases)
     
     # Always include first and last phrases
-    if words[:min_length] not in phrases:
-        phrases.insert(0, words[:min(8, len(words))])
-    if words[-min_length:] not in phrases:
-        phrases.append(words[-min(8, len(words)):])
+    if tuple(words[:min_length]) not in seen:
+        first_phrase = tuple(words[:min(8, len(words))])
+        phrases.insert(0, first_phrase)
+        seen.add(first_phrase)
+    if tuple(words[-min_length:]) not in seen:
+        last_phrase = tuple(words[-min(8, len(words)):])
+        phrases.append(last_phrase)
+        seen.add(last_phrase)
     
     # IMPORTANT: Also add phrases that skip the first 1-2 words if they're connector words
     # This handles cases where the speaker skips "But" or "And" at the start of a verse
     # e.g., "But seek ye first..." becomes "seek ye first..." in the transcript
     if len(words) >= window_size and words[0] in SKIP_WORDS:
         # Add phrase starting from word 1 (skipping first connector word)
-        skip_1_phrase = words[1:1 + window_size]
-        if skip_1_phrase not in phrases:
+        skip_1_phrase = tuple(words[1:1 + window_size])
+        if skip_1_phrase not in seen:
             phrases.insert(1, skip_1_phrase)
+            seen.add(skip_1_phrase)
         
         # If second word is also a connector, add phrase starting from word 2
         if len(words) > window_size + 1 and words[1] in SKIP_WORDS:
-            skip_2_phrase = words[2:2 + window_size]
-            if skip_2_phrase not in phrases:
+            skip_2_phrase = tuple(words[2:2 + window_size])
+            if skip_2_phrase not in seen:
                 phrases.insert(2, skip_2_phrase)
     
-    return phrases
+    return tuple(phrases)
+
+# Words per batched character-bag bound in _WordPostings.prime_similar
+# (bounds memory to batch x vocabulary x alphabet counts)
+_SIMILAR_BATCH = 32
+
+
+def _code_points(words: List[str]) -> np.ndarray:
+    """Code points of the concatenated words, one per character."""
+    return np.frombuffer(''.join(words).encode('utf-32-le'), dtype=np.uint32)
+
+
+@dataclass
+class _WordPostings:
+    """
+    Normalized words encoded as integer ids, with a positional inverted index
+    (id -> word indices) so anchor windows can be scored from postings and
+    compared by id instead of string.
+    """
+    ids: List[int]              # Word id at each position
+    words: List[str]            # id -> word
+    vocab: Dict[str, int]       # word -> id
+    positions: List[List[int]]  # id -> indices where the word occurs
+    long_ids: List[int]         # ids of words longer than 3 letters (fuzzy candidates)
+    _similar: Dict[str, List[int]] = field(default_factory=dict, repr=False)
+    _chars: Optional[np.ndarray] = field(default=None, repr=False)      # Sorted code points of long words
+    _long_bags: Optional[np.ndarray] = field(default=None, repr=False)  # long word x char counts
+    _long_lens: Optional[np.ndarray] = field(default=None, repr=False)  # long word lengths
+    
+    @classmethod
+    def build(cls, words: List[str]) -> '_WordPostings':
+        """Assign ids in order of first occurrence and collect postings."""
+        vocab: Dict[str, int] = {}
+        ids = [vocab.setdefault(w, len(vocab)) for w in words]
+        positions: List[List[int]] = [[] for _ in vocab]
+        for i, word_id in enumerate(ids):
+            positions[word_id].append(i)
+        vocab_words = list(vocab)
+        long_ids = [word_id for word_id, w in enumerate(vocab_words) if len(w) > 3]
+        return cls(ids, vocab_words, vocab, positions, long_ids)
+    
+    def similar_ids(self, word: str) -> List[int]:
+        """
+        ids of the other words longer than 3 letters whose difflib ratio with
+        word is > 0.8 (none if word itself is 3 letters or shorter). Memoized,
+        as overlapping phrases and anchors repeat the same words.
+        """
+        similar = self._similar.get(word)
+        if similar is None:
+            self.prime_similar((word,))
+            similar = self._similar[word]
+        return similar
+    
+    def prime_similar(self, words: Iterable[str]) -> None:
+        """
+        Fill the similar_ids memo for many words at once.
+        
+        A word can only reach a difflib ratio > 0.8 with the vocabulary words
+        whose character-bag bound (SequenceMatcher.quick_ratio) exceeds 0.8.
+        The bounds of all new words against the whole vocabulary come from a
+        few batched numpy operations; SequenceMatcher only runs on the words
+        that pass.
+        """
+        pending = [w for w in dict.fromkeys(words) if w not in self._similar]
+        long_pending = [w for w in pending if len(w) > 3]
+        for w in pending:
+            self._similar[w] = []
+        if not long_pending or not self.long_ids:
+            return
+        
+        if self._long_bags is None:
+            long_words = [self.words[word_id] for word_id in self.long_ids]
+            self._chars = np.unique(_code_points(long_words))
+            self._long_bags = self._char_bags(long_words)
+            self._long_lens = np.array([len(w) for w in long_words])
+        
+        query_bags = self._char_bags(long_pending)
+        query_lens = np.array([len(w) for w in long_pending])
+        for start in range(0, len(long_pending), _SIMILAR_BATCH):
+            stop = start + _SIMILAR_BATCH
+            shared = np.minimum(self._long_bags[None, :, :], query_bags[start:stop, None, :]).sum(axis=2)
+            bounds = 2.0 * shared / (query_lens[start:stop, None] + self._long_lens[None, :])
+            for word, passes in zip(long_pending[start:stop], bounds > 0.8):
+                self._similar[word] = [
+                    word_id for word_id in map(self.long_ids.__getitem__, np.flatnonzero(passes))
+                    if self.words[word_id] != word and _word_ratio(word, self.words[word_id]) > 0.8
+                ]
+    
+    def _char_bags(self, words: List[str]) -> np.ndarray:
+        """Character counts of words over the vocabulary's characters (others are dropped)."""
+        codes = _code_points(words)
+        rows = np.repeat(np.arange(len(words)), [len(w) for w in words])
+        cols = np.searchsorted(self._chars, codes)
+        known = cols < len(self._chars)
+        known[known] = self._chars[cols[known]] == codes[known]
+        bags = np.zeros((len(words), len(self._chars)), dtype=np.int32)
+        np.add.at(bags, (rows[known], cols[known]), 1)
+        return bags
+    
+    def window_matches(self, anchor_words: Sequence[str], window_count: int,
+                       fuzzy_value: float = 0.8, first_window: int = 0) -> Dict[int, float]:
+        """
+        Fuzzy match count of every anchor window with at least one matching word.
+        
+        Window i aligns anchor_words with the words starting at index i. An
+        exact word match counts 1 and a difflib ratio > 0.8 between two words
+        longer than 3 letters counts fuzzy_value, summed in anchor order just
+        like comparing each window word by word. Windows with no match are
+        omitted.
+        
+        Args:
+            anchor_words: Words to align
+            window_count: Number of window start positions to consider
+            fuzzy_value: Credit for a fuzzy (non-exact) word match
+            first_window: First window start position to consider
+        
+        Returns:
+            Dict mapping window start index to its match count
+        """
+        window_matches: Dict[int, float] = {}
+        for k, anchor_word in enumerate(anchor_words):
+            anchor_id = self.vocab.get(anchor_word, -1)
+            hits = [(anchor_id, 1)] if anchor_id >= 0 else []
+            hits.extend((word_id, fuzzy_value) for word_id in self.similar_ids(anchor_word))
+            for word_id, value in hits:
+                positions = self.positions[word_id]
+                # Postings are sorted: jump to the first window in range
+                first = bisect.bisect_left(positions, max(first_window, 0) + k)
+                for position in islice(positions, first, None):
+                    i = position - k
+                    if i >= window_count:
+                        break
+                    window_matches[i] = window_matches.get(i, 0) + value
+        return window_matches
+
+
+def _phrase_search_words(transcript: str, search_start: int, search_end: int,
+                         index: Optional[TranscriptIndex]) -> Tuple[List[int], List[int], List[str]]:
+    """Token (starts, ends, normalized words) of transcript[search_start:search_end]."""
+    if index is not None:
+        return index.span(search_start, search_end)
+    # Tokenize search area
+    word_matches = list(_WORD_RE.finditer(transcript[search_start:search_end]))
+    word_starts = [search_start + m.start() for m in word_matches]
+    word_ends = [search_start + m.end() for m in word_matches]
+    words_normalized = [_normalize_word(m.group()) for m in word_matches]
+    return word_starts, word_ends, words_normalized
+
+
+def _best_phrase_window(phrase: Tuple[str, ...], postings: '_WordPostings') -> Tuple[Optional[int], float]:
+    """
+    Slide phrase over the words of postings and return (window_index, score) of
+    the first best-scoring window with score >= 0.6, or (None, 0) if none
+    qualifies. Exact and fuzzy (difflib ratio > 0.8) word matches both count 1.
+    
+    Only windows with at least one matching word are visited, in order;
+    the rest score 0 and could never be selected.
+    """
+    phrase_len = len(phrase)
+    best_idx = None
+    best_score = 0
+    
+    window_matches = postings.window_matches(
+        phrase, len(postings.ids) - phrase_len + 1, fuzzy_value=1)
+    for i in sorted(window_matches):
+        score = window_matches[i] / phrase_len
+        if score > best_score and score >= 0.6:
+            best_score = score
+            best_idx = i
+            if score >= 1.0:
+                break  # A later window can't beat a perfect match
+    
+    return best_idx, best_score
 
-def find_best_phrase_match(phrases: List[List[str]], transcript: str, search_start: int, search_end: int) -> Optional[Tuple[int, int, float, int]]:
+
+def find_phrase_matches(phrases: Tuple[Tuple[str, ...], ...], transcript: str, search_start: int, search_end: int,
+                        index: Optional[TranscriptIndex] = None) -> List[Tuple[int, int, float, int]]:
     """
-    Find the best matching phrase in the transcript.
+    Find the best match of every phrase in the transcript region, in one pass
+    over a single tokenization of the region.
     
     Args:
-        phrases: List of phrase word lists to search for
+        phrases: Phrase word tuples to search for
         transcript: The transcript text
         search_start: Start position for search
         search_end: End position for search
+        index: Optional prebuilt TranscriptIndex for this transcript
     
     Returns:
-        Tuple of (match_start_pos, match_end_pos, confidence, phrase_index) or None
+        List of (match_start_pos, match_end_pos, confidence, phrase_index) for
+        each phrase that matched, in phrase order
     """
-    search_area = transcript[search_start:search_end]
-    
-    # Tokenize search area
-    word_pattern = re.compile(r'\b\w+\b')
-    word_matches = list(word_pattern.finditer(search_area))
-    
-    if not word_matches:
-        return None
-    
-    words = [m.group() for m in word_matches]
-    words_normalized = [normalize_for_comparison(w) for w in words]
-    
-    best_result = None
-    best_score = 0
+    word_starts, word_ends, words_normalized = _phrase_search_words(
+        transcript, search_start, search_end, index)
+    if not words_normalized:
+        return []
     
+    postings = _WordPostings.build(words_normalized)
+    postings.prime_similar(w for phrase in phrases for w in phrase)
+    results = []
     for phrase_idx, phrase in enumerate(phrases):
-        phrase_len = len(phrase)
-        
-        for i in range(len(words) - phrase_len + 1):
-            window = words_normalized[i:i + phrase_len]
-            
-            # Count matching words
-            matches = 0
-            for p_word, w_word in zip(phrase, window):
-                if p_word == w_word:
-                    matches += 1
-                elif len(p_word) > 3 and len(w_word) > 3:
-                    if difflib.SequenceMatcher(None, p_word, w_word).ratio() > 0.8:
-                        matches += 1
-            
-            score = matches / phrase_len
-            if score > best_score and score >= 0.6:
-                best_score = score
-                start_pos = search_start + word_matches[i].start()
-                end_pos = search_start + word_matches[i + phrase_len - 1].end()
-                best_result = (start_pos, end_pos, score, phrase_idx)
-    
-    return best_result
+        i, score = _best_phrase_window(phrase, postings)
+        if i is not None:
+            results.append((word_starts[i], word_ends[i + len(phrase) - 1], score, phrase_idx))
+    return results
+
+
+# A gap that is nothing but an interjection, which is fine to span
+_GAP_INTERJECTION_ONLY_RE = re.compile(
+    r'^[,.\s]*('
+    r'a what\??|right\??|amen\??|yes\??|who\??|'
+    r'(?:his|her|your|my|its|their|a|an|the|to|of|with)\s+what\??'
+    r')[,.\s]*$',
+    re.IGNORECASE
+)
+
+# Commentary detection patterns - phrases that indicate the speaker is explaining, not quoting
+# (one alternation, so a gap is scanned once)
+_GAP_COMMENTARY_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'\bis\s+denoting\b',          # "is denoting"
+    r'\bis\s+just\s+another\b',    # "is just another name"
+    r'\bmeans\s+',                  # "means..."
+    r'\bthat\s+is\s+',              # "that is..."
+    r'\bin\s+other\s+words\b',      # "in other words"
+    r'\bwhich\s+means\b',           # "which means"
+    r'\bwe\s+see\b',                # "we see"
+    r'\bwe\s+read\b',               # "we read"
+    r'\bhe\s+says\b',               # "he says"
+    r'\bthe\s+bible\s+says\b',      # "the bible says"
+    r'\bthis\s+is\s+referring\b',   # "this is referring"
+    r'\bthis\s+refers\b',           # "this refers"
+    r'\bdenoting\s+a\b',            # "denoting a"
+    r'\ba\s+ruler\s+or\s+a\s+king\b',  # specific commentary pattern
+    r'^\s*a\s+what\?\s+',           # "a what?" at start followed by more text
+]), re.IGNORECASE)
+
+# Interjections removed from a gap before comparing its words with the verse
+_GAP_INTERJECTION_RE = re.compile(
+    r'\ba what\?\b|\bwho\?\b|\b(?:his|her|your|my|its|their|a|an|the)\s+what\?\b',
+    re.IGNORECASE
+)
+
 
 def validate_gap_is_verse_content(gap_text: str, verse_text: str) -> bool:
     """
@@ -1877,48 +2556,17 @@ def validate_gap_is_verse_content(gap_text: str, verse_text: str) -> bool:
     
     # Check for known interjection patterns that are OK to span
     # Includes "his what?", "their what?", etc. where speaker pauses before a word
-    interjection_only = re.match(
-        r'^[,.\s]*('
-        r'a what\??|right\??|amen\??|yes\??|who\??|'
-        r'(?:his|her|your|my|its|their|a|an|the|to|of|with)\s+what\??'
-        r')[,.\s]*$', 
-        gap_clean, re.IGNORECASE
-    )
-    if interjection_only:
+    if _GAP_INTERJECTION_ONLY_RE.match(gap_clean):
         return True
     
-    # Commentary detection patterns - phrases that indicate the speaker is explaining, not quoting
-    COMMENTARY_PATTERNS = [
-        r'\bis\s+denoting\b',          # "is denoting"
-        r'\bis\s+just\s+another\b',    # "is just another name"
-        r'\bmeans\s+',                  # "means..."
-        r'\bthat\s+is\s+',              # "that is..."
-        r'\bin\s+other\s+words\b',      # "in other words"
-        r'\bwhich\s+means\b',           # "which means"
-        r'\bwe\s+see\b',                # "we see"
-        r'\bwe\s+read\b',               # "we read"
-        r'\bhe\s+says\b',               # "he says"
-        r'\bthe\s+bible\s+says\b',      # "the bible says"
-        r'\bthis\s+is\s+referring\b',   # "this is referring"
-        r'\bthis\s+refers\b',           # "this refers"
-        r'\bdenoting\s+a\b',            # "denoting a"
-        r'\ba\s+ruler\s+or\s+a\s+king\b',  # specific commentary pattern
-        r'^\s*a\s+what\?\s+',           # "a what?" at start followed by more text
-    ]
-    
-    for pattern in COMMENTARY_PATTERNS:
-        if re.search(pattern, gap_clean, re.IGNORECASE):
-            return False  # This is commentary, not verse content
+    if _GAP_COMMENTARY_RE.search(gap_clean):
+        return False  # This is commentary, not verse content
     
     # Check if gap content words appear in the verse text (allowing for interjections)
     # Remove known interjection patterns from gap for this check
-    gap_without_interjections = re.sub(
-        r'\ba what\?\b|\bwho\?\b|\b(?:his|her|your|my|its|their|a|an|the)\s+what\?\b', 
-        '', gap_clean, flags=re.IGNORECASE
-    )
+    gap_without_interjections = _GAP_INTERJECTION_RE.sub('', gap_clean)
     gap_words = get_words(gap_without_interjections)
-    verse_words = get_words(verse_text)
-    verse_words_set = set(verse_words)
+    verse_words_set = _verse_index(verse_text)[1]
     
     if len(gap_words) < 3:
         return True  # Too few words to judge
@@ -1935,7 +2583,8 @@ def validate_gap_is_verse_content(gap_text: str, verse_text: str) -> bool:
 
 
 def find_verse_end_in_transcript(transcript: str, start_pos: int, verse_text: str,
-                                   max_search: int = 1500, debug: bool = False) -> Optional[int]:
+                                   max_search: int = 1500, debug: bool = False,
+                                   index: Optional[TranscriptIndex] = None) -> Optional[int]:
     """
     Find where the verse text ends in the transcript using word-by-word matching.
     
@@ -1948,6 +2597,7 @@ def find_verse_end_in_transcript(transcript: str, start_pos: int, verse_text: st
         verse_text: The full verse text from Bible API
         max_search: Maximum characters to search
         debug: Whether to print debug information
+        index: Optional prebuilt TranscriptIndex for this transcript
     
     Returns:
         Position in transcript where verse text ends, or None if unreliable
@@ -1956,46 +2606,53 @@ def find_verse_end_in_transcript(transcript: str, start_pos: int, verse_text: st
     if len(verse_words) < 3:
         return None
     
-    search_region = transcript[start_pos:start_pos + max_search]
-    
-    # Get word positions in search region
-    word_pattern = re.compile(r'\b\w+\b')
-    word_matches = list(word_pattern.finditer(search_region))
+    # Get word end positions (relative to start_pos) in search region
+    if index is not None:
+        _, word_ends, search_words = index.span(start_pos, start_pos + max_search)
+        word_ends = [p - start_pos for p in word_ends]
+    else:
+        word_matches = list(_WORD_RE.finditer(transcript[start_pos:start_pos + max_search]))
+        word_ends = [m.end() for m in word_matches]
+        search_words = [_normalize_word(m.group()) for m in word_matches]
     
-    if not word_matches:
+    if not search_words:
         return None
     
-    search_words = [normalize_for_comparison(m.group()) for m in word_matches]
-    
-    # Track matching progress through verse words
-    verse_idx = 0
-    last_matched_pos = 0
-    matched_count = 0
-    skipped_count = 0
-    
-    for i, search_word in enumerate(search_words):
-        if verse_idx >= len(verse_words):
-            break  # Matched all verse words
+    if search_words[:len(verse_words)] == verse_words:
+        # Fast path: the region opens with the verse verbatim, which the
+        # word-by-word scan below would match one-for-one
+        matched_count = len(verse_words)
+        last_matched_pos = word_ends[len(verse_words) - 1]
+    else:
+        # Track matching progress through verse words
+        verse_idx = 0
+        last_matched_pos = 0
+        matched_count = 0
+        skipped_count = 0
         
-        # Check for match (with fuzzy allowance)
-        if _words_match_fuzzy(search_word, verse_words[verse_idx]):
-            verse_idx += 1
-            matched_count += 1
-            last_matched_pos = word_matches[i].end()
-            skipped_count = 0  # Reset skip counter
-        else:
-            # Allow skipping 1-2 words for interjections or minor variations
-            skipped_count += 1
+        for i, search_word in enumerate(search_words):
+            if verse_idx >= len(verse_words):
+                break  # Matched all verse words
             
-            # Check if we can match the NEXT verse word (speaker skipped a word)
-            if verse_idx + 1 < len(verse_words) and _words_match_fuzzy(search_word, verse_words[verse_idx + 1]):
-                verse_idx += 2  # Skip the missed word
+            # Check for match (with fuzzy allowance)
+            if _words_match_fuzzy(search_word, verse_words[verse_idx]):
+                verse_idx += 1
                 matched_count += 1
-                last_matched_pos = word_matches[i].end()
-                skipped_count = 0
-            elif skipped_count > 5:
-                # Too many consecutive non-matches - verse likely ended
-                break
+                last_matched_pos = word_ends[i]
+                skipped_count = 0  # Reset skip counter
+            else:
+                # Allow skipping 1-2 words for interjections or minor variations
+                skipped_count += 1
+                
+                # Check if we can match the NEXT verse word (speaker skipped a word)
+                if verse_idx + 1 < len(verse_words) and _words_match_fuzzy(search_word, verse_words[verse_idx + 1]):
+                    verse_idx += 2  # Skip the missed word
+                    matched_count += 1
+                    last_matched_pos = word_ends[i]
+                    skipped_count = 0
+                elif skipped_count > 5:
+                    # Too many consecutive non-matches - verse likely ended
+                    break
     
     # Calculate coverage - did we find most of the verse?
     coverage = matched_count / len(verse_words) if verse_words else 0
@@ -2020,6 +2677,26 @@ def find_verse_end_in_transcript(transcript: str, start_pos: int, verse_text: st
     return end_absolute
 
 
+# Common word substitutions in Bible text, as a symmetric lookup:
+# word -> words it is interchangeable with
+_EQUIV: Dict[str, frozenset] = {}
+for _a, _b in [
+    ('unto', 'to'),
+    ('thee', 'you'),
+    ('thy', 'your'),
+    ('thou', 'you'),
+    ('hath', 'has'),
+    ('doth', 'does'),
+    ('ye', 'you'),
+    ('saith', 'says'),
+    ('wherefore', 'therefore'),
+    ('wholly', 'holy'),  # Common transcription error
+]:
+    _EQUIV[_a] = _EQUIV.get(_a, frozenset()) | {_b}
+    _EQUIV[_b] = _EQUIV.get(_b, frozenset()) | {_a}
+del _a, _b
+
+
 def _words_match_fuzzy(word1: str, word2: str, threshold: float = 0.8) -> bool:
     """
     Check if two words match, allowing for transcription variations.
@@ -2032,33 +2709,47 @@ def _words_match_fuzzy(word1: str, word2: str, threshold: float = 0.8) -> bool:
     if word1 == word2:
         return True
     
-    # Common substitutions in Bible text
-    EQUIVALENTS = {
-        ('unto', 'to'), ('to', 'unto'),
-        ('thee', 'you'), ('you', 'thee'),
-        ('thy', 'your'), ('your', 'thy'),
-        ('thou', 'you'), ('you', 'thou'),
-        ('hath', 'has'), ('has', 'hath'),
-        ('doth', 'does'), ('does', 'doth'),
-        ('ye', 'you'), ('you', 'ye'),
-        ('saith', 'says'), ('says', 'saith'),
-        ('wherefore', 'therefore'), ('therefore', 'wherefore'),
-        ('wholly', 'holy'), ('holy', 'wholly'),  # Common transcription error
-    }
-    
-    if (word1, word2) in EQUIVALENTS or (word2, word1) in EQUIVALENTS:
+    if word2 in _EQUIV.get(word1, ()):
         return True
     
     # Fuzzy matching for longer words
-    if len(word1) > 3 and len(word2) > 3:
-        ratio = difflib.SequenceMatcher(None, word1, word2).ratio()
+    len1, len2 = len(word1), len(word2)
+    if len1 > 3 and len2 > 3:
+        # The ratio can't exceed its length bound (SequenceMatcher.real_quick_ratio),
+        # which rules out most pairs without computing the ratio
+        if 2.0 * min(len1, len2) / (len1 + len2) < threshold:
+            return False
+        ratio = _word_ratio(word1, word2)
         return ratio >= threshold
     
     return False
 
 
+def _fuzzy_partners(word: str, candidates: Iterable[str], threshold: float = 0.8) -> set:
+    """
+    The candidates that _words_match_fuzzy(word, candidate) accepts, with the
+    checks that depend only on word done once. Words of 3 letters or fewer
+    (most transcript words) only ever match exactly or through _EQUIV, so
+    they skip the fuzzy comparison entirely.
+    """
+    equiv = _EQUIV.get(word, ())
+    len1 = len(word)
+    if len1 <= 3:
+        return {c for c in candidates if c == word or c in equiv}
+    partners = set()
+    for c in candidates:
+        if c == word or c in equiv:
+            partners.add(c)
+        else:
+            len2 = len(c)
+            if (len2 > 3 and 2.0 * min(len1, len2) / (len1 + len2) >= threshold
+                    and _word_ratio(word, c) >= threshold):
+                partners.add(c)
+    return partners
+
+
 def validate_quote_end(quote_text: str, verse_text: str, transcript: str, start_pos: int, end_pos: int, 
-                       debug: bool = False) -> int:
+                       debug: bool = False, index: Optional[TranscriptIndex] = None) -> int:
     """
     Validate that the detected quote end actually matches verse content.
     
@@ -2077,12 +2768,12 @@ def validate_quote_end(quote_text: str, verse_text: str, transcript: str, start_
         start_pos: Start position of quote
         end_pos: Current end position of quote
         debug: Whether to print debug information
+        index: Optional prebuilt TranscriptIndex for this transcript
         
     Returns:
         Corrected end position
     """
-    verse_words = get_words(verse_text)
-    verse_words_set = set(verse_words)
+    verse_words, verse_words_set, _ = _verse_index(verse_text)
     
     if len(verse_words) < 3:
         return end_pos
@@ -2090,7 +2781,7 @@ def validate_quote_end(quote_text: str, verse_text: str, transcript: str, start_
     # =========================================================================
     # PHASE 3 FIX: Try to find where the verse ACTUALLY ends in transcript
     # =========================================================================
-    verse_end_pos = find_verse_end_in_transcript(transcript, start_pos, verse_text, debug=debug)
+    verse_end_pos = find_verse_end_in_transcript(transcript, start_pos, verse_text, debug=debug, index=index)
     
     if verse_end_pos and verse_end_pos > end_pos:
         # Verse content extends past our detected end - extend the quote
@@ -2099,7 +2790,7 @@ def validate_quote_end(quote_text: str, verse_text: str, transcript: str, start_
         extension_words = get_words(extension_text)
         
         if extension_words:
-            extension_matches = sum(1 for w in extension_words if w in verse_words_set)
+            extension_matches = len([w for w in extension_words if w in verse_words_set])
             extension_ratio = extension_matches / len(extension_words)
             
             if extension_ratio >= 0.5:  # At least 50% verse words
@@ -2168,6 +2859,13 @@ def validate_quote_end(quote_text: str, verse_text: str, transcript: str, start_
     return end_pos
 
 
+def _content_end(text: str, end: int) -> int:
+    """End offset of text[:end] with any trailing punctuation left out."""
+    while end > 0 and text[end - 1] in '.,;:!?':
+        end -= 1
+    return end
+
+
 def extend_quote_past_interjection(transcript: str, current_end: int, verse_text: str, max_look_ahead: int = 50) -> int:
     """
     Extend quote boundary to include verse content that appears after an interjection.
@@ -2184,8 +2882,7 @@ def extend_quote_past_interjection(transcript: str, current_end: int, verse_text
     Returns:
         Extended end position (may be same as current_end if no extension found)
     """
-    verse_words = get_words(verse_text)
-    verse_words_set = set(verse_words)
+    verse_words, verse_words_set, _ = _verse_index(verse_text)
     
     # Get the last few words of the current quote to see what's already matched
     look_back = min(50, current_end)
@@ -2222,47 +2919,46 @@ def extend_quote_past_interjection(transcript: str, current_end: int, verse_text
     if not remaining_verse_words:
         return current_end
     
-    # Look ahead in the transcript for these remaining words
-    look_ahead_text = transcript[current_end:current_end + max_look_ahead]
-    look_ahead_words = get_words(look_ahead_text)
+    # Look ahead in the transcript for these remaining words. The window is
+    # padded so that trailing verse words after the continuation can be
+    # checked without re-tokenizing the transcript.
+    look_ahead_text = transcript[current_end:current_end + max_look_ahead + 30]
+    ahead_matches = list(_TOKEN_RE.finditer(look_ahead_text))
+    look_ahead_words = [_normalize_word(m.group()) for m in ahead_matches]
     
     # Find the remaining verse words after any interjection
     # Common interjections: what?, right?, amen?, who?, etc.
     interjection_words = {'what', 'right', 'amen', 'yes', 'okay', 'huh', 'who'}
     
     best_extension = current_end
-    for i, word in enumerate(look_ahead_words):
+    for k, word in enumerate(look_ahead_words):
+        if ahead_matches[k].end() > max_look_ahead:
+            break
+        
         # Skip interjection words
         if word in interjection_words:
             continue
         
         # Check if this word matches the next expected verse word
         if word == remaining_verse_words[0]:
-            # Found the continuation! Find where this word ends
-            word_pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-            for match in word_pattern.finditer(look_ahead_text):
-                word_end_pos = current_end + match.end()
-                
-                # Check for additional remaining verse words
-                extended_end = word_end_pos
-                if len(remaining_verse_words) > 1:
-                    # Look for more verse words after this one
-                    remaining_text = transcript[word_end_pos:word_end_pos + 30]
-                    remaining_look_words = get_words(remaining_text)
-                    for j, next_remaining in enumerate(remaining_verse_words[1:]):
-                        if j < len(remaining_look_words) and remaining_look_words[j] == next_remaining:
-                            # Find position of this word
-                            next_pattern = re.compile(r'\b' + re.escape(next_remaining) + r'\b', re.IGNORECASE)
-                            for next_match in next_pattern.finditer(remaining_text):
-                                extended_end = word_end_pos + next_match.end()
-                                break
-                
-                # Include trailing punctuation
-                while extended_end < len(transcript) and transcript[extended_end] in '.,;:!?':
-                    extended_end += 1
-                
-                best_extension = extended_end
-                break
+            # Found the continuation! Its end offset comes straight from the token
+            word_end = ahead_matches[k].end()
+            extended_end = current_end + word_end
+            
+            # Check for additional remaining verse words right after this one
+            verse_ptr = 1
+            for m, next_word in zip(ahead_matches[k + 1:], look_ahead_words[k + 1:]):
+                if verse_ptr >= len(remaining_verse_words) or m.end() > word_end + 30:
+                    break
+                if next_word == remaining_verse_words[verse_ptr]:
+                    extended_end = current_end + m.end()
+                verse_ptr += 1
+            
+            # Include trailing punctuation
+            while extended_end < len(transcript) and transcript[extended_end] in '.,;:!?':
+                extended_end += 1
+            
+            best_extension = extended_end
             break  # Found the first matching word, stop looking
     
     return best_extension
@@ -2272,29 +2968,39 @@ def extend_quote_past_interjection(transcript: str, current_end: int, verse_text
 # INTRODUCTORY PHRASE DETECTION
 # ============================================================================
 
+# Building blocks for INTRO_PHRASE_PATTERNS. Literal alternations are
+# prefix-factored ("P(?:aul|eter)" rather than "Paul|...|Peter") so a failed
+# branch is rejected on its first letter instead of being retried for every
+# name or verb in the list.
+_INTRO_AUTHORS = r'(?:P(?:aul|eter)|J(?:esus|ohn|ames|eremiah)|David|Moses|Solomon|Isaiah|the\s+(?:Lord|apostle|prophet))'
+# Verbs after a named author: "Paul writes", "David said"
+_INTRO_AUTHOR_VERBS = r'(?:s(?:ays?|aid)|wr(?:ites?|ote)|tells?\s+us)'
+# Verbs after a pronoun or "the Bible": "he says", "Scripture tells us"
+_INTRO_SPEECH_VERBS = r'(?:says?|tells?\s+us|writes?)'
+# Verbs that introduce a quote on their own: "says", "declares"
+_INTRO_VERBS = r'(?:s(?:ays?|tates?)|writes?|te(?:lls?\s+us|aches?)|declares?|proclaims?|re(?:cords?|ads?))'
+
 # Common patterns that introduce Bible quotes after the reference
 # These patterns appear BETWEEN the verse reference and the actual quoted text
-# ENHANCED: Now includes compound patterns like "says Paul writes"
 INTRO_PHRASE_PATTERNS = [
-    # === COMPOUND ATTRIBUTION PATTERNS (check these FIRST as they're longer) ===
-    # "says [Name] writes/says" patterns
-    r'(?:says?|tells?\s+us)\s+(?:Paul|Jesus|David|Moses|Peter|John|James|Solomon|Isaiah|Jeremiah|the\s+(?:Lord|apostle|prophet))\s+(?:writes?|says?|tells?\s+us|wrote|said)\s+',
-    # "writes [Name] says" patterns (less common but occurs)
-    r'(?:writes?)\s+(?:Paul|Jesus|David|Moses|Peter|John|James|Solomon|Isaiah|Jeremiah)\s+(?:says?|tells?\s+us|said)\s+',
+    # Compound attributions ("says Paul writes", "writes Paul says") need no
+    # patterns of their own: the chained match in extract_reference_intro_length
+    # takes the verb and then the "[Name] writes" pattern as separate links.
+    
     # "he/she says [action] that" patterns
-    r'(?:he|she|it)\s+(?:says?|tells?\s+us|writes?)\s+(?:here|there|to\s+us|unto\s+us)?\s*',
+    rf'(?:he|she|it)\s+{_INTRO_SPEECH_VERBS}\s+(?:here|t(?:here|o\s+us)|unto\s+us)?\s*',
     
     # === AUTHOR ATTRIBUTION PATTERNS ===
     # "Paul writes", "Jesus says", "David said" - author before verb
-    r'(?:Paul|Jesus|David|Moses|Peter|John|James|Solomon|Isaiah|Jeremiah|the\s+(?:Lord|apostle|prophet))\s+(?:says?|writes?|wrote|said|tells?\s+us)\s+',
+    rf'{_INTRO_AUTHORS}\s+{_INTRO_AUTHOR_VERBS}\s+',
     
     # === SIMPLE ATTRIBUTION PATTERNS ===
     # Single verb patterns (e.g., "says", "writes", "tells us")
-    r'(?:says?|writes?|tells?\s+us|teaches?|declares?|proclaims?|records?|states?|reads?)\s+',
+    rf'{_INTRO_VERBS}\s+',
     
     # === CONTINUATION/CONTEXT PATTERNS ===
     # "the Bible says", "Scripture says", "the Word says"
-    r'(?:the\s+)?(?:Bible|Scripture|Word|Lord)\s+(?:says?|tells?\s+us|writes?)\s+',
+    rf'(?:the\s+)?(?:Bible|Scripture|Word|Lord)\s+{_INTRO_SPEECH_VERBS}\s+',
     
     # === QUOTE MARKER PATTERNS ===
     # "quote", "and I quote", etc.
@@ -2310,6 +3016,86 @@ INTRO_PHRASE_PATTERNS = [
 # Combined pattern for all intro phrases
 INTRO_PHRASE_COMBINED = '|'.join(INTRO_PHRASE_PATTERNS)
 
+# Intro phrase, compiled once at import. Use with .match(text, pos, endpos):
+# match() anchors at pos, so the search needs no slice of the transcript
+_INTRO_PATTERN = re.compile(r'[\s,]*(?:' + INTRO_PHRASE_COMBINED + r')', re.IGNORECASE)
+
+# Chain of up to 5 intro phrases ("says Paul writes ...") in a single match.
+# Each repetition is an atomic group, so every phrase commits to its first
+# match exactly like matching _INTRO_PATTERN repeatedly would, and a failed
+# repetition never backtracks into the ones before it.
+try:
+    _INTRO_CHAIN_PATTERN = re.compile(
+        r'(?:(?>[\s,]*(?:' + INTRO_PHRASE_COMBINED + r'))){0,5}', re.IGNORECASE
+    )
+except re.error:  # Atomic groups need Python 3.11+
+    _INTRO_CHAIN_PATTERN = None
+
+# Every INTRO_PHRASE_PATTERNS alternative opens with one of these words, so
+# text starting with any other word cannot contain an intro phrase. Keep this
+# in sync when adding patterns ("quote" is a prefix match, see
+# _may_start_intro_phrase).
+_INTRO_FIRST_WORDS = frozenset({
+    'say', 'says', 'tell', 'tells', 'write', 'writes', 'he', 'she', 'it',
+    'paul', 'peter', 'jesus', 'john', 'james', 'jeremiah', 'david', 'moses',
+    'solomon', 'isaiah', 'the', 'state', 'states', 'teache', 'teaches',
+    'declare', 'declares', 'proclaim', 'proclaims', 'record', 'records',
+    'read', 'reads', 'bible', 'scripture', 'word', 'lord', 'and', 'let',
+    'verse', 'we',
+})
+_INTRO_FIRST_WORD_RE = re.compile(r'[\s,]*(\w+)')
+
+
+def _may_start_intro_phrase(text: str, pos: int, endpos: int) -> bool:
+    """Cheap check on the first word of text[pos:endpos] before running the full intro regex."""
+    match = _INTRO_FIRST_WORD_RE.match(text, pos, endpos)
+    if not match:
+        return False
+    first_word = match.group(1).casefold()
+    return first_word in _INTRO_FIRST_WORDS or first_word.startswith('quote')
+
+
+@lru_cache(maxsize=1024)
+def _word_boundary_pattern(word: str) -> re.Pattern:
+    """Compiled case-insensitive whole-word pattern for word (cached per word)."""
+    return re.compile(r'\b(' + re.escape(word) + r')\b', re.IGNORECASE)
+
+
+
+def _iter_word_positions(text: str, word: str, start: int, end: int) -> Iterator[int]:
+    """
+    Start offsets of whole-word, case-insensitive occurrences of lowercase
+    word in text[start:end], the same as
+    _word_boundary_pattern(word).finditer(text, start, end).
+    
+    ASCII text is scanned with str.find and explicit boundary checks; other
+    text goes through the regex so Unicode case folding stays identical.
+    """
+    end = min(end, len(text))
+    area = text[start:end]
+    if not (word.isascii() and area.isascii()):
+        for match in _word_boundary_pattern(word).finditer(text, start, end):
+            yield match.start()
+        return
+    
+    area = area.lower()
+    i = area.find(word)
+    while i >= 0:
+        pos = start + i
+        after = i + len(word)
+        # Like \b with pos/endpos: look behind start, but treat end as the end
+        if ((pos == 0 or not _is_word_char(text[pos - 1])) and
+                (after == len(area) or not _is_word_char(area[after]))):
+            yield pos
+            i = area.find(word, after)
+        else:
+            i = area.find(word, i + 1)
+
+
+def _is_word_char(char: str) -> bool:
+    """True if char matches \\w."""
+    return char.isalnum() or char == '_'
+
 
 def extract_reference_intro_length(transcript: str, ref_position: int, ref_length: int, 
                                     max_intro_length: int = 150) -> int:
@@ -2340,35 +3126,41 @@ def extract_reference_intro_length(transcript: str, ref_position: int, ref_lengt
     if search_start >= len(transcript):
         return ref_length
     
-    # Text immediately following the reference
-    after_ref = transcript[search_start:search_end]
+    # Text immediately following the reference (transcript[search_start:search_end])
+    # is matched in place via pos/endpos rather than sliced out
+    
+    # Most references run straight into the quote, so skip the regex when the
+    # next word cannot begin any intro phrase
+    if not _may_start_intro_phrase(transcript, search_start, search_end):
+        return ref_length
     
     # Try to match intro patterns at the start of this text
     # ENHANCED: Apply patterns REPEATEDLY to catch compound patterns
-    total_intro_length = 0
-    remaining_text = after_ref
+    if _INTRO_CHAIN_PATTERN is not None:
+        intro_end = _INTRO_CHAIN_PATTERN.match(transcript, search_start, search_end).end()
+        return ref_length + intro_end - search_start
     
-    # Compile pattern once
-    intro_pattern = re.compile(
-        r'^[\s,]*(?:' + INTRO_PHRASE_COMBINED + r')',
-        re.IGNORECASE
-    )
+    intro_end = search_start
     
     # Apply patterns up to 5 times to catch compound chains
     for _ in range(5):
-        match = intro_pattern.match(remaining_text)
+        match = _INTRO_PATTERN.match(transcript, intro_end, search_end)
         if match:
-            matched_length = match.end()
-            total_intro_length += matched_length
-            remaining_text = remaining_text[matched_length:]
+            intro_end = match.end()
         else:
             break
     
-    return ref_length + total_intro_length
+    return ref_length + intro_end - search_start
+
+
+def _count_positional_matches(words: Sequence[str], expected: Sequence[str]) -> int:
+    """Count positions where two word sequences agree, up to the shorter length."""
+    return sum(map(operator.eq, words, expected))
 
 
 def validate_start_is_verse_text(transcript: str, detected_start: int, verse_text: str,
-                                  max_search_forward: int = 100, debug: bool = False) -> int:
+                                  max_search_forward: int = 100, debug: bool = False,
+                                  index: Optional[TranscriptIndex] = None) -> int:
     """
     Verify that detected_start points to actual verse text, not intro phrases.
     
@@ -2384,27 +3176,41 @@ def validate_start_is_verse_text(transcript: str, detected_start: int, verse_tex
         verse_text: The expected verse text from Bible API
         max_search_forward: Maximum characters to search forward for better match
         debug: Whether to print debug information
+        index: Optional prebuilt TranscriptIndex for this transcript
     
     Returns:
         Adjusted start position that matches verse beginning
     """
-    verse_words = get_words(verse_text)
+    verse_words = _verse_words(verse_text)
     if len(verse_words) < 3:
         return detected_start  # Can't validate short verses
     
+    # Fast path: the transcript repeats the verse opening verbatim, so all of
+    # the first words match without tokenizing anything (debug runs take the
+    # full path so the comparison still gets printed)
+    opening = _verse_opening(verse_text)
+    opening_end = detected_start + len(opening)
+    if not debug and opening_end <= detected_start + 150:
+        if index is not None and index.lower is not None:
+            # Compare in place against the pre-lowercased transcript
+            opening_matches = index.lower.startswith(opening, detected_start)
+        else:
+            opening_matches = transcript[detected_start:opening_end].lower() == opening
+        if opening_matches and (opening_end >= len(transcript) or transcript[opening_end].isspace()):
+            return detected_start
+    
     # First 5 words of verse are our "fingerprint"
     first_verse_words = verse_words[:min(5, len(verse_words))]
     
     # Check if detected start matches verse start
-    detected_text = transcript[detected_start:detected_start + 150]
-    detected_words = get_words(detected_text)[:len(first_verse_words)]
+    detected_words = _first_n_words(transcript, detected_start, detected_start + 150,
+                                    len(first_verse_words))
     
     if not detected_words:
         return detected_start
     
     # Calculate initial match score
-    initial_matches = sum(1 for i, w in enumerate(detected_words) 
-                         if i < len(first_verse_words) and w == first_verse_words[i])
+    initial_matches = _count_positional_matches(detected_words, first_verse_words)
     
     if debug:
         print(f"      [START_VALIDATE] Initial match: {initial_matches}/{len(first_verse_words)} words")
@@ -2419,18 +3225,13 @@ def validate_start_is_verse_text(transcript: str, detected_start: int, verse_tex
     best_pos = detected_start
     best_score = initial_matches
     
-    # Use word boundaries to search
-    word_pattern = re.compile(r'\b(' + re.escape(first_verse_words[0]) + r')\b', re.IGNORECASE)
-    
-    search_area = transcript[detected_start:detected_start + max_search_forward]
-    
-    for match in word_pattern.finditer(search_area):
-        search_pos = detected_start + match.start()
-        search_text = transcript[search_pos:search_pos + 150]
-        search_words = get_words(search_text)[:len(first_verse_words)]
+    # Search forward for whole-word occurrences of the verse's first word
+    for search_pos in _iter_word_positions(transcript, first_verse_words[0].lower(),
+                                           detected_start, detected_start + max_search_forward):
+        search_words = _first_n_words(transcript, search_pos, search_pos + 150,
+                                      len(first_verse_words))
         
-        matches = sum(1 for i, w in enumerate(search_words)
-                     if i < len(first_verse_words) and w == first_verse_words[i])
+        matches = _count_positional_matches(search_words, first_verse_words)
         
         if matches > best_score:
             best_score = matches
@@ -2449,7 +3250,8 @@ def validate_start_is_verse_text(transcript: str, detected_start: int, verse_tex
 
 
 def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_position: int, 
-                                   ref_length: int = 0, debug: bool = False) -> Optional[Tuple[int, int, float]]:
+                                   ref_length: int = 0, debug: bool = False,
+                                   index: Optional[TranscriptIndex] = None) -> Optional[Tuple[int, int, float]]:
     """
     Improved quote boundary detection using bidirectional distinctive phrase matching.
     
@@ -2468,11 +3270,13 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
         ref_length: Length of the reference text to skip past (e.g., "Matthew 6:33" = 12 chars)
                    This is automatically extended to include any detected intro phrases.
         debug: Whether to output debug logging for boundary detection decisions
+        index: Optional prebuilt TranscriptIndex for this transcript (built
+               here if not given, so the per-phrase searches share it)
     
     Returns:
         Tuple of (start_pos, end_pos, confidence) or None
     """
-    verse_words = get_words(verse_text)
+    verse_words = _verse_words(verse_text)
     
     if len(verse_words) < 4:
         if debug:
@@ -2521,33 +3325,40 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
     if debug:
         print(f"  [DEBUG] Extracted {len(phrases)} distinctive phrases from verse")
     
+    if index is None:
+        index = TranscriptIndex.build(transcript)
+    
     # =========================================================================
     # FORWARD SEARCH: Look for phrase matches AFTER the reference
     # =========================================================================
-    forward_matches = []
-    for phrase_idx, phrase in enumerate(phrases):
-        result = find_best_phrase_match([phrase], transcript, forward_search_start, forward_search_end)
-        if result:
-            start, end, score, _ = result
-            forward_matches.append((start, end, score, phrase_idx, 'forward'))
-            if debug:
-                matched_text = transcript[start:end]
-                print(f"  [DEBUG] Forward match [{phrase_idx}]: '{matched_text}' at {start}-{end} (score: {score:.2f})")
+    # Matches are (start, end, score, phrase_idx); the direction is tracked
+    # separately in search_direction once a side is selected
+    forward_matches = find_phrase_matches(
+        phrases, transcript, forward_search_start, forward_search_end, index)
+    if debug:
+        for start, end, score, phrase_idx in forward_matches:
+            matched_text = transcript[start:end]
+            print(f"  [DEBUG] Forward match [{phrase_idx}]: '{matched_text}' at {start}-{end} (score: {score:.2f})")
     
     # =========================================================================
     # BACKWARD SEARCH: Look for phrase matches BEFORE the reference
     # (Only search if there's a meaningful backward region)
     # =========================================================================
+    
+    # Evaluate forward matches for significance. A significant forward set is
+    # always selected below, so the backward search can't change the result
+    # and is skipped (debug runs still do it to report both directions).
+    forward_significant = _evaluate_match_significance(forward_matches, phrases)
+    
     backward_matches = []
-    if backward_search_end > backward_search_start + 10:  # At least 10 chars to search
-        for phrase_idx, phrase in enumerate(phrases):
-            result = find_best_phrase_match([phrase], transcript, backward_search_start, backward_search_end)
-            if result:
-                start, end, score, _ = result
-                backward_matches.append((start, end, score, phrase_idx, 'backward'))
-                if debug:
-                    matched_text = transcript[start:end]
-                    print(f"  [DEBUG] Backward match [{phrase_idx}]: '{matched_text}' at {start}-{end} (score: {score:.2f})")
+    if (backward_search_end > backward_search_start + 10  # At least 10 chars to search
+            and (debug or not forward_significant['is_significant'])):
+        backward_matches = find_phrase_matches(
+            phrases, transcript, backward_search_start, backward_search_end, index)
+        if debug:
+            for start, end, score, phrase_idx in backward_matches:
+                matched_text = transcript[start:end]
+                print(f"  [DEBUG] Backward match [{phrase_idx}]: '{matched_text}' at {start}-{end} (score: {score:.2f})")
     
     if debug:
         print(f"  [DEBUG] Total matches: {len(forward_matches)} forward, {len(backward_matches)} backward")
@@ -2556,8 +3367,6 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
     # DIRECTION SELECTION: Prefer forward matches (most common sermon pattern)
     # =========================================================================
     
-    # Evaluate forward matches for significance
-    forward_significant = _evaluate_match_significance(forward_matches, phrases)
     backward_significant = _evaluate_match_significance(backward_matches, phrases)
     
     if debug:
@@ -2602,9 +3411,8 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
     # CLUSTER ANALYSIS: Group contiguous matches and find best cluster
     # =========================================================================
     
-    # Sort matches by position (remove direction marker for processing)
-    all_matches = [(m[0], m[1], m[2], m[3]) for m in selected_matches]
-    all_matches.sort(key=lambda x: x[0])
+    # Sort matches by position
+    all_matches = sorted(selected_matches, key=operator.itemgetter(0))
     
     if not all_matches:
         return None
@@ -2615,34 +3423,8 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
     MIN_GAP_TO_VALIDATE = 30  # Only validate gaps larger than this
     
     # Find clusters of contiguous matches
-    clusters = []
-    current_cluster = [all_matches[0]]
-    
-    for match in all_matches[1:]:
-        prev_match = current_cluster[-1]
-        gap_start = prev_match[1]
-        gap_end = match[0]
-        gap_size = gap_end - gap_start
-        
-        # Check if gap is within size limit
-        if gap_size > MAX_GAP_BETWEEN_PHRASES:
-            # Gap too large, start new cluster
-            clusters.append(current_cluster)
-            current_cluster = [match]
-        elif gap_size > MIN_GAP_TO_VALIDATE:
-            # Validate that gap content is verse text, not commentary
-            gap_text = transcript[gap_start:gap_end]
-            if validate_gap_is_verse_content(gap_text, verse_text):
-                current_cluster.append(match)
-            else:
-                # Gap contains commentary - start new cluster
-                clusters.append(current_cluster)
-                current_cluster = [match]
-        else:
-            # Small gap, assume it's verse content
-            current_cluster.append(match)
-    
-    clusters.append(current_cluster)  # Add the last cluster
+    clusters = _build_clusters(all_matches, transcript, verse_text,
+                               MAX_GAP_BETWEEN_PHRASES, MIN_GAP_TO_VALIDATE)
     
     if debug:
         print(f"  [DEBUG] Found {len(clusters)} match clusters")
@@ -2653,18 +3435,20 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
     # Identify significant clusters and track which verse phrase indices they cover
     # A significant cluster has at least 3 matches or covers the verse start/end
     significant_clusters = []
+    end_phrase_mask = _end_phrase_mask(len(phrases))
     for cluster in clusters:
-        phrase_indices = set(m[3] for m in cluster)
-        has_start = 0 in phrase_indices or 1 in phrase_indices  # First phrases
-        has_end = (len(phrases) - 1) in phrase_indices or (len(phrases) - 2) in phrase_indices  # Last phrases
+        phrase_mask = _phrase_mask(cluster)
+        has_start = bool(phrase_mask & _START_PHRASE_MASK)  # First phrases
+        has_end = bool(phrase_mask & end_phrase_mask)  # Last phrases
         
         if len(cluster) >= 3 or has_start or has_end:
             # Calculate what portion of the verse this cluster represents
-            max_phrase_idx = max(m[3] for m in cluster)
-            min_phrase_idx = min(m[3] for m in cluster)
+            # Highest and lowest set bits of the mask are the max/min phrase indices
+            max_phrase_idx = phrase_mask.bit_length() - 1
+            min_phrase_idx = (phrase_mask & -phrase_mask).bit_length() - 1
             significant_clusters.append({
                 'cluster': cluster,
-                'phrase_indices': phrase_indices,
+                'phrase_mask': phrase_mask,
                 'min_phrase': min_phrase_idx,
                 'max_phrase': max_phrase_idx,
                 'has_start': has_start,
@@ -2711,7 +3495,8 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
     # PHASE 2 FIX: Validate and adjust start position to exclude intro phrases
     # This handles cases where phrase matching catches intro text
     validated_start = validate_start_is_verse_text(transcript, start_pos, verse_text, 
-                                                    max_search_forward=100, debug=debug)
+                                                    max_search_forward=100, debug=debug,
+                                                    index=index)
     if validated_start != start_pos:
         if debug:
             print(f"  [DEBUG] Adjusted start forward from {start_pos} to {validated_start}")
@@ -2719,7 +3504,7 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
     
     # Validate and potentially trim the quote end
     quote_text = transcript[start_pos:end_pos]
-    validated_end = validate_quote_end(quote_text, verse_text, transcript, start_pos, end_pos, debug=debug)
+    validated_end = validate_quote_end(quote_text, verse_text, transcript, start_pos, end_pos, debug=debug, index=index)
     if validated_end != end_pos:
         if debug:
             print(f"  [DEBUG] Trimmed quote end from {end_pos} to {validated_end}")
@@ -2734,7 +3519,9 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
         end_pos = extended_end
     
     # Collect all matches that fall within our boundaries for confidence calculation
-    matches_in_range = [m for m in all_matches if m[0] >= start_pos and m[1] <= end_pos]
+    # all_matches is sorted by start, so skip straight to the first candidate
+    first_in_range = bisect.bisect_left(all_matches, start_pos, key=operator.itemgetter(0))
+    matches_in_range = [m for m in islice(all_matches, first_in_range, None) if m[1] <= end_pos]
     
     # Calculate overall confidence
     if matches_in_range:
@@ -2743,9 +3530,9 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
         avg_confidence = 0.5
     
     # Validate: make sure we have both start and end coverage
-    phrase_indices_covered = set(m[3] for m in matches_in_range)
-    has_start_coverage = 0 in phrase_indices_covered or 1 in phrase_indices_covered
-    has_end_coverage = (len(phrases) - 1) in phrase_indices_covered or (len(phrases) - 2) in phrase_indices_covered
+    phrase_mask_covered = _phrase_mask(matches_in_range)
+    has_start_coverage = bool(phrase_mask_covered & _START_PHRASE_MASK)
+    has_end_coverage = bool(phrase_mask_covered & end_phrase_mask)
     
     if not has_start_coverage and not has_end_coverage:
         # We might have only middle matches, which is unreliable
@@ -2785,12 +3572,72 @@ def find_quote_boundaries_improved(verse_text: str, transcript: str, ref_positio
     return (start_pos, end_pos, avg_confidence)
 
 
-def _evaluate_match_significance(matches: list, phrases: list) -> dict:
+# Phrase indices 0 and 1 are the verse opening
+_START_PHRASE_MASK = 0b11
+
+
+def _phrase_mask(matches: list) -> int:
+    """Bitmask of the phrase indices covered by a list of match tuples."""
+    mask = 0
+    for m in matches:
+        mask |= 1 << m[3]
+    return mask
+
+
+def _end_phrase_mask(phrase_count: int) -> int:
+    """Bitmask of the last two phrase indices (just index 0 for a single phrase)."""
+    return (0b11 << phrase_count) >> 2
+
+
+def _build_clusters(matches: list, transcript: str, verse_text: str,
+                    max_gap: int, min_gap_to_validate: int) -> List[list]:
+    """
+    Group position-sorted matches into clusters of contiguous verse text.
+    
+    A new cluster starts when the gap to the previous match exceeds max_gap,
+    or when a gap longer than min_gap_to_validate contains commentary.
+    """
+    clusters = []
+    current_cluster = [matches[0]]
+    prev_end = matches[0][1]
+    
+    for match in islice(matches, 1, None):
+        gap_size = match[0] - prev_end
+        
+        if gap_size > max_gap or (
+                gap_size > min_gap_to_validate and
+                not validate_gap_is_verse_content(transcript[prev_end:match[0]], verse_text)):
+            # Gap too large or contains commentary - start new cluster
+            clusters.append(current_cluster)
+            current_cluster = [match]
+        else:
+            current_cluster.append(match)
+        prev_end = match[1]
+    
+    clusters.append(current_cluster)  # Add the last cluster
+    return clusters
+
+
+@lru_cache(maxsize=8192)
+def _significance_from_mask(phrase_mask: int, phrase_count: int) -> Tuple[bool, bool, float]:
+    """
+    (has_start, has_end, phrase_coverage) for a set of covered phrase indices.
+    Cached, since the same coverage shapes recur across a transcript's references.
+    """
+    has_start = bool(phrase_mask & _START_PHRASE_MASK)
+    has_end = bool(phrase_mask & _end_phrase_mask(phrase_count))
+    
+    # Calculate phrase coverage
+    phrase_coverage = phrase_mask.bit_count() / phrase_count if phrase_count else 0.0
+    return has_start, has_end, phrase_coverage
+
+
+def _evaluate_match_significance(matches: list, phrases: Tuple[Tuple[str, ...], ...]) -> dict:
     """
     Evaluate whether a set of matches is significant enough to represent a valid quote.
     
     Args:
-        matches: List of match tuples (start, end, score, phrase_idx, direction)
+        matches: List of match tuples (start, end, score, phrase_idx)
         phrases: List of distinctive phrases from the verse
     
     Returns:
@@ -2805,12 +3652,8 @@ def _evaluate_match_significance(matches: list, phrases: list) -> dict:
             'phrase_coverage': 0.0
         }
     
-    phrase_indices = set(m[3] for m in matches)
-    has_start = 0 in phrase_indices or 1 in phrase_indices
-    has_end = (len(phrases) - 1) in phrase_indices or (len(phrases) - 2) in phrase_indices
-    
-    # Calculate phrase coverage
-    phrase_coverage = len(phrase_indices) / len(phrases) if phrases else 0.0
+    has_start, has_end, phrase_coverage = _significance_from_mask(
+        _phrase_mask(matches), len(phrases))
     
     # A match set is significant if:
     # 1. Has 3+ matches, OR
@@ -2834,69 +3677,125 @@ def _evaluate_match_significance(matches: list, phrases: list) -> dict:
 # PARTIAL VERSE RANGE DETECTION
 # ============================================================================
 
-def fetch_verse_range_individual(api_client: BibleAPIClient, book: str, chapter: int, 
-                                  start_verse: int, end_verse: int) -> Dict[int, str]:
+def _post_verse_ranges(api_client: BibleAPIClient, payload: List[dict]) -> Optional[list]:
+    """POST one get-verses payload; returns the per-entry verse lists, or None on a non-200 reply."""
+    # Use POST endpoint for fetching specific verses
+    url = f"{BIBLE_API_BASE}/get-verses/"
+    
+    api_client._rate_limit()
+    response = api_client.session.post(url, json=payload, timeout=(API_CONNECT_TIMEOUT, 15))
+    
+    if response.status_code == 200:
+        return response.json()
+    return None
+
+
+def fetch_many_verse_ranges(api_client: BibleAPIClient,
+                            ranges: List[Tuple[str, int, int, int]]) -> List[Dict[int, str]]:
     """
-    Fetch individual verses in a range for precise matching.
+    Fetch the individual verses of several ranges with a single bulk request.
     
-    When a speaker announces a verse range but only reads part of it,
-    we need to detect which specific verses actually appear in the transcript.
+    The get-verses endpoint takes a list of (book, chapter, verses) entries
+    and answers with one verse list per entry, so all ranges of a sermon
+    cost one round-trip instead of one each. Batches larger than
+    MAX_RANGES_PER_REQUEST are split and the chunks fetched concurrently.
     
     Args:
-        api_client: BibleAPIClient instance
-        book: Book name (e.g., "Matthew")
-        chapter: Chapter number
-        start_verse: First verse in range
-        end_verse: Last verse in range
+        api_client: BibleAPIClient instance (its translation is used)
+        ranges: (book, chapter, start_verse, end_verse) tuples
+    
+    Ranges already in the client's range cache (fetched earlier, or loaded
+    from its cache file) are answered without a request.
     
     Returns:
-        Dict mapping verse number to verse text
+        One dict mapping verse number to verse text per input range, in order
+        (empty for unknown books or failed lookups)
     """
-    verses = {}
+    results: List[Dict[int, str]] = [{} for _ in ranges]
+    range_cache = api_client._verse_range_cache
     
     # Use the bulk API for efficiency
-    book_id = BOOK_ID_MAP.get(book)
-    if not book_id:
-        print(f"  ⚠ Unknown book: {book}")
-        return verses
-    
-    try:
-        # Use POST endpoint for fetching specific verses
-        url = f"{BIBLE_API_BASE}/get-verses/"
-        payload = [{
+    payload = []
+    payload_slots = []  # Index into ranges for each payload entry
+    payload_keys = []  # Range cache key for each payload entry
+    for slot, (book, chapter, start_verse, end_verse) in enumerate(ranges):
+        book_id = BOOK_ID_MAP.get(book)
+        if not book_id:
+            print(f"  ⚠ Unknown book: {book}")
+            continue
+        cache_key = (api_client.translation, book_id, chapter, start_verse, end_verse)
+        cached = range_cache.get(cache_key)
+        if cached is not None:
+            results[slot] = dict(cached)
+            continue
+        payload.append({
             'translation': api_client.translation,
             'book': book_id,
             'chapter': chapter,
-            'verses': list(range(start_verse, end_verse + 1))
-        }]
-        
-        api_client._rate_limit()
-        response = requests.post(url, json=payload, timeout=15)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data and len(data) > 0:
-                for verse_data in data[0]:
-                    verse_num = verse_data.get('verse')
-                    verse_text = verse_data.get('text', '')
-                    if verse_num and verse_text:
-                        verses[verse_num] = api_client._clean_html(verse_text)
-    except requests.RequestException as e:
-        print(f"  ⚠ Request error for {book} {chapter}:{start_verse}-{end_verse}: {e}")
-        # Fallback: fetch individually
-        for verse_num in range(start_verse, end_verse + 1):
-            ref = f"{book} {chapter}:{verse_num}"
-            result = api_client.get_verse(ref)
-            if result and 'text' in result:
-                verses[verse_num] = result['text'].strip()
-    
-    return verses
+            'verses': _verse_numbers(start_verse, end_verse)
+        })
+        payload_slots.append(slot)
+        payload_keys.append(cache_key)
+    
+    if not payload:
+        return results
+    
+    # Large batches are split into chunks that are posted concurrently; the
+    # client's rate limiter still spaces out when each request starts
+    chunk_starts = range(0, len(payload), MAX_RANGES_PER_REQUEST)
+    workers = min(MAX_CONCURRENT_REQUESTS, len(chunk_starts))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        chunk_replies = [
+            pool.submit(_post_verse_ranges, api_client,
+                        payload[i:i + MAX_RANGES_PER_REQUEST])
+            for i in chunk_starts
+        ]
+    
+    for chunk_start, reply in zip(chunk_starts, chunk_replies):
+        slots = payload_slots[chunk_start:chunk_start + MAX_RANGES_PER_REQUEST]
+        keys = payload_keys[chunk_start:chunk_start + MAX_RANGES_PER_REQUEST]
+        try:
+            data = reply.result()
+        except requests.RequestException as e:
+            for slot in slots:
+                book, chapter, start_verse, end_verse = ranges[slot]
+                print(f"  ⚠ Request error for {book} {chapter}:{start_verse}-{end_verse}: {e}")
+                # Fallback: fetch individually
+                verses = results[slot]
+                for verse_num in range(start_verse, end_verse + 1):
+                    ref = f"{book} {chapter}:{verse_num}"
+                    result = api_client.get_verse(ref)
+                    if result and 'text' in result:
+                        verses[verse_num] = result['text'].strip()
+            continue
+        if not isinstance(data, list):
+            continue
+        for slot, cache_key, entry_data in zip(slots, keys, data):
+            if not isinstance(entry_data, list):
+                continue
+            verses = results[slot]
+            for verse_data in entry_data:
+                if not isinstance(verse_data, dict):
+                    continue
+                verse_num = verse_data.get('verse')
+                verse_text = verse_data.get('text', '')
+                if verse_num and verse_text:
+                    verses[verse_num] = api_client._clean_html(verse_text)
+            # Like get_verse, only cache ranges that came back with text, so
+            # one empty reply doesn't hide the passage on every later run
+            if verses:
+                range_cache[cache_key] = dict(verses)
+                with api_client._cache_lock:
+                    api_client._save_range_cache(cache_key, verses)
+    
+    return results
 
 
 def detect_matching_verse_subset(individual_verses: Dict[int, str], transcript: str, 
                                   search_start: int, search_window: int = 6000,
                                   min_confidence: float = 0.6,
-                                  first_verse_num: Optional[int] = None) -> Tuple[Optional[int], Optional[int], List[Tuple[int, int, int, float]]]:
+                                  first_verse_num: Optional[int] = None,
+                                  index: Optional[TranscriptIndex] = None) -> Tuple[Optional[int], Optional[int], List[Tuple[int, int, int, float]]]:
     """
     Detect which verses from a range actually appear in the transcript.
     
@@ -2915,29 +3814,35 @@ def detect_matching_verse_subset(individual_verses: Dict[int, str], transcript:
                        For extending beyond explicitly referenced verses, use 0.8.
         first_verse_num: The explicitly referenced first verse number. Verses
                         beyond this require higher confidence to prevent false positives.
+        index: Optional prebuilt TranscriptIndex for this transcript
     
     Returns:
         Tuple of (first_matching_verse, last_matching_verse, matches_list)
         where matches_list contains (verse_num, start_pos, end_pos, confidence)
     """
     search_end = min(search_start + search_window, len(transcript))
-    search_area = transcript[search_start:search_end]
     
-    # Find word positions in ORIGINAL text and normalize them for matching
+    # Word positions in the ORIGINAL text, with each word normalized for matching
+    # (taken from the sermon's index when available instead of re-tokenizing)
     # This ensures index consistency between matching and position lookup
-    word_pattern = re.compile(r'\b\w+\b')
-    word_matches_in_area = list(word_pattern.finditer(search_area))
-    
-    # Normalize each word for matching (but keep original positions)
-    search_area_words = [normalize_for_comparison(m.group()) for m in word_matches_in_area]
-    
-    # Common Bible verse connector words that speakers often skip at the start of verses
-    SKIP_WORDS = {'but', 'and', 'for', 'then', 'now', 'so', 'yet', 'or', 'therefore', 'wherefore', 'behold'}
+    word_starts, word_ends, search_area_words = _phrase_search_words(
+        transcript, search_start, search_end, index)
+    
+    # Word ids plus a positional inverted index: anchor windows are scored from
+    # postings instead of sliding over every position for every verse
+    postings = _WordPostings.build(search_area_words)
+    # Fuzzy neighbours of every start-anchor word (the first 8 words cover all
+    # anchor candidates) and end-anchor word, computed in one batch
+    postings.prime_similar(
+        w for verse_text in individual_verses.values()
+        for verse_words in (_verse_words(verse_text),) if len(verse_words) >= 3
+        for w in verse_words[:8] + verse_words[-5:]
+    )
     
     matches = []
     
     for verse_num, verse_text in sorted(individual_verses.items()):
-        verse_words = get_words(verse_text)
+        verse_words = _verse_words(verse_text)
         
         if len(verse_words) < 3:
             continue
@@ -2973,6 +3878,14 @@ def detect_matching_verse_subset(individual_verses: Dict[int, str], transcript:
                 if len(verse_words) > anchor_size + 1 and verse_words[1] in SKIP_WORDS:
                     anchor_candidates.append(verse_words[2:2 + anchor_size])
         
+        # Determine the confidence threshold for this verse
+        # Use the base min_confidence for the first (explicitly referenced) verse,
+        # but require higher confidence (0.8) for subsequent verses to prevent
+        # false positives from common phrases like "and the LORD God"
+        required_confidence = min_confidence
+        if first_verse_num is not None and verse_num > first_verse_num:
+            required_confidence = max(min_confidence, 0.8)  # At least 80% for extensions
+        
         # Search for any anchor candidate in search area words
         # Stop searching once we find a good match (>= 0.6) with an earlier anchor
         best_match_idx = None
@@ -2984,44 +3897,30 @@ def detect_matching_verse_subset(individual_verses: Dict[int, str], transcript:
             if found_with_preferred_anchor:
                 break
                 
-            for i in range(len(search_area_words) - len(anchor_words) + 1):
-                window = search_area_words[i:i + len(anchor_words)]
-                
-                # Count matching words with fuzzy matching
-                matches_count = 0
-                for anchor_word, window_word in zip(anchor_words, window):
-                    if anchor_word == window_word:
-                        matches_count += 1
-                    elif len(anchor_word) > 3 and len(window_word) > 3:
-                        if difflib.SequenceMatcher(None, anchor_word, window_word).ratio() > 0.8:
-                            matches_count += 0.8
-                
-                score = matches_count / len(anchor_words)
-                
-                # Determine the confidence threshold for this verse
-                # Use the base min_confidence for the first (explicitly referenced) verse,
-                # but require higher confidence (0.8) for subsequent verses to prevent
-                # false positives from common phrases like "and the LORD God"
-                required_confidence = min_confidence
-                if first_verse_num is not None and verse_num > first_verse_num:
-                    required_confidence = max(min_confidence, 0.8)  # At least 80% for extensions
+            anchor_len = len(anchor_words)
+            # A preferred anchor is a skip-word anchor when the first word is a skip word
+            is_preferred_anchor = first_is_skip and anchor_idx < len(anchor_candidates) - 1
+            
+            # Windows without a single (fuzzy) word match score 0 and can never
+            # be selected, so only windows with postings hits are visited
+            window_matches = postings.window_matches(
+                anchor_words, len(search_area_words) - anchor_len + 1)
+            
+            for i in sorted(window_matches):
+                score = window_matches[i] / anchor_len
                 
                 if score > best_match_score and score >= required_confidence:
                     best_match_score = score
                     best_match_idx = i
-                    # If this is a preferred anchor (skip-word anchor when first word is skip),
-                    # mark that we found a match so we stop looking at later anchors
-                    if first_is_skip and anchor_idx < len(anchor_candidates) - 1:
+                    # If this is a preferred anchor, mark that we found a match
+                    # so we stop looking at later anchors
+                    if is_preferred_anchor:
                         found_with_preferred_anchor = True
         
         # Also apply the confidence threshold when deciding if we found a match
-        required_confidence = min_confidence
-        if first_verse_num is not None and verse_num > first_verse_num:
-            required_confidence = max(min_confidence, 0.8)
-        
         if best_match_idx is not None and best_match_score >= required_confidence:
             # Get character position from word match (indices are now consistent)
-            char_start = word_matches_in_area[best_match_idx].start()
+            abs_start = word_starts[best_match_idx]
             
             # For the end position, try to match the last words of the verse
             end_anchor_size = min(5, len(verse_words))
@@ -3033,33 +3932,23 @@ def detect_matching_verse_subset(individual_verses: Dict[int, str], transcript:
             search_range_start = best_match_idx + max(0, len(verse_words) - end_anchor_size - 10)
             search_range_end = min(best_match_idx + len(verse_words) + 15, len(search_area_words) - end_anchor_size + 1)
             
-            for j in range(search_range_start, search_range_end):
-                window = search_area_words[j:j + end_anchor_size]
-                
-                # Count matching words
-                end_matches = 0
-                for end_anchor, win_word in zip(end_anchor_words, window):
-                    if end_anchor == win_word:
-                        end_matches += 1
-                    elif len(end_anchor) > 3 and len(win_word) > 3:
-                        if difflib.SequenceMatcher(None, end_anchor, win_word).ratio() > 0.8:
-                            end_matches += 0.8
-                
-                end_score = end_matches / end_anchor_size
+            # Score the end windows from the same postings as the start anchors
+            # (exact match 1, fuzzy match 0.8); windows without hits score 0
+            end_window_matches = postings.window_matches(
+                end_anchor_words, search_range_end, first_window=search_range_start)
+            
+            for j in sorted(end_window_matches):
+                end_score = end_window_matches[j] / end_anchor_size
                 if end_score > best_end_score and end_score >= 0.5:
                     best_end_score = end_score
                     best_end_idx = j + end_anchor_size - 1
             
             if best_end_idx is not None:
-                char_end = word_matches_in_area[best_end_idx].end()
+                abs_end = word_ends[best_end_idx]
             else:
                 # Fallback: estimate end based on verse length
-                estimated_end_word_idx = min(best_match_idx + len(verse_words), len(word_matches_in_area) - 1)
-                char_end = word_matches_in_area[estimated_end_word_idx].end()
-            
-            # Convert to absolute positions
-            abs_start = search_start + char_start
-            abs_end = search_start + char_end
+                estimated_end_word_idx = min(best_match_idx + len(verse_words), len(word_ends) - 1)
+                abs_end = word_ends[estimated_end_word_idx]
             
             matches.append((verse_num, abs_start, abs_end, best_match_score))
     
@@ -3067,31 +3956,27 @@ def detect_matching_verse_subset(individual_verses: Dict[int, str], transcript:
         return (None, None, [])
     
     # Sort matches by position
-    matches.sort(key=lambda x: x[1])
+    matches.sort(key=operator.itemgetter(1))
     
     # Filter for contiguity - remove matches that are too far from the previous match
     # This prevents false positives where similar phrases appear much later in the text
     MAX_GAP_BETWEEN_VERSES = 500  # Maximum characters between end of one verse and start of next
-    filtered_matches = []
-    for match in matches:
-        verse_num, start_pos, end_pos, score = match
-        if filtered_matches:
-            prev_verse_num, prev_start, prev_end, prev_score = filtered_matches[-1]
-            gap = start_pos - prev_end
-            if gap > MAX_GAP_BETWEEN_VERSES:
-                # This match is too far from the previous one - likely a false positive
-                # Skip it
-                continue
+    filtered_matches = [matches[0]]
+    prev_end = matches[0][2]  # End of the last kept match
+    for match in islice(matches, 1, None):
+        if match[1] - prev_end > MAX_GAP_BETWEEN_VERSES:
+            # This match is too far from the previous one - likely a false positive
+            # Skip it
+            continue
         filtered_matches.append(match)
+        prev_end = match[2]
     
     matches = filtered_matches
     
-    if not matches:
-        return (None, None, [])
-    
     # Determine the actual verse range that appears
-    first_verse = min(m[0] for m in matches)
-    last_verse = max(m[0] for m in matches)
+    verse_nums = [m[0] for m in matches]
+    first_verse = min(verse_nums)
+    last_verse = max(verse_nums)
     
     return (first_verse, last_verse, matches)
 
@@ -3112,12 +3997,9 @@ def build_composite_verse_text(individual_verses: Dict[int, str],
     if first_verse is None or last_verse is None:
         return ''
     
-    texts = []
-    for verse_num in range(first_verse, last_verse + 1):
-        if verse_num in individual_verses:
-            texts.append(individual_verses[verse_num])
-    
-    return ' '.join(texts)
+    return ' '.join(individual_verses[verse_num]
+                    for verse_num in range(first_verse, last_verse + 1)
+                    if verse_num in individual_verses)
 
 
 def find_quote_boundaries_with_subset(individual_verses: Dict[int, str], matches: List[Tuple[int, int, int, float]], 
@@ -3155,6 +4037,24 @@ def find_quote_boundaries_with_subset(individual_verses: Dict[int, str], matches
     return (start_pos, end_pos, avg_confidence)
 
 
+# Common verse-initial words in Bible, each alternative capturing where the
+# reading starts:
+# - Sentence-initial "And", "But", "Then", "Now", "For", "Behold"
+# - Sentence starts after common phrases like "verse 1."
+_VERSE_STARTER_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'\.\s+(And\s+(?:he|she|they|it|when|lo|behold))',
+    r'\.\s+(But\s+(?:he|she|they|it|when))',
+    r'\.\s+(Then\s+(?:he|she|they|Herod|Jesus))',
+    r'\.\s+(Now\s+(?:when|there|it|this))',
+    r'\.\s+(For\s+(?:he|she|they|unto|thus|the|God))',
+    r'\.\s+(Behold)',
+    r'\.\s+(When\s+(?:he|she|they|Jesus))',
+    r'\.\s+(Wherefore)',
+    r'\.\s+(Unto\s+(?:us|them|him|her|you))',
+    r'verse\s+\d+\.\s+(\w)',  # After "verse 1." etc.
+]), re.IGNORECASE)
+
+
 def extend_quote_start_backward(text: str, quote_start: int, ref_position: int) -> int:
     """
     Extend quote start backward to capture paraphrased introductory text.
@@ -3177,39 +4077,18 @@ def extend_quote_start_backward(text: str, quote_start: int, ref_position: int)
     # Get the text between reference and quote start
     bridge_text = text[search_start:quote_start]
     
-    # Common patterns that indicate reading/quoting has started:
-    # - Sentence starts after common phrases like "verse 1."
-    # - Sentence-initial "And", "But", "Then", "Now", "For", "Behold"
-    
-    # Look for the last sentence start that could be the quote beginning
-    # Common verse-initial words in Bible
-    verse_starters = [
-        r'\.\s+(And\s+(?:he|she|they|it|when|lo|behold))',
-        r'\.\s+(But\s+(?:he|she|they|it|when))',
-        r'\.\s+(Then\s+(?:he|she|they|Herod|Jesus))',
-        r'\.\s+(Now\s+(?:when|there|it|this))',
-        r'\.\s+(For\s+(?:he|she|they|unto|thus|the|God))',
-        r'\.\s+(Behold)',
-        r'\.\s+(When\s+(?:he|she|they|Jesus))',
-        r'\.\s+(Wherefore)',
-        r'\.\s+(Unto\s+(?:us|them|him|her|you))',
-        r'verse\s+\d+\.\s+(\w)',  # After "verse 1." etc.
-    ]
-    
-    best_extension_pos = quote_start
-    
-    for pattern in verse_starters:
-        for match in re.finditer(pattern, bridge_text, re.IGNORECASE):
-            # Calculate absolute position
-            match_start = search_start + match.start(1) if match.lastindex else search_start + match.start()
-            
-            # Only extend if this position is closer to ref_position but still before quote_start
-            if match_start < best_extension_pos and match_start >= search_start:
-                # Make sure there's actual content and it's not too far
-                if quote_start - match_start < 200:  # Max 200 chars of paraphrase
-                    best_extension_pos = match_start
+    # Look for the earliest sentence start that could be the quote beginning.
+    # No alternative can begin inside another's match, so one left-to-right
+    # scan sees every candidate start, in increasing order.
+    for match in _VERSE_STARTER_RE.finditer(bridge_text):
+        # Calculate absolute position
+        match_start = search_start + match.start(match.lastindex)
+        
+        # Make sure there's actual content and it's not too far
+        if quote_start - match_start < 200:  # Max 200 chars of paraphrase
+            return match_start
     
-    return best_extension_pos
+    return quote_start
 
 
 # ============================================================================
@@ -3217,6 +4096,98 @@ def extend_quote_start_backward(text: str, quote_start: int, ref_position: int)
 # ============================================================================
 
 
+@lru_cache(maxsize=4096)
+def _lcs_bit_rows(chunk_words: Tuple[str, ...], verse_words: Tuple[str, ...]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Bit-parallel LCS table of chunk_words against verse_words, cached: the
+    same verse is aligned against the same transcript chunks each time a
+    transcript is reprocessed.
+    
+    Returns (match_masks, rows): bit j of match_masks[i] says whether
+    chunk_words[i] fuzzy-matches verse_words[j], and rows[i] is row i of the
+    LCS table as one m-bit integer whose zero bits mark the columns where the
+    row's LCS length steps up, so
+    dp[i][j] = j - popcount(rows[i] & ((1 << j) - 1)).
+    One row update is a handful of big-int operations instead of m
+    interpreted steps.
+    """
+    m = len(verse_words)
+
+    # Fuzzy word matching is evaluated once per distinct (chunk word, verse word) pair
+    verse_vocab = list(dict.fromkeys(verse_words))
+    masks_by_word: Dict[str, int] = {}
+    for word in chunk_words:
+        if word not in masks_by_word:
+            matching = _fuzzy_partners(word, verse_vocab)
+            mask = 0
+            for j, verse_word in enumerate(verse_words):
+                if verse_word in matching:
+                    mask |= 1 << j
+            masks_by_word[word] = mask
+    match_masks = tuple(masks_by_word[word] for word in chunk_words)
+
+    full = (1 << m) - 1
+    rows = [full]
+    row = full
+    for mask in match_masks:
+        matched = row & mask
+        row = ((row + matched) | (row - matched)) & full
+        rows.append(row)
+    return match_masks, tuple(rows)
+
+
+def _in_order_hits(chunk_words: List[str], exact_positions: Dict[str, Sequence[int]]) -> int:
+    """
+    Lower bound on the LCS length: chunk words found in order in the verse by
+    exact lookup, taking the earliest position after the previous hit.
+    
+    Exact matches are fuzzy matches too, so a chunk scoring 0.55 here would
+    align at least as well in _lcs_bit_rows() and can skip it.
+    """
+    hits = 0
+    last = -1
+    for word in chunk_words:
+        positions = exact_positions.get(word)
+        if positions:
+            k = bisect.bisect_right(positions, last)
+            if k < len(positions):
+                last = positions[k]
+                hits += 1
+    return hits
+
+
+def _lcs_ratio(rows: Sequence[int], n: int, m: int) -> float:
+    """LCS length over the chunk length n, from _lcs_bit_rows() rows."""
+    return (m - rows[n].bit_count()) / n if n > 0 else 0.0
+
+
+def _lcs_backtrack(match_masks: Sequence[int], rows: Sequence[int], m: int) -> List[int]:
+    """Chunk word indices on the LCS, from _lcs_bit_rows() output."""
+    # Backtrack to find which chunk indices were aligned. cur tracks
+    # dp[i][j]; dp[i][j - 1] is cur minus one unless bit j - 1 of rows[i] is
+    # set, so only dp[i - 1][j] needs a popcount.
+    aligned: List[int] = []
+    i, j = len(match_masks), m
+    cur = m - rows[i].bit_count()
+    while i > 0 and j > 0:
+        if match_masks[i - 1] >> (j - 1) & 1:
+            aligned.append(i - 1)
+            i -= 1
+            j -= 1
+            cur -= 1
+            continue
+        up = j - (rows[i - 1] & ((1 << j) - 1)).bit_count()
+        left = cur - 1 + (rows[i] >> (j - 1) & 1)
+        if up >= left:
+            i -= 1
+            cur = up
+        else:
+            j -= 1
+            cur = left
+    aligned.reverse()
+    return aligned
+
+
 def compute_sequential_alignment(
     chunk_words: List[str],
     verse_words: List[str],
@@ -3246,50 +4217,19 @@ def compute_sequential_alignment(
         return (0.0, [], [])
 
     n = len(chunk_words)
-    m = len(verse_words)
-
-    # Build LCS table using fuzzy word matching
-    # dp[i][j] = length of LCS of chunk_words[:i] and verse_words[:j]
-    dp = [[0] * (m + 1) for _ in range(n + 1)]
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            if _words_match_fuzzy(chunk_words[i - 1], verse_words[j - 1]):
-                dp[i][j] = dp[i - 1][j - 1] + 1
-            else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-
-    lcs_length = dp[n][m]
-    alignment_ratio = lcs_length / n if n > 0 else 0.0
-
-    # Backtrack to find which chunk indices were aligned
-    aligned: List[int] = []
-    i, j = n, m
-    while i > 0 and j > 0:
-        if _words_match_fuzzy(chunk_words[i - 1], verse_words[j - 1]):
-            aligned.append(i - 1)
-            i -= 1
-            j -= 1
-        elif dp[i - 1][j] >= dp[i][j - 1]:
-            i -= 1
-        else:
-            j -= 1
-    aligned.reverse()
+    match_masks, rows = _lcs_bit_rows(tuple(chunk_words), tuple(verse_words))
+    alignment_ratio = _lcs_ratio(rows, n, len(verse_words))
+    aligned = _lcs_backtrack(match_masks, rows, len(verse_words))
 
     # Extract gap regions — contiguous spans of chunk indices NOT in aligned
+    # (aligned is sorted, so each gap sits between two consecutive entries)
     gap_regions: List[Tuple[int, int]] = []
-    aligned_set = set(aligned)
-    gap_start: Optional[int] = None
-
-    for i in range(n):
-        if i not in aligned_set:
-            if gap_start is None:
-                gap_start = i
-        else:
-            if gap_start is not None:
-                gap_regions.append((gap_start, i))
-                gap_start = None
-
-    if gap_start is not None:
+    gap_start = 0
+    for k in aligned:
+        if k > gap_start:
+            gap_regions.append((gap_start, k))
+        gap_start = k + 1
+    if gap_start < n:
         gap_regions.append((gap_start, n))
 
     return (alignment_ratio, aligned, gap_regions)
@@ -3297,9 +4237,12 @@ def compute_sequential_alignment(
 
 def find_verse_resumption_point(
     remaining_raw_text: str,
-    verse_words: List[str],
+    verse_words: Sequence[str],
     offset: int,
-    min_run_length: int = 3
+    min_run_length: int = 3,
+    verse_positions: Optional[Dict[str, List[int]]] = None,
+    words: Optional[Sequence[str]] = None,
+    word_starts: Optional[Sequence[int]] = None,
 ) -> Optional[int]:
     """
     Find where verse text resumes in the remaining raw text after a commentary block.
@@ -3312,6 +4255,11 @@ def find_verse_resumption_point(
         verse_words: Full ordered verse word list (normalized)
         offset: Absolute position offset to add to returned position
         min_run_length: Minimum consecutive verse word matches to confirm resumption
+        verse_positions: Optional word -> matching verse positions memo, shared
+            across calls with the same verse_words (filled in as words are seen)
+        words, word_starts: Optional pre-tokenized remaining_raw_text (normalized
+            _WORD_RE words and their start positions in remaining_raw_text), so
+            a caller that already tokenized the surrounding text can skip it here
 
     Returns:
         Absolute position in raw text where verse resumes, or None
@@ -3319,48 +4267,90 @@ def find_verse_resumption_point(
     if not remaining_raw_text or not verse_words:
         return None
 
-    # Tokenize remaining text into words with positions
-    word_pattern = re.compile(r'\b\w+\b')
-    word_matches = list(word_pattern.finditer(remaining_raw_text))
+    # Tokenize remaining text into words with positions, lazily: the run is
+    # usually found long before the end of a long commentary block
+    pending: Optional[Iterator[re.Match]] = None
+    if words is None or word_starts is None:
+        pending = _WORD_RE.finditer(remaining_raw_text)
+        words, word_starts = [], []
 
-    if not word_matches:
-        return None
+    remaining_words = words
 
-    remaining_words = [normalize_for_comparison(m.group()) for m in word_matches]
+    # Verse positions matching each distinct remaining word (transcript words
+    # repeat a lot, and each lookup scans the whole verse)
+    if verse_positions is None:
+        verse_positions = {}
 
     # For each starting position in remaining_words, try to find a consecutive run
     # of min_run_length words that match verse_words in order
-    for i in range(len(remaining_words)):
+    i = 0
+    while True:
+        if pending is not None and len(remaining_words) < i + min_run_length:
+            # Keep the next min_run_length words tokenized for the run check
+            for m in islice(pending, max(i + min_run_length - len(remaining_words), 64)):
+                remaining_words.append(_normalize_word(m.group()))
+                word_starts.append(m.start())
+        if i >= len(remaining_words):
+            break
+        word = remaining_words[i]
+
         # Find where this word appears in verse_words
-        for v_start in range(len(verse_words)):
-            if _words_match_fuzzy(remaining_words[i], verse_words[v_start]):
-                # Check if the next min_run_length - 1 words also match consecutively
-                run_length = 1
-                v_idx = v_start + 1
-                r_idx = i + 1
-
-                while (run_length < min_run_length and
-                       r_idx < len(remaining_words) and
-                       v_idx < len(verse_words)):
-                    if _words_match_fuzzy(remaining_words[r_idx], verse_words[v_idx]):
-                        run_length += 1
-                        v_idx += 1
-                        r_idx += 1
-                    elif v_idx + 1 < len(verse_words) and _words_match_fuzzy(remaining_words[r_idx], verse_words[v_idx + 1]):
-                        # Allow skipping one verse word (speaker may skip a word)
-                        run_length += 1
-                        v_idx += 2
-                        r_idx += 1
-                    else:
-                        break
+        starts = verse_positions.get(word)
+        if starts is None:
+            partners = _fuzzy_partners(word, verse_words)
+            starts = verse_positions[word] = [
+                v for v, verse_word in enumerate(verse_words) if verse_word in partners
+            ]
+        for v_start in starts:
+            # Check if the next min_run_length - 1 words also match consecutively
+            run_length = 1
+            v_idx = v_start + 1
+            r_idx = i + 1
+
+            while (run_length < min_run_length and
+                   r_idx < len(remaining_words) and
+                   v_idx < len(verse_words)):
+                if _words_match_fuzzy(remaining_words[r_idx], verse_words[v_idx]):
+                    run_length += 1
+                    v_idx += 1
+                    r_idx += 1
+                elif v_idx + 1 < len(verse_words) and _words_match_fuzzy(remaining_words[r_idx], verse_words[v_idx + 1]):
+                    # Allow skipping one verse word (speaker may skip a word)
+                    run_length += 1
+                    v_idx += 2
+                    r_idx += 1
+                else:
+                    break
 
-                if run_length >= min_run_length:
-                    # Found a consecutive run — return the raw text position
-                    return offset + word_matches[i].start()
+            if run_length >= min_run_length:
+                # Found a consecutive run — return the raw text position
+                return offset + word_starts[i]
+        i += 1
 
     return None
 
-def detect_commentary_blocks(text: str, start_pos: int, end_pos: int, verse_text: str) -> List[Tuple[int, int]]:
+# Sentence end followed by a capitalized word
+_SENTENCE_BOUNDARY_RE = re.compile(r'([.!?])\s+([A-Z])')
+
+# Commentary detection patterns (allow multi-word subjects before "is"), as one
+# alternation so each chunk is scanned once. Every pattern is anchored at the
+# chunk start, so the shared ^\s* is factored out and the "X ..." subject
+# is walked once for all three of its continuations.
+_COMMENTARY_RE = re.compile(r'^\s*(?:' + '|'.join(f'(?:{p})' for p in [
+    # "X is denoting", "X is just another", "X means" (also "This/Which means")
+    r'[A-Za-z]+(?:\s+[A-Za-z]+)*\s+(?:is\s+(?:denoting|just\s+another)|means)\b',
+    r'[Tt]hat\s+is\b',                                 # "That is"
+    r'[Ii]n\s+other\s+words\b',                        # "In other words"
+    # Speaker attribution and commentary lead-ins
+    r'(?:[Ss]o\s+)?(?:Paul|he|she|the\s+apostle|the\s+author)\s+(?:says|writes|said|wrote)\b',
+    r'(?:Is|Are|Was|Were|Do|Does|Did|Can|Could|Should)\s+(?:there|we|you|they|it)\b.*\?',
+    r"(?:So|Now|See|Look|Notice)\s*,?\s+(?:he|she|Paul|we|I|you)\b",
+    r"I(?:'m| am)\s+(?:not\s+)?(?:here|just|simply)\b",
+]) + ')')
+
+
+def detect_commentary_blocks(text: str, start_pos: int, end_pos: int, verse_text: str,
+                             quote_text: Optional[str] = None) -> List[Tuple[int, int]]:
     """
     Detect commentary blocks within a quote boundary.
     
@@ -3376,43 +4366,36 @@ def detect_commentary_blocks(text: str, start_pos: int, end_pos: int, verse_text
         start_pos: Start of quote
         end_pos: End of quote
         verse_text: The verse text being quoted
+        quote_text: text[start_pos:end_pos], if the caller already sliced it
     
     Returns:
         List of (start, end) positions of commentary blocks
     """
-    quote_text = text[start_pos:end_pos]
+    if quote_text is None:
+        quote_text = text[start_pos:end_pos]
     commentary_blocks = []
     
+    # Ordered words for sequential matching, their set for fast lookups and
+    # each word's positions, cached per verse
+    verse_words_list, verse_words_set, exact_positions = _verse_index(verse_text)
+    verse_positions: Dict[str, List[int]] = {}  # Shared resumption-point memo
+    
     # Look for sentence boundaries within the quote
     # Commentary typically starts after a sentence end and doesn't match verse text
-    sentence_pattern = re.compile(r'([.!?])\s+([A-Z])')
-    
-    verse_words_list = get_words(verse_text)   # Ordered list for sequential matching
-    verse_words_set = set(verse_words_list)     # Set for fast lookups
-    
-    # Find potential sentence boundaries
     boundaries = []
-    for match in sentence_pattern.finditer(quote_text):
+    for match in _SENTENCE_BOUNDARY_RE.finditer(quote_text):
         boundaries.append(match.start() + 1)  # Position after the punctuation
     
     if not boundaries:
         return []
     
-    # Commentary detection patterns (allow multi-word subjects before "is")
-    COMMENTARY_PATTERNS = [
-        r'^\s*[A-Za-z]+(?:\s+[A-Za-z]+)*\s+is\s+denoting\b',  # "X is denoting"
-        r'^\s*[A-Za-z]+(?:\s+[A-Za-z]+)*\s+is\s+just\s+another\b',  # "X is just another"
-        r'^\s*[A-Za-z]+(?:\s+[A-Za-z]+)*\s+means\b',          # "X means"
-        r'^\s*[Tt]hat\s+is\b',                                 # "That is"
-        r'^\s*[Tt]his\s+means\b',                              # "This means"
-        r'^\s*[Ii]n\s+other\s+words\b',                        # "In other words"
-        r'^\s*[Ww]hich\s+means\b',                             # "Which means"
-        # Speaker attribution and commentary lead-ins
-        r'^\s*(?:[Ss]o\s+)?(?:Paul|he|she|the\s+apostle|the\s+author)\s+(?:says|writes|said|wrote)\b',
-        r'^\s*(?:Is|Are|Was|Were|Do|Does|Did|Can|Could|Should)\s+(?:there|we|you|they|it)\b.*\?',
-        r"^\s*(?:So|Now|See|Look|Notice)\s*,?\s+(?:he|she|Paul|we|I|you)\b",
-        r"^\s*I(?:'m| am)\s+(?:not\s+)?(?:here|just|simply)\b",
-    ]
+    # Tokenize the quote once; each boundary takes its chunk words from here
+    # instead of re-tokenizing overlapping slices
+    token_matches = list(_TOKEN_RE.finditer(quote_text))
+    token_starts = [m.start() for m in token_matches]
+    # _WORD_RE words for find_verse_resumption_point(), built on first use
+    resume_words: Optional[List[str]] = None
+    resume_starts: List[int] = []
     
     # Track position to skip over already-detected commentary blocks
     skip_until = 0
@@ -3433,20 +4416,23 @@ def detect_commentary_blocks(text: str, start_pos: int, end_pos: int, verse_text
             continue
         
         # Check for commentary patterns (explicit regex patterns first)
-        is_commentary = False
-        
-        for pattern in COMMENTARY_PATTERNS:
-            if re.search(pattern, chunk):
-                is_commentary = True
-                break
+        is_commentary = _COMMENTARY_RE.search(chunk) is not None
         
         if not is_commentary:
             # Sequential alignment check (order-aware, fixes Bugs 2 & 3)
-            chunk_words = get_words(chunk[:150])
-            if len(chunk_words) >= 5:
-                alignment_ratio, aligned_indices, gap_regions = compute_sequential_alignment(
-                    chunk_words, verse_words_list
-                )
+            chunk_words = []
+            for m in islice(token_matches, bisect.bisect_left(token_starts, boundary_pos), None):
+                if m.start() >= chunk_end:
+                    break
+                if m.end() <= chunk_end:
+                    chunk_words.append(_fold_text(m.group()))
+                else:
+                    # Token cut off at the chunk end: take just the part inside it
+                    chunk_words.extend(get_words(quote_text[m.start():chunk_end]))
+            if len(chunk_words) >= 5 and _in_order_hits(chunk_words, exact_positions) / len(chunk_words) < 0.55:
+                # Only the LCS length is needed unless the chunk is flagged
+                match_masks, lcs_rows = _lcs_bit_rows(tuple(chunk_words), verse_words_list)
+                alignment_ratio = _lcs_ratio(lcs_rows, len(chunk_words), len(verse_words_list))
                 
                 # Primary check: low sequential alignment → commentary
                 if alignment_ratio < 0.35:
@@ -3466,6 +4452,8 @@ def detect_commentary_blocks(text: str, start_pos: int, end_pos: int, verse_text
                 # sentence break (e.g., after an interjection like "who?").
                 # Cancel the commentary flag — the actual commentary will be
                 # caught at the next sentence boundary within this chunk.
+                aligned_indices = (_lcs_backtrack(match_masks, lcs_rows, len(verse_words_list))
+                                   if is_commentary else [])
                 if is_commentary and aligned_indices:
                     aligned_set = set(aligned_indices)
                     leading_aligned = 0
@@ -3496,11 +4484,21 @@ def detect_commentary_blocks(text: str, start_pos: int, end_pos: int, verse_text
             remaining_text = quote_text[boundary_pos:]
             commentary_end = end_pos  # Default to end of quote
             
+            if resume_words is None:
+                word_matches = list(_WORD_RE.finditer(quote_text))
+                resume_words = [_normalize_word(m.group()) for m in word_matches]
+                resume_starts = [m.start() for m in word_matches]
+            # No word straddles the boundary (it follows sentence punctuation)
+            first_word = bisect.bisect_left(resume_starts, boundary_pos)
+            
             resumption_pos = find_verse_resumption_point(
                 remaining_text,
                 verse_words_list,
                 offset=start_pos + boundary_pos,
-                min_run_length=5
+                min_run_length=5,
+                verse_positions=verse_positions,
+                words=resume_words[first_word:],
+                word_starts=[pos - boundary_pos for pos in resume_starts[first_word:]],
             )
             
             if resumption_pos is not None and resumption_pos > commentary_start + 50:
@@ -3526,7 +4524,8 @@ def detect_commentary_blocks(text: str, start_pos: int, end_pos: int, verse_text
     return merged
 
 
-def detect_interjections(text: str, start_pos: int, end_pos: int) -> List[Tuple[int, int]]:
+def detect_interjections(text: str, start_pos: int, end_pos: int,
+                         quote_text: Optional[str] = None) -> List[Tuple[int, int]]:
     """
     Detect interjections within a quote boundary.
     
@@ -3534,26 +4533,30 @@ def detect_interjections(text: str, start_pos: int, end_pos: int) -> List[Tuple[
         text: Full transcript text
         start_pos: Start of quote
         end_pos: End of quote
+        quote_text: text[start_pos:end_pos], if the caller already sliced it
     
     Returns:
         List of (start, end) positions of interjections
     """
-    quote_text = text[start_pos:end_pos]
+    if quote_text is None:
+        quote_text = text[start_pos:end_pos]
     interjections = []
     
-    for pattern in INTERJECTION_PATTERNS:
-        for match in re.finditer(pattern, quote_text, re.IGNORECASE):
-            # Get absolute positions
-            inter_start = start_pos + match.start()
-            inter_end = start_pos + match.end()
-            
-            # Expand to include surrounding spaces/punctuation
-            while inter_start > start_pos and text[inter_start - 1] in ' \t':
-                inter_start -= 1
-            while inter_end < end_pos and text[inter_end] in ' \t':
-                inter_end += 1
-            
-            interjections.append((inter_start, inter_end))
+    # Every pattern ends at the first '?' after its start, so any match the
+    # combined scan steps over lies inside one it reports; the merged spans
+    # are the same as scanning each pattern separately
+    for match in _INTERJECTION_RE.finditer(quote_text):
+        # Get absolute positions
+        inter_start = start_pos + match.start()
+        inter_end = start_pos + match.end()
+        
+        # Expand to include surrounding spaces/punctuation
+        while inter_start > start_pos and text[inter_start - 1] in ' \t':
+            inter_start -= 1
+        while inter_end < end_pos and text[inter_end] in ' \t':
+            inter_end += 1
+        
+        interjections.append((inter_start, inter_end))
     
     # Sort by position and merge overlapping
     interjections.sort()
@@ -3567,6 +4570,45 @@ def detect_interjections(text: str, start_pos: int, end_pos: int) -> List[Tuple[
     return merged
 
 
+def _merge_exclusions(*span_lists: List[Tuple[int, int]], gap: int = 5) -> List[Tuple[int, int]]:
+    """
+    Merge already-sorted span lists into one sorted list, joining spans that
+    overlap or are at most gap characters apart. One pass over the merged
+    stream; nothing is re-sorted.
+    """
+    merged: List[Tuple[int, int]] = []
+    for excl_start, excl_end in heapq.merge(*span_lists):
+        if merged and excl_start <= merged[-1][1] + gap:  # Allow small gap
+            merged[-1] = (merged[-1][0], max(merged[-1][1], excl_end))
+        else:
+            merged.append((excl_start, excl_end))
+    return merged
+
+
+def detect_exclusions(text: str, start_pos: int, end_pos: int, verse_text: str) -> List[Tuple[int, int]]:
+    """
+    Detect interjections and commentary blocks within a quote boundary.
+    
+    Slices the quote once for both detectors.
+    
+    Args:
+        text: Full transcript text
+        start_pos: Start of quote
+        end_pos: End of quote
+        verse_text: The verse text being quoted
+    
+    Returns:
+        Sorted list of (start, end) positions of excluded text: interjections
+        and commentary blocks, with overlapping or nearly adjacent (≤5 chars
+        apart) spans merged
+    """
+    quote_text = text[start_pos:end_pos]
+    # Each detector returns its spans sorted and merged
+    interjections = detect_interjections(text, start_pos, end_pos, quote_text=quote_text)
+    commentary_blocks = detect_commentary_blocks(text, start_pos, end_pos, verse_text, quote_text=quote_text)
+    return _merge_exclusions(interjections, commentary_blocks)
+
+
 def trim_trailing_exclusions(
     text: str,
     start: int,
@@ -3626,7 +4668,8 @@ def trim_trailing_exclusions(
 # PHASE 4: BOUNDARY VERIFICATION
 # ============================================================================
 
-def verify_quote_boundaries(quote: QuoteBoundary, transcript: str, verbose: bool = False) -> QuoteBoundary:
+def verify_quote_boundaries(quote: QuoteBoundary, transcript: str, verbose: bool = False,
+                            index: Optional[TranscriptIndex] = None) -> QuoteBoundary:
     """
     Verify and potentially adjust quote boundaries against the verse text.
     
@@ -3644,6 +4687,7 @@ def verify_quote_boundaries(quote: QuoteBoundary, transcript: str, verbose: bool
         quote: QuoteBoundary object with initial boundaries
         transcript: Full transcript text
         verbose: Whether to print verification details
+        index: Optional prebuilt TranscriptIndex for this transcript
     
     Returns:
         Updated QuoteBoundary with verified positions and adjustment metadata
@@ -3653,7 +4697,7 @@ def verify_quote_boundaries(quote: QuoteBoundary, transcript: str, verbose: bool
     original_end = quote.end_pos
     
     verse_text = quote.verse_text
-    if not verse_text or len(get_words(verse_text)) < 3:
+    if not verse_text or len(_verse_words(verse_text)) < 3:
         # Can't verify without verse text
         quote.boundary_verified = False
         return quote
@@ -3665,7 +4709,7 @@ def verify_quote_boundaries(quote: QuoteBoundary, transcript: str, verbose: bool
     # =========================================================================
     verified_start = validate_start_is_verse_text(
         transcript, original_start, verse_text, 
-        max_search_forward=100, debug=verbose
+        max_search_forward=100, debug=verbose, index=index
     )
     
     # =========================================================================
@@ -3674,18 +4718,18 @@ def verify_quote_boundaries(quote: QuoteBoundary, transcript: str, verbose: bool
     # First try to find actual verse end
     verse_end_pos = find_verse_end_in_transcript(
         transcript, verified_start, verse_text, 
-        max_search=1500, debug=verbose
+        max_search=1500, debug=verbose, index=index
     )
     
     verified_end = original_end
     if verse_end_pos and verse_end_pos > verified_start:
         # Validate the extension contains verse words
-        verse_words_set = set(get_words(verse_text))
+        verse_words_set = _verse_index(verse_text)[1]
         extension_text = transcript[original_end:verse_end_pos]
         extension_words = get_words(extension_text)
         
         if extension_words:
-            extension_matches = sum(1 for w in extension_words if w in verse_words_set)
+            extension_matches = len([w for w in extension_words if w in verse_words_set])
             extension_ratio = extension_matches / len(extension_words)
             
             if extension_ratio >= 0.5:
@@ -3766,11 +4810,56 @@ def process_transcript(input_file: str, output_file: Optional[str] = None, trans
     if output_file:
         print(f"\n💾 Saving processed transcript to: {output_file}")
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(processed_text)
+            # Written in slices so only one slice's UTF-8 encoding is held
+            # in memory at a time, not a copy of the whole transcript
+            for i in range(0, len(processed_text), OUTPUT_WRITE_CHUNK):
+                f.write(processed_text[i:i + OUTPUT_WRITE_CHUNK])
     
     return processed_text
+
+
+def _build_quote(text: str, ref: BibleReference, start: int, end: int, confidence: float,
+                 verse_text: str, translation: str, verbose: bool = False,
+                 index: Optional[TranscriptIndex] = None) -> QuoteBoundary:
+    """
+    Build the QuoteBoundary for a quote located at text[start:end].
     
-    return text
+    Detects interjections (short like "a what?") and commentary blocks
+    (longer explanatory sections), trims trailing commentary from the end,
+    then verifies and potentially adjusts the boundaries (Phase 4).
+    """
+    all_exclusions = detect_exclusions(text, start, end, verse_text)
+    
+    # Trim trailing commentary from passage boundary
+    # If the last exclusion extends to end, it's non-verse tail text
+    # that should be in the next paragraph, not an interjection
+    end, all_exclusions = trim_trailing_exclusions(
+        text, start, end, all_exclusions, verbose=verbose
+    )
+    
+    if all_exclusions and verbose:
+        num_inter = len([e for e in all_exclusions if e[1] - e[0] < 30])
+        num_comm = len([e for e in all_exclusions if e[1] - e[0] >= 30])
+        parts = []
+        if num_inter:
+            parts.append(f"{num_inter} interjection(s)")
+        if num_comm:
+            parts.append(f"{num_comm} commentary block(s)")
+        print(f"      ⚠ Found {', '.join(parts)}")
+    
+    quote = QuoteBoundary(
+        start_pos=start,
+        end_pos=end,
+        reference=ref,
+        verse_text=verse_text,
+        confidence=confidence,
+        translation=translation,
+        has_interjection=bool(all_exclusions),
+        interjection_positions=all_exclusions
+    )
+    
+    # PHASE 4: Verify and potentially adjust boundaries
+    return verify_quote_boundaries(quote, text, verbose=verbose, index=index)
 
 
 def process_text(text: str, translation: Optional[str] = None, verbose: bool = True, 
@@ -3809,10 +4898,31 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
     # Save original text for immutability assertion at the end
     _original_input_text = text
     
-    def report_progress(percent: int, message: str):
-        """Helper to report progress via callback."""
-        if progress_callback:
-            progress_callback(percent, message)
+    last_progress_time = None
+    pending_progress = None  # Latest held-back per-reference update
+    
+    def report_progress(percent: int, message: str, throttle: bool = False):
+        """
+        Helper to report progress via callback.
+        
+        Per-reference updates (throttle=True) closer together than
+        PROGRESS_MIN_INTERVAL are held back so a fast run doesn't flood the
+        UI; the latest held-back one is sent ahead of the next phase update.
+        Phase updates are always sent.
+        """
+        nonlocal last_progress_time, pending_progress
+        if not progress_callback:
+            return
+        now = time.monotonic()
+        if throttle:
+            if last_progress_time is not None and now - last_progress_time < PROGRESS_MIN_INTERVAL:
+                pending_progress = (percent, message)
+                return
+        elif pending_progress is not None:
+            progress_callback(*pending_progress)
+        pending_progress = None
+        last_progress_time = now
+        progress_callback(percent, message)
     
     report_progress(0, "Initializing Bible processor...")
     
@@ -3871,6 +4981,8 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                 print(f"      • '{ref.original_text}' → display as '{ref.to_standard_format()}'")
     
     # Phase 3: Fetch Bible verse texts and detect translation PER QUOTE
+    # Tokenize the transcript once; every verse lookup below reuses it
+    transcript_index = TranscriptIndex.build(text)
     # This handles speakers who switch translations mid-sermon
     report_progress(20, "Fetching Bible verses from API...")
     if verbose:
@@ -3882,14 +4994,36 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
     verse_texts = {}
     verse_translations = {}  # Track which translation was used for each verse
     individual_verses_cache = {}
+    # Verse ranges whose individual verses are needed, by translation:
+    # fetched together in one bulk request after the loop
+    pending_ranges: Dict[str, List[Tuple[str, BibleReference]]] = {}
+    # Single-verse references, by translation: the verses after each one are
+    # fetched in the same bulk request, for Phase 4's read-on check
+    pending_continuations: Dict[str, List[Tuple[str, BibleReference]]] = {}
+    continuation_verses: Dict[str, Dict[int, str]] = {}
+    
+    def fetch_reference(ref: BibleReference):
+        """API lookups for one reference (run on a worker thread)."""
+        if not ref.verse_start:
+            return None
+        if per_quote_detection:
+            return detect_translation_for_quote(ref, text, api_client, verbose=False,
+                                                index=transcript_index)
+        return api_client.get_verse(ref.to_api_format())
     
+    # References are fetched concurrently (each is its own network round
+    # trip); the loop below consumes the results in order as they arrive.
+    # Everything is submitted up front, so the pool can be released now.
     total_refs = len(references)
-    for ref_idx, ref in enumerate(references):
+    pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+    fetched_refs = pool.map(fetch_reference, references)
+    pool.shutdown(wait=False)
+    for ref_idx, (ref, fetched_ref) in enumerate(zip(references, fetched_refs)):
         # Report granular progress during Phase 3 (API fetches take time)
         # Phase 3 spans from 20% to 60%, so distribute progress across references
         if total_refs > 0:
             phase3_progress = 20 + int((ref_idx / total_refs) * 40)
-            report_progress(phase3_progress, f"Fetching verse {ref_idx + 1} of {total_refs}...")
+            report_progress(phase3_progress, f"Fetching verse {ref_idx + 1} of {total_refs}...", throttle=True)
         
         if ref.verse_start:
             api_ref = ref.to_api_format()
@@ -3902,9 +5036,7 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                 if verbose:
                     print(f"   {api_ref}: Detecting translation...", end=" ")
                 
-                detected_trans, verse_text, score = detect_translation_for_quote(
-                    ref, text, api_client, verbose=False
-                )
+                detected_trans, verse_text, score = fetched_ref
                 
                 if verse_text:
                     verse_texts[cache_key] = verse_text
@@ -3915,19 +5047,10 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                     # Handle verse ranges - need to fetch individual verses in the detected translation
                     if ref.verse_end and ref.verse_end > ref.verse_start:
                         if verbose:
-                            print(f"      ↳ Fetching individual verses for range detection...")
-                        # Temporarily switch to detected translation for range fetch
-                        original_trans = api_client.translation
-                        api_client.translation = detected_trans
-                        individual = fetch_verse_range_individual(
-                            api_client, ref.book, ref.chapter, 
-                            ref.verse_start, ref.verse_end
-                        )
-                        api_client.translation = original_trans
-                        if individual:
-                            individual_verses_cache[cache_key] = individual
-                            if verbose:
-                                print(f"         Fetched {len(individual)} individual verses")
+                            print(f"      ↳ Queued individual verses for range detection")
+                        pending_ranges.setdefault(detected_trans, []).append((cache_key, ref))
+                    else:
+                        pending_continuations.setdefault(detected_trans, []).append((cache_key, ref))
                 else:
                     if verbose:
                         print("✗ Not found")
@@ -3935,7 +5058,7 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                 # Use fixed translation (original behavior)
                 if verbose:
                     print(f"   Fetching: {api_ref}...", end=" ")
-                result = api_client.get_verse(api_ref)
+                result = fetched_ref
                 if result and 'text' in result:
                     verse_texts[cache_key] = result['text']
                     verse_translations[cache_key] = api_client.translation
@@ -3944,19 +5067,39 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                     
                     if ref.verse_end and ref.verse_end > ref.verse_start:
                         if verbose:
-                            print(f"      ↳ Fetching individual verses for range detection...")
-                        individual = fetch_verse_range_individual(
-                            api_client, ref.book, ref.chapter, 
-                            ref.verse_start, ref.verse_end
-                        )
-                        if individual:
-                            individual_verses_cache[cache_key] = individual
-                            if verbose:
-                                print(f"         Fetched {len(individual)} individual verses")
+                            print(f"      ↳ Queued individual verses for range detection")
+                        pending_ranges.setdefault(api_client.translation, []).append((cache_key, ref))
+                    else:
+                        pending_continuations.setdefault(api_client.translation, []).append((cache_key, ref))
                 else:
                     if verbose:
                         print("✗ Not found")
     
+    # Fetch the individual verses of all announced ranges, and the 10 verses
+    # following each single-verse reference, one bulk request per translation
+    # instead of one request per range (Phase 4 then needs no API calls for them)
+    for range_translation in dict.fromkeys([*pending_ranges, *pending_continuations]):
+        pending = pending_ranges.get(range_translation, [])
+        continuations = pending_continuations.get(range_translation, [])
+        if verbose and pending:
+            print(f"   Fetching individual verses for {len(pending)} range(s) ({range_translation})...")
+        # Temporarily switch to the range's translation for the fetch
+        original_trans = api_client.translation
+        api_client.translation = range_translation
+        fetched = fetch_many_verse_ranges(
+            api_client,
+            [(ref.book, ref.chapter, ref.verse_start, ref.verse_end) for _, ref in pending] +
+            [(ref.book, ref.chapter, ref.verse_start, ref.verse_start + 10) for _, ref in continuations]
+        )
+        api_client.translation = original_trans
+        for (cache_key, ref), individual in zip(pending, fetched):
+            if individual:
+                individual_verses_cache[cache_key] = individual
+                if verbose:
+                    print(f"      {ref.to_api_format()}: fetched {len(individual)} individual verses")
+        for (cache_key, _), subsequent in zip(continuations, fetched[len(pending):]):
+            continuation_verses[cache_key] = subsequent
+    
     # Phase 4: Find quote boundaries
     report_progress(65, "Finding quote boundaries...")
     if verbose:
@@ -3967,7 +5110,7 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
         # Report granular progress during Phase 4 (60% to 85%)
         if total_refs > 0:
             phase4_progress = 65 + int((ref_idx / total_refs) * 20)
-            report_progress(phase4_progress, f"Analyzing quote {ref_idx + 1} of {total_refs}...")
+            report_progress(phase4_progress, f"Analyzing quote {ref_idx + 1} of {total_refs}...", throttle=True)
         
         if ref.verse_start:
             api_ref = ref.to_api_format()
@@ -3983,23 +5126,17 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                 ref_length = len(ref.original_text) if ref.original_text else len(ref.to_standard_format())
                 
                 # Skip past the reference text to avoid matching verse numbers as part of quote
-                result = find_quote_boundaries_improved(verse_text, text, ref.position, ref_length)
+                result = find_quote_boundaries_improved(verse_text, text, ref.position, ref_length, index=transcript_index)
                 
                 # For single-verse references (no verse_end), check if the speaker continues reading
                 # subsequent verses beyond the announced verse. If so, extend the quote boundaries.
                 is_single_verse = ref.verse_end is None or ref.verse_end == ref.verse_start
                 
                 if is_single_verse and result is not None and cache_key not in individual_verses_cache:
-                    # Fetch a few verses after the announced verse to check for continuation
+                    # Check the (up to 10) verses after the announced verse for continuation;
+                    # they were fetched with the Phase 3 bulk request
                     start_verse = ref.verse_start
-                    # Fetch up to 10 subsequent verses to check for multi-verse reading
-                    original_trans = api_client.translation
-                    api_client.translation = detected_translation
-                    subsequent_verses = fetch_verse_range_individual(
-                        api_client, ref.book, ref.chapter, 
-                        start_verse, start_verse + 10
-                    )
-                    api_client.translation = original_trans
+                    subsequent_verses = continuation_verses.get(cache_key, {})
                     
                     if subsequent_verses and len(subsequent_verses) > 1:
                         # Check if subsequent verses appear in the transcript after the initial quote
@@ -4009,7 +5146,8 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                         # Pass first_verse_num to require higher confidence for verses beyond the referenced one
                         first_match, last_match, subset_matches = detect_matching_verse_subset(
                             subsequent_verses, text, ref.position,
-                            first_verse_num=start_verse  # Require 80%+ confidence for extensions
+                            first_verse_num=start_verse,  # Require 80%+ confidence for extensions
+                            index=transcript_index
                         )
                         
                         if subset_matches and last_match and last_match > start_verse:
@@ -4033,7 +5171,7 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                 if cache_key in individual_verses_cache:
                     individual_verses = individual_verses_cache[cache_key]
                     first_match_verse, last_match_verse, subset_matches = detect_matching_verse_subset(
-                        individual_verses, text, ref.position
+                        individual_verses, text, ref.position, index=transcript_index
                     )
                     
                     if subset_matches:
@@ -4058,8 +5196,11 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                                 
                                 if actual_verse_count < expected_verse_count:
                                     # Only use subset if it covers as much or more text than the improved result
-                                    # This prevents shorter false-positive subsets from overriding good results
-                                    if result is None or subset_result[1] >= result[1]:
+                                    # This prevents shorter false-positive subsets from overriding good results.
+                                    # Trailing punctuation doesn't count: an interjection extension ending
+                                    # in "?" must not outweigh the subset that ends on the same word.
+                                    if result is None or (_content_end(text, subset_result[1])
+                                                          >= _content_end(text, result[1])):
                                         use_subset = True
                                         if verbose:
                                             print(f"   {api_ref}: Partial reading: verses {first_match_verse}-{last_match_verse}")
@@ -4071,6 +5212,13 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                                 individual_verses, subset_matches, first_match_verse, last_match_verse
                             )
                             if subset_result:
+                                # On the same last word, keep the punctuation the
+                                # full-range result already included (e.g. a final ".")
+                                if result is not None and (_content_end(text, subset_result[1])
+                                                           == _content_end(text, result[1])):
+                                    subset_result = (subset_result[0],
+                                                     max(subset_result[1], result[1]),
+                                                     subset_result[2])
                                 result = subset_result
                                 verse_text = build_composite_verse_text(
                                     individual_verses, first_match_verse, last_match_verse
@@ -4088,58 +5236,10 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                         trans_info = f" [{detected_translation}]" if per_quote_detection else ""
                         print(f"   {api_ref}{trans_info}: Found at positions {start}-{end} (confidence: {confidence:.2f})")
                     
-                    # Detect interjections (short like "a what?")
-                    interjections = detect_interjections(text, start, end)
-                    
-                    # Detect commentary blocks (longer explanatory sections)
-                    commentary_blocks = detect_commentary_blocks(text, start, end, verse_text)
-                    
-                    # Merge interjections and commentary blocks
-                    all_exclusions = interjections + commentary_blocks
-                    all_exclusions.sort()
-                    
-                    # Merge overlapping exclusions
-                    if all_exclusions:
-                        merged_exclusions = [all_exclusions[0]]
-                        for excl_start, excl_end in all_exclusions[1:]:
-                            if excl_start <= merged_exclusions[-1][1] + 5:  # Allow small gap
-                                merged_exclusions[-1] = (merged_exclusions[-1][0], max(merged_exclusions[-1][1], excl_end))
-                            else:
-                                merged_exclusions.append((excl_start, excl_end))
-                        all_exclusions = merged_exclusions
-                    
-                    # Trim trailing commentary from passage boundary
-                    # If the last exclusion extends to end, it's non-verse tail text
-                    # that should be in the next paragraph, not an interjection
-                    end, all_exclusions = trim_trailing_exclusions(
-                        text, start, end, all_exclusions, verbose=verbose
-                    )
-                    
-                    if all_exclusions and verbose:
-                        num_inter = len([e for e in all_exclusions if e[1] - e[0] < 30])
-                        num_comm = len([e for e in all_exclusions if e[1] - e[0] >= 30])
-                        parts = []
-                        if num_inter:
-                            parts.append(f"{num_inter} interjection(s)")
-                        if num_comm:
-                            parts.append(f"{num_comm} commentary block(s)")
-                        print(f"      ⚠ Found {', '.join(parts)}")
-                    
-                    quote = QuoteBoundary(
-                        start_pos=start,
-                        end_pos=end,
-                        reference=ref,
-                        verse_text=verse_text,
-                        confidence=confidence,
-                        translation=detected_translation,
-                        has_interjection=bool(all_exclusions),
-                        interjection_positions=all_exclusions
-                    )
-                    
-                    # PHASE 4: Verify and potentially adjust boundaries
-                    quote = verify_quote_boundaries(quote, text, verbose=verbose)
-                    
-                    quotes.append(quote)
+                    quotes.append(_build_quote(
+                        text, ref, start, end, confidence, verse_text, detected_translation,
+                        verbose=verbose, index=transcript_index
+                    ))
                 else:
                     if verbose:
                         print(f"   {api_ref}: ✗ Could not locate in transcript")
@@ -4152,18 +5252,23 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
             if verbose:
                 print(f"   {chapter_ref}: Chapter-only reference, detecting quoted verses...")
             
-            # Fetch individual verses from the chapter (first 20 verses should cover most quotes)
+            # Fetch individual verses from the chapter (first 20 verses should cover most quotes).
+            # One whole-chapter request; verse-by-verse lookups only if that fails
+            chapter_verses = api_client.get_chapter_verses(ref.book, ref.chapter)
             individual_verses = {}
             for v in range(1, 21):  # Check verses 1-20
-                verse_result = api_client.get_verse(f"{ref.book} {ref.chapter}:{v}")
-                if verse_result and 'text' in verse_result:
-                    individual_verses[v] = verse_result['text']
+                if chapter_verses:
+                    verse_text = chapter_verses.get(v)
                 else:
+                    verse_result = api_client.get_verse(f"{ref.book} {ref.chapter}:{v}")
+                    verse_text = verse_result['text'] if verse_result and 'text' in verse_result else None
+                if verse_text is None:
                     break  # Stop if we hit a verse that doesn't exist
+                individual_verses[v] = verse_text
             
             if individual_verses:
                 first_match_verse, last_match_verse, subset_matches = detect_matching_verse_subset(
-                    individual_verses, text, ref.position
+                    individual_verses, text, ref.position, index=transcript_index
                 )
                 
                 if subset_matches and first_match_verse and last_match_verse:
@@ -4191,41 +5296,10 @@ def process_text(text: str, translation: Optional[str] = None, verbose: bool = T
                             detected_range = f"{first_match_verse}-{last_match_verse}" if last_match_verse != first_match_verse else str(first_match_verse)
                             print(f"   {chapter_ref}: Detected verses {detected_range}, found at {start}-{end} (conf: {confidence:.2f})")
                         
-                        # Detect interjections and commentary
-                        interjections = detect_interjections(text, start, end)
-                        commentary_blocks = detect_commentary_blocks(text, start, end, verse_text)
-                        all_exclusions = interjections + commentary_blocks
-                        all_exclusions.sort()
-                        
-                        if all_exclusions:
-                            merged_exclusions = [all_exclusions[0]]
-                            for excl_start, excl_end in all_exclusions[1:]:
-                                if excl_start <= merged_exclusions[-1][1] + 5:
-                                    merged_exclusions[-1] = (merged_exclusions[-1][0], max(merged_exclusions[-1][1], excl_end))
-                                else:
-                                    merged_exclusions.append((excl_start, excl_end))
-                            all_exclusions = merged_exclusions
-                        
-                        # Trim trailing commentary from passage boundary
-                        end, all_exclusions = trim_trailing_exclusions(
-                            text, start, end, all_exclusions, verbose=verbose
-                        )
-                        
-                        quote = QuoteBoundary(
-                            start_pos=start,
-                            end_pos=end,
-                            reference=ref,
-                            verse_text=verse_text,
-                            confidence=confidence,
-                            translation=api_client.translation,
-                            has_interjection=bool(all_exclusions),
-                            interjection_positions=all_exclusions
-                        )
-                        
-                        # PHASE 4: Verify and potentially adjust boundaries
-                        quote = verify_quote_boundaries(quote, text, verbose=verbose)
-                        
-                        quotes.append(quote)
+                        quotes.append(_build_quote(
+                            text, ref, start, end, confidence, verse_text, api_client.translation,
+                            verbose=verbose, index=transcript_index
+                        ))
                     else:
                         if verbose:
                             print(f"   {chapter_ref}: ✗ Could not determine quote boundaries")
@@ -368,12 +368,38 @@ def transcribe_audio(file_path: str) -> str:
 # Prayer detection patterns are now imported from ast_builder
 
 
+# Question-word interjection ("for what?") that leads straight into a quote
+INTERJECTION_QUESTION_RE = re.compile(r'\b(what|who|where|when|why|how)\?\s*$', re.IGNORECASE)
+
+
+def adjacent_similarities(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity between each sentence embedding and the next one.
+    
+    Computed as one row-wise dot product over the whole matrix rather than
+    a Python loop per sentence pair. A pair involving an all-zero embedding
+    has similarity 0 instead of NaN, which would otherwise spread through
+    the rolling average and block every break near it.
+    
+    Args:
+        embeddings: (N, D) sentence embedding matrix
+    
+    Returns:
+        Array of N - 1 similarities
+    """
+    norms = np.linalg.norm(embeddings, axis=1)
+    dots = np.einsum('ij,ij->i', embeddings[:-1], embeddings[1:])
+    denominators = norms[:-1] * norms[1:]
+    return np.divide(dots, denominators, out=np.zeros_like(dots), where=denominators > 0)
+
+
 def segment_into_paragraph_groups(
     sentences: List[SentenceInfo],
     quote_boundaries: Optional[List[QuoteBoundary]] = None,
     min_sentences_per_paragraph: int = 8,
     similarity_threshold: float = 0.55,
-    window_size: int = 3
+    window_size: int = 3,
+    precomputed_embeddings: Optional[np.ndarray] = None
 ) -> List[List[int]]:
     """
     Group sentences into paragraphs using semantic similarity analysis.
@@ -395,6 +421,8 @@ def segment_into_paragraph_groups(
         min_sentences_per_paragraph: Minimum sentences before allowing a break
         similarity_threshold: Cosine similarity threshold for topic change
         window_size: Rolling average window for smoothing similarity
+        precomputed_embeddings: Optional (len(sentences), 768) embedding matrix
+            from encode_texts(); skips the model pass when sweeping thresholds
     
     Returns:
         List of sentence index groups, e.g. [[0,1,2,3], [4,5,6,7], ...]
@@ -482,15 +510,13 @@ def segment_into_paragraph_groups(
     
     # Get embeddings for all sentences
     print(f"Analyzing {len(sentence_texts)} sentences...")
-    embeddings = encode_texts(sentence_texts, task="semantic_similarity")
+    if precomputed_embeddings is not None:
+        embeddings = precomputed_embeddings
+    else:
+        embeddings = encode_texts(sentence_texts, task="semantic_similarity")
     
     # Calculate cosine similarities between consecutive sentences
-    similarities = []
-    for i in range(len(embeddings) - 1):
-        cos_sim = np.dot(embeddings[i], embeddings[i + 1]) / (
-            np.linalg.norm(embeddings[i]) * np.linalg.norm(embeddings[i + 1])
-        )
-        similarities.append(cos_sim)
+    similarities = adjacent_similarities(embeddings)
     
     # Smooth similarities with rolling average
     smoothed_similarities = []
@@ -500,6 +526,25 @@ def segment_into_paragraph_groups(
         avg_sim = np.mean(similarities[start_idx:end_idx])
         smoothed_similarities.append(avg_sim)
     
+    # Sentences that can never end a paragraph. These rules don't depend on the
+    # similarity threshold, so they are resolved once before the grouping pass.
+    no_break_after = set()
+    
+    # Don't break inside prayers
+    for sent_idx in sentences_in_prayers:
+        if (sent_idx + 1) in sentences_in_prayers:
+            no_break_after.add(sent_idx)
+    
+    # Don't break inside quotes
+    for quote_start, quote_end in quote_ranges:
+        no_break_after.update(range(quote_start, quote_end))
+    
+    # Don't break between interjection and continuation
+    for sent_idx in sentences_in_quotes:
+        prev_idx = sent_idx - 1
+        if 0 <= prev_idx < len(sentences) - 1 and INTERJECTION_QUESTION_RE.search(sentence_texts[prev_idx].strip()):
+            no_break_after.add(prev_idx)
+    
     # Build paragraph groups
     groups: List[List[int]] = []
     current_group: List[int] = [0]
@@ -530,31 +575,8 @@ def segment_into_paragraph_groups(
         
         current_group.append(next_sentence_idx)
         
-        # Determine if we can break here
-        can_break = True
-        
-        # Don't break inside prayers
-        if sentences_in_prayers:
-            if next_sentence_idx in sentences_in_prayers:
-                if (next_sentence_idx + 1) < len(sentences) and (next_sentence_idx + 1) in sentences_in_prayers:
-                    can_break = False
-        
-        # Don't break inside quotes
-        if can_break and quote_ranges:
-            for quote_start, quote_end in quote_ranges:
-                if quote_start <= next_sentence_idx <= quote_end:
-                    if next_sentence_idx < quote_end:
-                        can_break = False
-                        break
-        
-        # Don't break between interjection and continuation
-        if can_break and (next_sentence_idx + 1) < len(sentences):
-            current_sent = sentence_texts[next_sentence_idx].strip()
-            if re.search(r'\b(what|who|where|when|why|how)\?\s*$', current_sent, re.IGNORECASE):
-                if (next_sentence_idx + 1) in sentences_in_quotes:
-                    can_break = False
-        
         # Break on significant topic change
+        can_break = next_sentence_idx not in no_break_after
         if len(current_group) >= min_sentences_per_paragraph and can_break:
             if similarity < similarity_threshold:
                 groups.append(current_group)
@@ -638,7 +660,8 @@ def chunk_text(text: str, max_words: int = 400, overlap_words: int = 50) -> List
 
 
 def get_semantic_themes(text: str, top_k: int = 15, min_similarity: float = 0.35,
-                        verbose: bool = True) -> List[tuple]:
+                        verbose: bool = True,
+                        precomputed_embeddings: Optional[np.ndarray] = None) -> List[tuple]:
     """
     Infer semantic themes from text by comparing against the theological concepts KB.
     
@@ -651,6 +674,8 @@ def get_semantic_themes(text: str, top_k: int = 15, min_similarity: float = 0.35
         top_k: Maximum number of themes to return
         min_similarity: Minimum cosine similarity to include a theme (default: 0.35)
         verbose: Whether to print progress messages
+        precomputed_embeddings: Optional chunk embeddings for chunk_text(text),
+            encoded with the "classification" task; skips the model pass
         
     Returns:
         List of (concept_name, similarity_score) tuples, sorted by score descending
@@ -670,9 +695,12 @@ def get_semantic_themes(text: str, top_k: int = 15, min_similarity: float = 0.35
         print(f"   Created {len(chunks)} text chunks")
     
     # Embed all chunks using EmbeddingGemma with "classification" task prefix
-    if verbose:
-        print("   Computing text embeddings...")
-    chunk_embeddings = encode_texts(chunks, task="classification")
+    if precomputed_embeddings is not None:
+        chunk_embeddings = precomputed_embeddings
+    else:
+        if verbose:
+            print("   Computing text embeddings...")
+        chunk_embeddings = encode_texts(chunks, task="classification")
     
     # Create a combined sermon embedding (average of chunks)
     sermon_embedding = np.mean(chunk_embeddings, axis=0)
@@ -732,7 +760,8 @@ def get_semantic_themes(text: str, top_k: int = 15, min_similarity: float = 0.35
 
 def extract_tags(text: str, quote_boundaries: Optional[List[QuoteBoundary]] = None,
                  max_tags: int = 10, verbose: bool = True,
-                 use_semantic_inference: bool = True, semantic_threshold: float = 0.40) -> List[str]:
+                 use_semantic_inference: bool = True, semantic_threshold: float = 0.40,
+                 precomputed_embeddings: Optional[np.ndarray] = None) -> List[str]:
     """
     Extract tags from a Christian sermon transcript using semantic theme inference.
     
@@ -750,6 +779,8 @@ def extract_tags(text: str, quote_boundaries: Optional[List[QuoteBoundary]] = No
         verbose: Whether to print progress messages
         use_semantic_inference: Use semantic theme inference (default: True)
         semantic_threshold: Minimum similarity for semantic themes (default: 0.40)
+        precomputed_embeddings: Optional chunk embeddings of the quote-stripped,
+            lowercased text (see get_semantic_themes)
     
     Returns:
         List of tag strings from semantic theme inference
@@ -778,7 +809,8 @@ def extract_tags(text: str, quote_boundaries: Optional[List[QuoteBoundary]] = No
                 clean_text, 
                 top_k=max_tags,
                 min_similarity=semantic_threshold,
-                verbose=verbose
+                verbose=verbose,
+                precomputed_embeddings=precomputed_embeddings
             )
             
             # Add semantic themes to final tags
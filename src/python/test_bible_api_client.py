@@ -0,0 +1,216 @@
+"""
+Tests for BibleAPIClient request handling and the verse cache, plus
+process_text() progress reporting around slow API calls.
+
+The Bolls.life API is replaced by a fake session, so these run offline.
+"""
+
+import sys
+import os
+import json
+import re
+import time
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bible_quote_processor
+from bible_quote_processor import BibleAPIClient, fetch_many_verse_ranges, clear_bible_verse_cache, process_text
+
+
+def make_response(status_code, data):
+    """Create a mock requests.Response returning the given JSON data."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = data
+    return response
+
+
+class APIClientTestCase(unittest.TestCase):
+    """Base class: a client with a temporary cache file and no rate limit delay."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = Path(self.tmp_dir.name) / "bible_verse_cache.sqlite3"
+        patcher = patch.object(bible_quote_processor, 'API_RATE_LIMIT_DELAY', 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def make_client(self, post_data=None, get_text='verse text'):
+        """Client whose get-verses POST replies with post_data and single-verse GETs with get_text."""
+        client = BibleAPIClient(cache_file=self.cache_file, translation='KJV')
+        client.session = MagicMock()
+        client.session.post.return_value = make_response(200, post_data)
+
+        def fake_get(url, timeout=None):
+            # .../get-verse/{translation}/{book_id}/{chapter}/{verse}/
+            translation = url.rstrip('/').split('/')[-4]
+            return make_response(200, {'verse': 16, 'text': f"{get_text} ({translation})"})
+
+        client.session.get.side_effect = fake_get
+        return client
+
+
+class TestGetVerseTranslations(APIClientTestCase):
+    """get_verse_translations() must answer every requested translation."""
+
+    TRANSLATIONS = ['KJV', 'NKJV', 'NIV']
+
+    def test_full_reply(self):
+        """All translations are answered by the single bulk request."""
+        client = self.make_client(post_data=[
+            [{'verse': 16, 'text': f'For God so loved ({t})'}] for t in self.TRANSLATIONS
+        ])
+        results = client.get_verse_translations('John 3:16', self.TRANSLATIONS)
+
+        self.assertEqual(set(results), set(self.TRANSLATIONS))
+        self.assertEqual(results['NIV']['text'], 'For God so loved (NIV)')
+        client.session.get.assert_not_called()
+
+    def test_short_reply_falls_back_per_translation(self):
+        """Translations missing from a truncated reply are fetched with get_verse."""
+        client = self.make_client(post_data=[[{'verse': 16, 'text': 'For God so loved (KJV)'}]])
+        results = client.get_verse_translations('John 3:16', self.TRANSLATIONS)
+
+        self.assertEqual(set(results), set(self.TRANSLATIONS))
+        self.assertEqual(results['KJV']['text'], 'For God so loved (KJV)')
+        self.assertEqual(results['NKJV']['text'], 'verse text (NKJV)')
+        self.assertEqual(results['NIV']['text'], 'verse text (NIV)')
+        self.assertEqual(client.session.get.call_count, 2)
+
+    def test_malformed_reply_falls_back_per_translation(self):
+        """A reply that is not a list of verse lists is not trusted."""
+        for post_data in ({'detail': 'error'}, [None, 'oops', [1, 2]]):
+            with self.subTest(post_data=post_data):
+                client = self.make_client(post_data=post_data)
+                results = client.get_verse_translations('John 3:16', self.TRANSLATIONS)
+
+                self.assertEqual(set(results), set(self.TRANSLATIONS))
+                for translation in self.TRANSLATIONS:
+                    self.assertEqual(results[translation]['text'], f'verse text ({translation})')
+
+
+class TestVerseRangeCache(APIClientTestCase):
+    """fetch_many_verse_ranges() caches ranges that came back with text, and only those."""
+
+    RANGE = ('Proverbs', 15, 6, 9)
+
+    def test_empty_reply_is_not_cached(self):
+        """An empty verse list is refetched next time, in this session and the next."""
+        client = self.make_client(post_data=[[]])
+        self.assertEqual(fetch_many_verse_ranges(client, [self.RANGE]), [{}])
+        self.assertEqual(client._verse_range_cache, {})
+
+        client.session.post.return_value = make_response(200, [[{'verse': 6, 'text': 'In the house'}]])
+        self.assertEqual(fetch_many_verse_ranges(client, [self.RANGE]), [{6: 'In the house'}])
+        self.assertEqual(client.session.post.call_count, 2)
+
+        reloaded = BibleAPIClient(cache_file=self.cache_file)
+        self.assertEqual(list(reloaded._verse_range_cache.values()), [{6: 'In the house'}])
+
+    def test_fetched_range_is_cached(self):
+        """A range with text is answered from the cache on the next call."""
+        client = self.make_client(post_data=[[{'verse': 6, 'text': 'In the house'}]])
+        fetch_many_verse_ranges(client, [self.RANGE])
+        self.assertEqual(fetch_many_verse_ranges(client, [self.RANGE]), [{6: 'In the house'}])
+        self.assertEqual(client.session.post.call_count, 1)
+
+
+class TestSQLiteCache(APIClientTestCase):
+    """The verse cache file persists fetched verses and ranges between sessions."""
+
+    VERSE = {'text': 'For God so loved the world', 'verse': 16, 'book': 'John',
+             'chapter': 3, 'translation': 'KJV'}
+
+    def test_imports_json_cache(self):
+        """A pre-SQLite JSON cache next to the cache file is carried over."""
+        json_file = self.cache_file.with_suffix('.json')
+        json_file.write_text(json.dumps({'John 3:16|KJV': self.VERSE}), encoding='utf-8')
+
+        client = BibleAPIClient(cache_file=self.cache_file)
+        self.assertEqual(client.cache, {'John 3:16|KJV': self.VERSE})
+        self.assertTrue(self.cache_file.exists())
+
+        # Later sessions read the SQLite file, even without the JSON one
+        json_file.unlink()
+        self.assertEqual(BibleAPIClient(cache_file=self.cache_file).cache, {'John 3:16|KJV': self.VERSE})
+
+    def test_verse_round_trip(self):
+        """A saved verse is loaded by the next client."""
+        BibleAPIClient(cache_file=self.cache_file)._save_cache('John 3:16', 'KJV', self.VERSE)
+        client = BibleAPIClient(cache_file=self.cache_file)
+        self.assertEqual(client.get_verse('John 3:16', translation='KJV'), self.VERSE)
+
+    def test_range_round_trip_keeps_int_verse_numbers(self):
+        """Range verse numbers come back as ints, not JSON string keys."""
+        key = ('KJV', 20, 15, 6, 9)
+        verses = {6: 'In the house of the righteous', 7: 'The lips of the wise'}
+        BibleAPIClient(cache_file=self.cache_file)._save_range_cache(key, verses)
+
+        loaded = BibleAPIClient(cache_file=self.cache_file)._load_range_cache()
+        self.assertEqual(loaded, {key: verses})
+        self.assertTrue(all(isinstance(num, int) for num in loaded[key]))
+
+    def test_clear_removes_sqlite_and_json_files(self):
+        """clear_bible_verse_cache() deletes both the SQLite and the legacy JSON file."""
+        BibleAPIClient(cache_file=self.cache_file)._save_cache('John 3:16', 'KJV', self.VERSE)
+        json_file = self.cache_file.with_suffix('.json')
+        json_file.write_text('{}', encoding='utf-8')
+
+        with patch.object(bible_quote_processor, 'CACHE_FILE', self.cache_file):
+            clear_bible_verse_cache()
+
+        self.assertFalse(self.cache_file.exists())
+        self.assertFalse(json_file.exists())
+
+
+class TestProgressReporting(APIClientTestCase):
+    """process_text() progress updates with a slow API."""
+
+    VERSES = {
+        (43, 3, 16): "For God so loved the world, that he gave his only begotten Son, "
+                     "that whosoever believeth in him should not perish, but have everlasting life.",
+        (45, 8, 28): "And we know that all things work together for good to them that love God, "
+                     "to them who are the called according to his purpose.",
+    }
+
+    def slow_request(self, method, url, **kwargs):
+        """Fake Bolls.life request taking 150 ms."""
+        time.sleep(0.15)
+        match = re.search(r'/get-verse/\w+/(\d+)/(\d+)/(\d+)/', url)
+        if match:
+            text = self.VERSES.get(tuple(int(g) for g in match.groups()))
+            return make_response(200, {'verse': int(match.group(3)), 'text': text}) if text else make_response(404, None)
+        if url.endswith('/get-verses/'):
+            return make_response(200, [
+                [{'verse': v, 'text': self.VERSES[(e['book'], e['chapter'], v)]}
+                 for v in e['verses'] if (e['book'], e['chapter'], v) in self.VERSES]
+                for e in kwargs['json']
+            ])
+        return make_response(404, None)
+
+    def test_phase_updates_are_never_dropped(self):
+        """Every phase update reaches the callback, as does the last per-quote update."""
+        text = ("Turn to John 3:16. " + self.VERSES[(43, 3, 16)] + " That is the gospel. "
+                "And Romans 8:28 says " + self.VERSES[(45, 8, 28)] + " Amen.")
+        updates = []
+        with patch('requests.Session.request', self.slow_request), \
+                patch.object(BibleAPIClient.__init__, '__defaults__', (self.cache_file, 'KJV')):
+            process_text(text, translation='KJV', verbose=False,
+                         progress_callback=lambda percent, message: updates.append((percent, message)))
+
+        messages = [message for _, message in updates]
+        for phase_message in ("Initializing Bible processor...", "Detecting Bible references...",
+                              "Fetching Bible verses from API...", "Finding quote boundaries...",
+                              "Bible processing complete"):
+            self.assertIn(phase_message, messages)
+        self.assertIn("Analyzing quote 2 of 2...", messages)
+        self.assertEqual([percent for percent, _ in updates], sorted(percent for percent, _ in updates))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,8 +16,10 @@ The fix involves:
 Run with: python test_interjection_boundaries.py
 """
 
+import re
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -27,7 +29,11 @@ from bible_quote_processor import (
     detect_commentary_blocks,
     trim_trailing_exclusions,
     get_words,
+    extend_quote_past_interjection,
+    process_text,
+    BibleAPIClient,
 )
+import bible_quote_processor
 from ast_builder import build_ast, _build_passage_node
 
 
@@ -429,6 +435,142 @@ def test_full_ast_build():
     return all_ok
 
 
+# Proverbs 15:30-33 (KJV); verse 33 ends on "honour", a spelling that
+# normalize_for_comparison() folds to "honor"
+PROVERBS_15 = {
+    30: "The light of the eyes rejoiceth the heart: and a good report maketh the bones fat.",
+    31: "The ear that heareth the reproof of life abideth among the wise.",
+    32: "He that refuseth instruction despiseth his own soul: but he that heareth reproof getteth understanding.",
+    33: "The fear of the LORD is the instruction of wisdom; and before honour is humility.",
+}
+
+# The speaker announces 30-33 but reads only 31-33, with an interjection in verse 33
+TRANSCRIPT_PARTIAL_READING = (
+    "Good morning. Let's turn to Proverbs 15:30-33. The Bible says "
+    + PROVERBS_15[31] + " " + PROVERBS_15[32] + " "
+    "The fear of the LORD is the instruction of wisdom; and before, what? honour is humility? "
+    "Amen. So what does that mean for us today? It means we listen."
+)
+
+# The speaker announces 32-33 but reads only 32, which ends on a plain "."
+TRANSCRIPT_PARTIAL_READING_PERIOD = (
+    "Good morning. Let's turn to Proverbs 15:32-33. The Bible says "
+    + PROVERBS_15[32] + " "
+    "Now think about that. Nobody likes to be corrected."
+)
+
+
+def fake_bolls_request(session, method, url, **kwargs):
+    """Stand-in for requests.Session.request answering from PROVERBS_15."""
+    response = MagicMock()
+    response.status_code = 404
+    match = re.search(r'/get-verse/\w+/20/15/(\d+)/', url)
+    if match and int(match.group(1)) in PROVERBS_15:
+        verse = int(match.group(1))
+        response.status_code = 200
+        response.json.return_value = {'verse': verse, 'text': PROVERBS_15[verse]}
+    elif url.endswith('/get-verses/'):
+        response.status_code = 200
+        response.json.return_value = [
+            [{'verse': v, 'text': PROVERBS_15[v]} for v in entry['verses'] if v in PROVERBS_15]
+            if entry['book'] == 20 and entry['chapter'] == 15 else []
+            for entry in kwargs['json']
+        ]
+    return response
+
+
+def process_text_offline(text):
+    """Run process_text() in KJV against fake_bolls_request, without the verse cache."""
+    with patch('requests.Session.request', fake_bolls_request), \
+            patch.object(bible_quote_processor, 'API_RATE_LIMIT_DELAY', 0), \
+            patch.object(BibleAPIClient, '_load_cache', lambda self: {}), \
+            patch.object(BibleAPIClient, '_load_range_cache', lambda self: {}), \
+            patch.object(BibleAPIClient, '_save_cache', lambda self, *args: None), \
+            patch.object(BibleAPIClient, '_save_range_cache', lambda self, *args: None):
+        _, quotes = process_text(text, translation="KJV", verbose=False)
+    return quotes
+
+
+# ============================================================================
+# TEST: verse continuation after an interjection, in KJV spelling
+# ============================================================================
+
+def test_continuation_with_kjv_spelling():
+    """
+    The words after an interjection are matched in normalized form, so a
+    KJV spelling ("honour") continues the verse just like "honor" would.
+    """
+    print("\n" + "=" * 70)
+    print("TEST: Continuation after interjection with KJV spelling")
+    print("=" * 70)
+
+    text = "The fear of the LORD is the instruction of wisdom; and before, what? honour is humility. So listen."
+    current_end = text.index(", what?")
+    extended_end = extend_quote_past_interjection(text, current_end, PROVERBS_15[33])
+
+    print(f"  Extended to: '{text[:extended_end][-30:]}'")
+    assert text[:extended_end].endswith("honour is humility."), "Continuation 'honour is humility' not included"
+
+    print("  PASS: Quote extends over 'honour is humility.'")
+    return True
+
+
+# ============================================================================
+# TEST: partial reading wins over a full-range match that only adds punctuation
+# ============================================================================
+
+def test_partial_reading_not_outweighed_by_punctuation():
+    """
+    Proverbs 15:30-33 announced, 31-33 read. The full-range match ends one
+    character later only because the interjection extension takes the "?"
+    after "humility"; that must not beat the partial-reading subset.
+    """
+    print("\n" + "=" * 70)
+    print("TEST: Partial reading vs. trailing punctuation")
+    print("=" * 70)
+
+    text = TRANSCRIPT_PARTIAL_READING
+    quotes = process_text_offline(text)
+
+    assert len(quotes) == 1, f"Expected 1 quote, got {len(quotes)}"
+    quote = quotes[0]
+    quoted = text[quote.start_pos:quote.end_pos]
+    print(f"  Quote [{quote.start_pos}:{quote.end_pos}]: '{quoted[:40]}...{quoted[-30:]}'")
+
+    assert quoted.startswith("The ear that heareth"), "Quote should start at verse 31, not mid-verse or at the intro"
+    assert quoted.rstrip('?').endswith("honour is humility"), "Quote should end with verse 33"
+    assert PROVERBS_15[30] not in quote.verse_text, "Verse 30 was never read"
+
+    print("  PASS: Partial reading of verses 31-33 detected")
+    return True
+
+
+def test_partial_reading_keeps_final_period():
+    """
+    Proverbs 15:32-33 announced, only 32 read. The full-range match and the
+    partial-reading subset end on the same word; the quote keeps the "."
+    the full-range match already included.
+    """
+    print("\n" + "=" * 70)
+    print("TEST: Partial reading keeps the final period")
+    print("=" * 70)
+
+    text = TRANSCRIPT_PARTIAL_READING_PERIOD
+    quotes = process_text_offline(text)
+
+    assert len(quotes) == 1, f"Expected 1 quote, got {len(quotes)}"
+    quote = quotes[0]
+    quoted = text[quote.start_pos:quote.end_pos]
+    print(f"  Quote [{quote.start_pos}:{quote.end_pos}]: '{quoted[:40]}...{quoted[-30:]}'")
+
+    assert quoted.startswith("He that refuseth"), "Quote should start at verse 32"
+    assert quoted.endswith("getteth understanding."), "Quote should end with verse 32, period included"
+    assert PROVERBS_15[33] not in quote.verse_text, "Verse 33 was never read"
+
+    print("  PASS: Partial reading of verse 32 ends on its period")
+    return True
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
@@ -443,6 +585,9 @@ if __name__ == '__main__':
     results.append(("Trailing commentary trim", test_trailing_commentary_trim()))
     results.append(("Passage children structure", test_passage_children_with_interjection()))
     results.append(("Full AST build", test_full_ast_build()))
+    results.append(("Continuation with KJV spelling", test_continuation_with_kjv_spelling()))
+    results.append(("Partial reading vs. punctuation", test_partial_reading_not_outweighed_by_punctuation()))
+    results.append(("Partial reading keeps final period", test_partial_reading_keeps_final_period()))
 
     print("\n" + "=" * 70)
     print("RESULTS SUMMARY")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Tests for sentence grouping in segment_into_paragraph_groups().
+
+Uses fixed embedding matrices passed as precomputed_embeddings, so the
+embedding model is never loaded. Checks that:
+1. adjacent_similarities() matches the per-pair cosine loop it replaced
+2. An all-zero embedding gives similarity 0, not NaN
+3. Prayer, quote and interjection rules block the same breaks as the
+   per-transition checks they replaced
+"""
+
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ast_builder import tokenize_sentences
+from main import adjacent_similarities, segment_into_paragraph_groups
+
+
+# 27 sentences: an interjection ending in "for what?" (7) that leads into a
+# Bible quote (8-10), and a prayer from "Let us pray." (18) to "amen." (21)
+RAW_TEXT = (
+    "Good morning church. It is good to be together today. We have been walking "
+    "through Romans this fall. Last week we looked at chapter eleven. Today we turn "
+    "the page. Paul has spent eleven chapters on doctrine. Now he turns to practice. "
+    "And he asks us for what? I beseech you therefore, brethren, by the mercies of "
+    "God. That ye present your bodies a living sacrifice. Holy, acceptable unto God, "
+    "which is your reasonable service. That is the whole Christian life in one verse. "
+    "It is not a weekend hobby. It is every hour of every day. Think about your week. "
+    "Think about your work. Think about your family. Where does the sacrifice show up? "
+    "Let us pray. Father, we thank you for your mercies. Help us to give you our whole "
+    "lives. In Jesus name, amen. Now let's look at verse two. Be not conformed to this "
+    "world. The world wants to squeeze you into its mold. But God wants to transform "
+    "you from the inside. That is the good news this morning."
+)
+
+
+def loop_similarities(embeddings):
+    """The per-pair cosine loop adjacent_similarities() replaced."""
+    similarities = []
+    for i in range(len(embeddings) - 1):
+        cos_sim = np.dot(embeddings[i], embeddings[i + 1]) / (
+            np.linalg.norm(embeddings[i]) * np.linalg.norm(embeddings[i + 1])
+        )
+        similarities.append(cos_sim)
+    return np.array(similarities)
+
+
+def test_adjacent_similarities_match_loop():
+    """Vectorized similarities equal the per-pair loop on a fixed matrix."""
+    print("=" * 70)
+    print("ADJACENT SIMILARITIES TEST")
+    print("=" * 70)
+
+    embeddings = np.random.RandomState(7).rand(50, 16).astype(np.float32)
+    expected = loop_similarities(embeddings)
+    actual = adjacent_similarities(embeddings)
+
+    max_diff = float(np.max(np.abs(actual - expected)))
+    print(f"  {len(actual)} similarities, max difference from loop: {max_diff:.2e}")
+    assert actual.shape == (49,)
+    assert np.allclose(actual, expected, atol=1e-6)
+    print("  PASS")
+
+
+def test_zero_norm_row():
+    """Pairs with an all-zero embedding get 0 and leave the other pairs alone."""
+    print("=" * 70)
+    print("ZERO-NORM EMBEDDING TEST")
+    print("=" * 70)
+
+    embeddings = np.random.RandomState(7).rand(6, 16).astype(np.float32)
+    embeddings[2] = 0.0
+    similarities = adjacent_similarities(embeddings)
+    expected = loop_similarities(embeddings)
+
+    print(f"  Similarities: {np.round(similarities, 3).tolist()}")
+    assert not np.isnan(similarities).any()
+    assert similarities[1] == 0.0 and similarities[2] == 0.0
+    assert np.allclose(similarities[[0, 3, 4]], expected[[0, 3, 4]], atol=1e-6)
+    print("  PASS")
+
+
+def test_break_rules():
+    """
+    With one-hot embeddings every transition is a topic change, so the groups
+    show exactly where the prayer, quote and interjection rules block a break.
+    Expected groups are those of the per-transition implementation.
+    """
+    print("=" * 70)
+    print("PARAGRAPH BREAK RULES TEST")
+    print("=" * 70)
+
+    sentences = tokenize_sentences(RAW_TEXT)
+    assert len(sentences) == 27
+    embeddings = np.eye(len(sentences), dtype=np.float32)
+
+    quote_start = RAW_TEXT.index("I beseech you")
+    quote_end = RAW_TEXT.index("reasonable service.") + len("reasonable service.")
+    quote = types.SimpleNamespace(start_pos=quote_start, end_pos=quote_end)
+
+    cases = [
+        # No quotes: only the prayer (18-21) is held together
+        (None, [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9], [10, 11], [12, 13], [14, 15],
+                [16, 17], [18, 19, 20, 21], [22, 23], [24, 25], [26]]),
+        # Quote 8-10 is held together, and so is the "for what?" lead-in (7)
+        ([quote], [[0, 1], [2, 3], [4, 5], [6, 7, 8, 9, 10], [11, 12], [13, 14], [15, 16],
+                   [17], [18, 19, 20, 21], [22, 23], [24, 25], [26]]),
+    ]
+    for quote_boundaries, expected in cases:
+        groups = segment_into_paragraph_groups(
+            sentences,
+            quote_boundaries=quote_boundaries,
+            min_sentences_per_paragraph=2,
+            similarity_threshold=0.5,
+            precomputed_embeddings=embeddings,
+        )
+        print(f"  Groups: {groups}")
+        assert groups == expected, f"Expected {expected}"
+    print("  PASS")
+
+
+if __name__ == "__main__":
+    test_adjacent_similarities_match_loop()
+    test_zero_norm_row()
+    test_break_rules()
+    print()
+    print("All paragraph segmentation tests passed.")
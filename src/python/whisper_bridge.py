@@ -653,10 +653,6 @@ def process_sermon(
     Returns:
         Structured document data with optional documentState
     """
-    # Clear Bible verse cache at start of each transcription to prevent unbounded growth
-    from bible_quote_processor import clear_bible_verse_cache
-    clear_bible_verse_cache()
-    
     result = {
         'title': None,
         'biblePassage': None,